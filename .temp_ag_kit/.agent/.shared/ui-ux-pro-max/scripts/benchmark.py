@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Benchmark - search quality and latency for the BM25 engine
+Usage: python benchmark.py [-k 10] [--repeat 20] [--backend python|numpy] [--output results.json]
+       python benchmark.py --compare benchmark-results/<previous>.json
+       python benchmark.py --startup [--budget 60]
+
+Runs the labeled queries in data/benchmark-queries.csv (Domain, Query, Relevant)
+and reports per domain:
+  - nDCG@k and MRR (binary relevance against the Relevant names)
+  - p50 / p99 query latency (warm index, result cache bypassed)
+  - index build time (CSV load + analysis + BM25 fit, cold)
+  - detect_domain accuracy for the non-stack queries
+
+Results are saved as JSON (default: benchmark-results/<commit>-<timestamp>.json)
+so runs can be compared across commits with --compare. --backend picks the BM25
+implementation (core.BM25_BACKENDS), so backends can be compared the same way.
+
+--startup is a regression check for CLI start time instead: it profiles
+`import search` with python -X importtime, fails (exit 1) when the median import
+time exceeds the budget or when a module that plain searches must not load
+(numpy, design_system, ...) gets imported, and lists the slowest imports.
+"""
+
+import argparse
+import csv
+import json
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime
+from math import log2
+from pathlib import Path
+
+import core
+from core import CSV_CONFIG, STACK_CONFIG, _STACK_COLS, BM25_BACKENDS, DATA_DIR, detect_domain, search, search_stack
+
+
+# ============ CONFIGURATION ============
+QUERIES_FILE = DATA_DIR / "benchmark-queries.csv"
+RESULTS_DIR = Path("benchmark-results")
+
+# Startup budget for `import search` (what a plain search.py query loads)
+STARTUP_BUDGET_MS = 60
+STARTUP_FORBIDDEN = ["numpy", "design_system", "templates", "concurrent.futures", "socketserver"]
+
+# Column that names a row, used to match results against the Relevant labels
+ID_COLS = {
+    "style": "Style Category",
+    "prompt": "Style Category",
+    "color": "Product Type",
+    "chart": "Data Type",
+    "landing": "Pattern Name",
+    "product": "Product Type",
+    "ux": "Issue",
+    "typography": "Font Pairing Name",
+    "icons": "Icon Name",
+    "react": "Issue",
+    "web": "Issue",
+    "stack": "Guideline"
+}
+
+
+# ============ METRICS ============
+def ndcg(ranked: list, relevant: set, k: int) -> float:
+    """Binary-relevance nDCG@k."""
+    dcg = sum(1 / log2(i + 2) for i, name in enumerate(ranked[:k]) if name in relevant)
+    ideal = sum(1 / log2(i + 2) for i in range(min(len(relevant), k)))
+    return dcg / ideal if ideal else 0.0
+
+
+def reciprocal_rank(ranked: list, relevant: set) -> float:
+    for i, name in enumerate(ranked):
+        if name in relevant:
+            return 1 / (i + 1)
+    return 0.0
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+def _mean(values: list) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+# ============ BENCHMARK ============
+def load_queries(path: Path = QUERIES_FILE) -> list:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [
+            {"domain": row["Domain"], "query": row["Query"],
+             "relevant": {r.strip() for r in row["Relevant"].split(";") if r.strip()}}
+            for row in csv.DictReader(f)
+        ]
+
+
+def _run(case: dict, k: int, backend: str = "python") -> dict:
+    if case["domain"].startswith("stack:"):
+        return search_stack(case["query"], case["domain"][len("stack:"):], k, backend)
+    return search(case["query"], case["domain"], k, backend)
+
+
+def measure_build_times(backend: str = "python") -> dict:
+    """Cold index build time in ms per domain/stack CSV."""
+    times = {}
+    sources = [(d, c["file"], c["search_cols"]) for d, c in CSV_CONFIG.items()]
+    sources += [(f"stack:{s}", c["file"], _STACK_COLS["search_cols"]) for s, c in STACK_CONFIG.items()]
+    for name, file, search_cols in sources:
+        filepath = DATA_DIR / file
+        if not filepath.exists():
+            continue
+        core.clear_cache()
+        start = time.perf_counter()
+        core._get_index(filepath, search_cols, backend=backend)
+        times[name] = (time.perf_counter() - start) * 1000
+    core.clear_cache()
+    return times
+
+
+def run_benchmark(cases: list, k: int = 10, repeat: int = 20, backend: str = "python") -> dict:
+    build_ms = measure_build_times(backend)
+    per_query = []
+
+    for case in cases:
+        domain = case["domain"]
+        id_col = ID_COLS["stack" if domain.startswith("stack:") else domain]
+        ranked = [row.get(id_col, "") for row in _run(case, k, backend).get("results", [])]
+
+        latencies = []
+        for _ in range(repeat):
+            core._RESULT_CACHE.clear()  # time scoring, not memoization
+            start = time.perf_counter()
+            _run(case, k, backend)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        entry = {
+            "domain": domain,
+            "query": case["query"],
+            "ndcg": ndcg(ranked, case["relevant"], k),
+            "rr": reciprocal_rank(ranked, case["relevant"]),
+            "latency_ms": latencies,
+            "ranked": ranked
+        }
+        if not domain.startswith("stack:"):
+            entry["detected_domain"] = detect_domain(case["query"])
+        per_query.append(entry)
+
+    domains = {}
+    for domain in dict.fromkeys(q["domain"] for q in per_query):
+        rows = [q for q in per_query if q["domain"] == domain]
+        latencies = [ms for q in rows for ms in q["latency_ms"]]
+        domains[domain] = {
+            "queries": len(rows),
+            "ndcg": _mean([q["ndcg"] for q in rows]),
+            "mrr": _mean([q["rr"] for q in rows]),
+            "p50_ms": percentile(latencies, 50),
+            "p99_ms": percentile(latencies, 99),
+            "build_ms": build_ms.get(domain, 0.0)
+        }
+
+    all_latencies = [ms for q in per_query for ms in q["latency_ms"]]
+    detectable = [q for q in per_query if "detected_domain" in q]
+    for q in per_query:
+        q["latency_ms"] = round(percentile(q["latency_ms"], 50), 4)
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "params": {"k": k, "repeat": repeat, "queries": len(per_query), "backend": backend},
+        "summary": {
+            "ndcg": _mean([q["ndcg"] for q in per_query]),
+            "mrr": _mean([q["rr"] for q in per_query]),
+            "domain_accuracy": _mean([1.0 if q["detected_domain"] == q["domain"] else 0.0 for q in detectable]),
+            "p50_ms": percentile(all_latencies, 50),
+            "p99_ms": percentile(all_latencies, 99),
+            "build_ms": sum(build_ms.values())
+        },
+        "domains": domains,
+        "queries": per_query
+    }
+
+
+def _git_commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=Path(__file__).parent, timeout=10)
+        return out.stdout.strip() or "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+
+# ============ STARTUP ============
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def parse_importtime(stderr: str) -> list:
+    """Parse -X importtime output into [(module, self_us, cumulative_us, depth)]."""
+    entries = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+
+def measure_startup(module: str = "search", runs: int = 5) -> dict:
+    """Median cumulative import time of `module` in fresh interpreters, plus what it imported."""
+    cmd = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    subprocess.run(cmd, capture_output=True, cwd=Path(__file__).parent, timeout=60)  # warm OS and bytecode caches
+    totals, entries = [], []
+    for _ in range(runs):
+        out = subprocess.run(cmd, capture_output=True, text=True, cwd=Path(__file__).parent, timeout=60)
+        if out.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{out.stderr.strip()}")
+        entries = parse_importtime(out.stderr)
+        totals.append(next((cum for name, _, cum, depth in entries if name == module and depth == 0), 0) / 1000)
+
+    imported = {name for name, _, _, _ in entries}
+    return {
+        "module": module,
+        "median_ms": percentile(totals, 50),
+        "runs_ms": totals,
+        "forbidden": [name for name in STARTUP_FORBIDDEN if name in imported],
+        "slowest": sorted(((name, cum / 1000) for name, _, cum, _ in entries if name != module),
+                          key=lambda item: item[1], reverse=True)[:8]
+    }
+
+
+def format_startup(result: dict, budget_ms: float) -> str:
+    lines = [f"## Startup: import {result['module']}", "",
+             f"  median {result['median_ms']:.1f} ms (budget {budget_ms:.0f} ms, runs: "
+             f"{', '.join(f'{ms:.1f}' for ms in result['runs_ms'])})"]
+    if result["forbidden"]:
+        lines.append(f"  ❌ imports modules that must stay lazy: {', '.join(result['forbidden'])}")
+    lines += ["", "Slowest imports (cumulative ms):"]
+    lines += [f"  {name:<32}{ms:>8.1f}" for name, ms in result["slowest"]]
+    return "\n".join(lines)
+
+
+# ============ OUTPUT ============
+SUMMARY_KEYS = ["ndcg", "mrr", "domain_accuracy", "p50_ms", "p99_ms", "build_ms"]
+
+
+def format_report(result: dict, baseline: dict = None) -> str:
+    params = result["params"]
+    lines = [f"## UI Pro Max Search Benchmark ({result['commit']}, {params['queries']} queries, k={params['k']}, "
+             f"{params.get('backend', 'python')} backend)", ""]
+
+    lines.append(f"{'Domain':<22}{'nDCG':>8}{'MRR':>8}{'p50 ms':>10}{'p99 ms':>10}{'build ms':>10}")
+    for domain, stats in result["domains"].items():
+        lines.append(f"{domain:<22}{stats['ndcg']:>8.3f}{stats['mrr']:>8.3f}{stats['p50_ms']:>10.3f}"
+                     f"{stats['p99_ms']:>10.3f}{stats['build_ms']:>10.2f}")
+    lines.append("")
+
+    lines.append("Summary:")
+    for key in SUMMARY_KEYS:
+        value = result["summary"][key]
+        line = f"  {key:<16}{value:>10.4f}"
+        if baseline and key in baseline.get("summary", {}):
+            old = baseline["summary"][key]
+            line += f"   (was {old:.4f}, {value - old:+.4f} vs {baseline.get('commit', '?')})"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max search benchmark")
+    parser.add_argument("-k", type=int, default=10, help="Cutoff for nDCG and results per query (default: 10)")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per query (default: 20)")
+    parser.add_argument("--backend", choices=list(BM25_BACKENDS), default="python", help="BM25 implementation to benchmark (default: python)")
+    parser.add_argument("--queries", type=str, default=str(QUERIES_FILE), help="Labeled query CSV")
+    parser.add_argument("--output", "-o", type=str, default=None, help="JSON results path (default: benchmark-results/<commit>-<timestamp>.json)")
+    parser.add_argument("--compare", type=str, default=None, help="Previous JSON results to diff the summary against")
+    parser.add_argument("--startup", action="store_true", help="Check search.py import time against --budget instead")
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_MS, help=f"Startup budget in ms (default: {STARTUP_BUDGET_MS})")
+    args = parser.parse_args()
+
+    if args.startup:
+        startup = measure_startup()
+        print(format_startup(startup, args.budget))
+        ok = startup["median_ms"] <= args.budget and not startup["forbidden"]
+        print(f"\n{'✅ within budget' if ok else '❌ startup budget exceeded'}")
+        raise SystemExit(0 if ok else 1)
+
+    result = run_benchmark(load_queries(Path(args.queries)), args.k, args.repeat, args.backend)
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{result['commit']}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    print(format_report(result, baseline))
+    print(f"\nSaved: {output}")
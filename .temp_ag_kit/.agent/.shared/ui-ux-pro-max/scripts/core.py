@@ -6,13 +6,31 @@ UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 
 import csv
 import re
+import sys
+import threading
+import unicodedata
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
+from collections.abc import Mapping
+
+# Optional and slow to import, so only loaded when a NumpyBM25 is created
+np = None
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
 MAX_RESULTS = 3
+INDEX_CACHE_SIZE = 64     # fitted indexes: one per domain/stack CSV and BM25 backend
+TABLE_CACHE_SIZE = 32     # loaded CSV tables: one per domain/stack CSV
+RESULT_CACHE_SIZE = 256   # memoized (query, file, max_results) lookups
+BATCH_CHUNK = 64          # batch requests read and scored together (one score_batch call per index)
+TOKEN_CACHE_SIZE = 4096   # analyzed token streams, one per distinct document
+
+# Typo tolerance: unknown query words are replaced by their nearest vocabulary terms
+FUZZY_MIN_LENGTH = 5      # shorter words are never corrected
+FUZZY_LONG_WORD = 8       # words this long may be up to 2 edits away, others 1
+FUZZY_MAX_EXPANSIONS = 2  # nearest terms kept per misspelled word
+FUZZY_WEIGHT = 0.5        # score multiplier for terms that came from a correction
 
 CSV_CONFIG = {
     "style": {
@@ -96,14 +114,153 @@ _STACK_COLS = {
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
 
+# ============ TEXT ANALYSIS ============
+_WORD_RE = re.compile(r'[^\w\s]')
+
+
+def fold_unicode(text):
+    """Strip accents so "animação" and "animacao" match"""
+    return "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+
+
+def light_stem(word):
+    """Conservative plural stripping for English and (folded) Portuguese"""
+    if len(word) <= 4:
+        return word
+    if word.endswith("oes"):                    # animacoes -> animacao
+        return word[:-3] + "ao"
+    if word.endswith(("ais", "eis")):           # visuais -> visual
+        return word[:-2] + "l"
+    if word.endswith(("ss", "us", "is")):       # glass, status, analysis
+        return word
+    if word.endswith("ies"):                    # categories -> category
+        return word[:-3] + "y"
+    if word.endswith("es") and word[:-2].endswith(("s", "x", "z", "ch", "sh")):
+        return word[:-2]                        # boxes -> box
+    if word.endswith("s"):
+        return word[:-1]
+    return word
+
+
+class Analyzer:
+    """
+    Text -> token pipeline used by BM25.
+
+    Stages: lowercase, optional Unicode folding, punctuation removal, short-word
+    filter, optional light stemming and optional adjacent-word bigrams
+    ("dark mode" also yields "dark_mode"). Document token streams are cached
+    by analyzer configuration and text, so refits and the unified index reuse them.
+
+    Stemming and bigrams are opt-in: on data/benchmark-queries.csv (k=10) they
+    lower nDCG and MRR, while folding leaves both unchanged (benchmark.py).
+    """
+
+    def __init__(self, fold=True, stem=False, bigrams=False, min_length=3):
+        self.fold = fold
+        self.stem = stem
+        self.bigrams = bigrams
+        self.min_length = min_length
+        self.key = (fold, stem, bigrams, min_length)
+
+    def __call__(self, text):
+        text = str(text).lower()
+        if self.fold:
+            text = fold_unicode(text)
+        words = [w for w in _WORD_RE.sub(' ', text).split() if len(w) >= self.min_length]
+        if self.stem:
+            words = [light_stem(w) for w in words]
+        if self.bigrams:
+            words += [f"{a}_{b}" for a, b in zip(words, words[1:])]
+        return words
+
+    def document_tokens(self, text):
+        """Analyze a corpus document, reusing the cached token stream when available"""
+        key = (self.key, text)
+        tokens = _TOKEN_CACHE.get(key)
+        if tokens is None:
+            tokens = self(text)
+            _TOKEN_CACHE.put(key, tokens)
+        return tokens
+
+
+# Original tokenizer: lowercase, strip punctuation, drop words of <= 2 chars
+SIMPLE_ANALYZER = Analyzer(fold=False)
+# The original tokenizer plus accent folding ("café" matches "cafe")
+DEFAULT_ANALYZER = Analyzer()
+
+
+# ============ FUZZY MATCHING ============
+def _deletes(word, distance):
+    """word plus every string reachable from it by deleting up to `distance` characters"""
+    variants = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        variants |= frontier
+    return variants
+
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance (Damerau-Levenshtein with adjacent swaps), capped at limit + 1"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous, current = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous, current = previous, current, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+    return current[-1]
+
+
+class FuzzyVocabulary:
+    """
+    Symmetric-delete index over a vocabulary for typo-tolerant lookups.
+
+    Every term is stored under all of its deletion variants, so candidates for
+    a misspelled word are found by looking up the word's own deletion variants
+    instead of comparing it against every term. Candidates are then verified
+    with edit_distance.
+    """
+
+    def __init__(self, doc_freqs, max_distance=2):
+        self.doc_freqs = doc_freqs
+        self.max_distance = max_distance
+        self.variants = defaultdict(list)
+        for term in doc_freqs:
+            if "_" not in term:  # bigrams are never fuzzed; query_terms drops unknown ones
+                for variant in _deletes(term, max_distance):
+                    self.variants[variant].append(term)
+
+    def lookup(self, word, max_distance=None, limit=FUZZY_MAX_EXPANSIONS):
+        """Nearest terms as [(term, distance)]: closest first, then most frequent"""
+        max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        candidates = {term for variant in _deletes(word, max_distance) for term in self.variants.get(variant, ())}
+        matches = [(term, edit_distance(word, term, max_distance)) for term in candidates]
+        matches = [(term, d) for term, d in matches if d <= max_distance]
+        if not matches:
+            return []
+        best = min(d for _, d in matches)
+        nearest = sorted((m for m in matches if m[1] == best), key=lambda m: (-self.doc_freqs[m[0]], m[0]))
+        return nearest[:limit]
+
+
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
     """BM25 ranking algorithm for text search"""
 
-    def __init__(self, k1=1.5, b=0.75):
+    def __init__(self, k1=1.5, b=0.75, analyzer=None, fuzzy=True):
         self.k1 = k1
         self.b = b
+        self.analyzer = analyzer or DEFAULT_ANALYZER
+        self.fuzzy = fuzzy
+        self._fuzzy_vocabulary = None
         self.corpus = []
+        self.term_freqs = []
         self.doc_lengths = []
         self.avgdl = 0
         self.idf = {}
@@ -111,13 +268,41 @@ class BM25:
         self.N = 0
 
     def tokenize(self, text):
-        """Lowercase, split, remove punctuation, filter short words"""
-        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-        return [w for w in text.split() if len(w) > 2]
+        """Run text through the configured analyzer"""
+        return self.analyzer(text)
+
+    def fuzzy_vocabulary(self):
+        """Symmetric-delete index over the fitted vocabulary, built on first use"""
+        if self._fuzzy_vocabulary is None:
+            self._fuzzy_vocabulary = FuzzyVocabulary(self.doc_freqs)
+        return self._fuzzy_vocabulary
+
+    def query_terms(self, query):
+        """
+        Analyze a query into (token, weight) pairs.
+
+        Known tokens get weight 1. With fuzzy matching on, unknown words of at
+        least FUZZY_MIN_LENGTH characters are replaced by their nearest
+        vocabulary terms with weight FUZZY_WEIGHT ("glassmorphsm" ->
+        "glassmorphism"), and unknown bigrams are dropped.
+        """
+        tokens = self.tokenize(query)
+        if not self.fuzzy or all(token in self.idf for token in tokens):
+            return [(token, 1.0) for token in tokens]
+
+        terms = []
+        for token in tokens:
+            if token in self.idf:
+                terms.append((token, 1.0))
+            elif "_" not in token and len(token) >= FUZZY_MIN_LENGTH:
+                distance = 2 if len(token) >= FUZZY_LONG_WORD else 1
+                terms += [(term, FUZZY_WEIGHT) for term, _ in self.fuzzy_vocabulary().lookup(token, distance)]
+        return terms
 
     def fit(self, documents):
         """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
+        self._fuzzy_vocabulary = None
+        self.corpus = [self.analyzer.document_tokens(doc) for doc in documents]
         self.N = len(self.corpus)
         if self.N == 0:
             return
@@ -125,70 +310,330 @@ class BM25:
         self.avgdl = sum(self.doc_lengths) / self.N
 
         for doc in self.corpus:
-            seen = set()
+            term_freqs = defaultdict(int)
             for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
+                term_freqs[word] += 1
+            self.term_freqs.append(term_freqs)
+            for word in term_freqs:
+                self.doc_freqs[word] += 1
 
         for word, freq in self.doc_freqs.items():
             self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
 
     def score(self, query):
         """Score all documents against query"""
-        query_tokens = self.tokenize(query)
+        query_terms = self.query_terms(query)
         scores = []
 
-        for idx, doc in enumerate(self.corpus):
+        for idx, term_freqs in enumerate(self.term_freqs):
             score = 0
             doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
 
-            for token in query_tokens:
+            for token, weight in query_terms:
                 if token in self.idf:
-                    tf = term_freqs[token]
+                    tf = term_freqs.get(token, 0)
                     idf = self.idf[token]
                     numerator = tf * (self.k1 + 1)
                     denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+                    score += weight * idf * numerator / denominator
 
             scores.append((idx, score))
 
         return sorted(scores, key=lambda x: x[1], reverse=True)
 
+    def score_batch(self, queries, top_k=None):
+        """Score many queries, returning the top_k (idx, score) pairs per query"""
+        return [self.score(query)[:top_k] for query in queries]
+
+
+def _import_numpy():
+    """Import numpy into the module namespace on first use"""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumpyBM25 requires numpy (pip install numpy)") from None
+        np = numpy
+
+
+class NumpyBM25(BM25):
+    """BM25 backed by a sparse CSR term-document matrix, scored with NumPy.
+
+    Rows are vocabulary terms, columns are documents and the stored values are
+    the precomputed BM25 term weights, so scoring a query is a handful of
+    vectorized row additions instead of a Python loop over every document.
+    Rankings are identical to BM25: weights use the same expression and are
+    accumulated in query-token order.
+    """
+
+    def __init__(self, k1=1.5, b=0.75, analyzer=None, fuzzy=True):
+        _import_numpy()
+        super().__init__(k1, b, analyzer, fuzzy)
+        self.vocab = {}
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int64)
+        self.data = np.zeros(0, dtype=np.float64)
+
+    def fit(self, documents):
+        """Build BM25 statistics, then the CSR term-document weight matrix"""
+        super().fit(documents)
+        if self.N == 0:
+            return
+
+        self.vocab = {word: i for i, word in enumerate(self.idf)}
+        postings = [[] for _ in self.vocab]
+        for idx, term_freqs in enumerate(self.term_freqs):
+            doc_len = self.doc_lengths[idx]
+            for word, tf in term_freqs.items():
+                numerator = tf * (self.k1 + 1)
+                denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
+                postings[self.vocab[word]].append((idx, self.idf[word] * numerator / denominator))
+
+        lengths = np.fromiter((len(p) for p in postings), dtype=np.int64, count=len(postings))
+        self.indptr = np.concatenate(([0], np.cumsum(lengths)))
+        self.indices = np.fromiter((idx for p in postings for idx, _ in p), dtype=np.int64, count=int(self.indptr[-1]))
+        self.data = np.fromiter((w for p in postings for _, w in p), dtype=np.float64, count=int(self.indptr[-1]))
+
+    def _score_matrix(self, queries):
+        """Return a (len(queries), N) array of BM25 scores"""
+        scores = np.zeros((len(queries), self.N), dtype=np.float64)
+        for row, query in enumerate(queries):
+            for token, weight in self.query_terms(query):
+                term = self.vocab.get(token)
+                if term is None:
+                    continue
+                start, end = self.indptr[term], self.indptr[term + 1]
+                weights = self.data[start:end]
+                scores[row, self.indices[start:end]] += weights if weight == 1.0 else weight * weights
+        return scores
+
+    def score(self, query):
+        """Score all documents against query"""
+        return self.score_batch([query])[0]
+
+    def score_batch(self, queries, top_k=None):
+        """Score many queries, returning the top_k (idx, score) pairs per query"""
+        if self.N == 0:
+            return [[] for _ in queries]
+        scores = self._score_matrix(queries)
+        # Stable sort keeps ties in document order, matching BM25.score
+        order = np.argsort(-scores, axis=1, kind="stable")[:, :top_k]
+        return [[(int(idx), float(row[idx])) for idx in ranked] for row, ranked in zip(scores, order)]
+
+
+BM25_BACKENDS = {"python": BM25, "numpy": NumpyBM25}
+
+
+# ============ CACHING ============
+class LRUCache:
+    """Bounded, thread-safe least-recently-used cache with hit/miss counters"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return cached value (or None) and mark it most recently used"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """Store value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data), "maxsize": self.maxsize}
+
+
+_TABLE_CACHE = LRUCache(TABLE_CACHE_SIZE)
+_INDEX_CACHE = LRUCache(INDEX_CACHE_SIZE)
+_RESULT_CACHE = LRUCache(RESULT_CACHE_SIZE)
+_TOKEN_CACHE = LRUCache(TOKEN_CACHE_SIZE)
+
+
+def _fingerprint(filepath):
+    """Identify a CSV version by path, modification time and size"""
+    stat = filepath.stat()
+    return (str(filepath), stat.st_mtime_ns, stat.st_size)
+
+
+def _normalize_query(query):
+    """Case- and whitespace-insensitive cache key for a query"""
+    return " ".join(str(query).lower().split())
+
+
+def cache_stats():
+    """Hit/miss counters for the table, index, result and token caches"""
+    return {"tables": _TABLE_CACHE.stats(), "indexes": _INDEX_CACHE.stats(),
+            "results": _RESULT_CACHE.stats(), "tokens": _TOKEN_CACHE.stats()}
+
+
+def clear_cache():
+    """Drop all cached tables, indexes, search results and token streams"""
+    _TABLE_CACHE.clear()
+    _INDEX_CACHE.clear()
+    _RESULT_CACHE.clear()
+    _TOKEN_CACHE.clear()
+
+
+# ============ DATA STORE ============
+class Table:
+    """
+    Read-only columnar copy of a CSV file.
+
+    Column names are interned, each column is one tuple of cells, and repeated
+    cell values share a single string. Indexing or iterating yields RowView
+    mappings instead of per-row dicts.
+    """
+
+    __slots__ = ("columns", "positions", "data")
+
+    def __init__(self, header, records):
+        self.columns = tuple(sys.intern(name) for name in header)
+        self.positions = {name: i for i, name in enumerate(self.columns)}
+        strings = {}
+        data = [[] for _ in self.columns]
+        width = len(self.columns)
+        for record in records:
+            if not record:
+                continue  # blank line, skipped like csv.DictReader does
+            if len(record) < width:
+                record = record + [""] * (width - len(record))
+            for values, value in zip(data, record):
+                values.append(strings.setdefault(value, value))
+        self.data = tuple(tuple(values) for values in data)
+
+    @classmethod
+    def from_csv(cls, filepath):
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            return cls(next(reader, []), reader)
+
+    def column(self, name):
+        """All cells of a column ("" for every row if the column is missing)"""
+        pos = self.positions.get(name)
+        return self.data[pos] if pos is not None else ("",) * len(self)
+
+    def __len__(self):
+        return len(self.data[0]) if self.data else 0
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError("table row index out of range")
+        return RowView(self, index % len(self))
+
+    def __iter__(self):
+        return (RowView(self, i) for i in range(len(self)))
+
+
+class RowView(Mapping):
+    """
+    Read-only mapping over one Table row, optionally limited to some columns.
+
+    Behaves like the dict csv.DictReader used to return (get, items, ==, ...);
+    serialize with json.dumps(..., default=dict).
+    """
+
+    __slots__ = ("_table", "_index", "_columns")
+
+    def __init__(self, table, index, columns=None):
+        self._table = table
+        self._index = index
+        self._columns = columns
+
+    def __getitem__(self, key):
+        if self._columns is not None and key not in self._columns:
+            raise KeyError(key)
+        return self._table.data[self._table.positions[key]][self._index]
+
+    def __iter__(self):
+        return iter(self._table.columns if self._columns is None else self._columns)
+
+    def __len__(self):
+        return len(self._table.columns if self._columns is None else self._columns)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def select(self, columns):
+        """View of the same row limited to `columns` (in that order) that exist in the table"""
+        return RowView(self._table, self._index, tuple(c for c in columns if c in self._table.positions))
+
 
 # ============ SEARCH FUNCTIONS ============
-def _load_csv(filepath):
-    """Load CSV and return list of dicts"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+def _load_csv(filepath, fingerprint=None):
+    """Load CSV as a Table, reusing the cached copy while the file is unchanged"""
+    key = fingerprint or _fingerprint(filepath)
+    table = _TABLE_CACHE.get(key)
+    if table is None:
+        table = Table.from_csv(filepath)
+        _TABLE_CACHE.put(key, table)
+    return table
 
 
-def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
-    if not filepath.exists():
-        return []
+def _get_index(filepath, search_cols, fingerprint=None, backend="python"):
+    """Return (rows, fitted BM25) for a CSV, reusing the cached index when unchanged"""
+    key = (fingerprint or _fingerprint(filepath), tuple(search_cols), backend)
+    cached = _INDEX_CACHE.get(key)
+    if cached is not None:
+        return cached
 
-    data = _load_csv(filepath)
+    data = _load_csv(filepath, key[0])
 
     # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+    documents = [" ".join(cells) for cells in zip(*(data.column(col) for col in search_cols))]
 
-    # BM25 search
-    bm25 = BM25()
+    bm25 = BM25_BACKENDS[backend]()
     bm25.fit(documents)
-    ranked = bm25.score(query)
+    _INDEX_CACHE.put(key, (data, bm25))
+    return data, bm25
 
-    # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
 
-    return results
+def _result_key(fingerprint, search_cols, output_cols, query, max_results):
+    return (fingerprint, tuple(search_cols), tuple(output_cols), _normalize_query(query), max_results)
+
+
+def _top_rows(data, ranked, output_cols, max_results):
+    """Output rows of the first max_results ranked (idx, score) pairs with score > 0"""
+    return [data[idx].select(output_cols) for idx, score in ranked[:max_results] if score > 0]
+
+
+def _search_csv(filepath, search_cols, output_cols, query, max_results, backend="python"):
+    """Core search function using BM25 (backends rank identically, so results are cached across them)"""
+    if not filepath.exists():
+        return []
+
+    fingerprint = _fingerprint(filepath)
+    key = _result_key(fingerprint, search_cols, output_cols, query, max_results)
+    cached = _RESULT_CACHE.get(key)
+    if cached is not None:
+        return list(cached)  # rows are read-only views, only the list needs copying
+
+    # BM25 search
+    data, bm25 = _get_index(filepath, search_cols, fingerprint, backend)
+    results = _top_rows(data, bm25.score(query), output_cols, max_results)
+
+    _RESULT_CACHE.put(key, results)
+    return list(results)
 
 
 def detect_domain(query):
@@ -214,45 +659,258 @@ def detect_domain(query):
     return best if scores[best] > 0 else "style"
 
 
-def search(query, domain=None, max_results=MAX_RESULTS):
-    """Main search function with auto-domain detection"""
+def _plan(query, domain=None, stack=None):
+    """
+    Where a search runs: (result header, filepath, search_cols, output_cols),
+    or an error dict. Domain searches auto-detect a missing domain.
+    """
+    if stack is not None:
+        if stack not in STACK_CONFIG:
+            return {"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"}
+        filepath = DATA_DIR / STACK_CONFIG[stack]["file"]
+        if not filepath.exists():
+            return {"error": f"Stack file not found: {filepath}", "stack": stack}
+        header = {"domain": "stack", "stack": stack, "query": query, "file": STACK_CONFIG[stack]["file"]}
+        return header, filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"]
+
     if domain is None:
         domain = detect_domain(query)
-
     config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
     filepath = DATA_DIR / config["file"]
-
     if not filepath.exists():
         return {"error": f"File not found: {filepath}", "domain": domain}
+    return {"domain": domain, "query": query, "file": config["file"]}, filepath, config["search_cols"], config["output_cols"]
 
-    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results)
 
-    return {
-        "domain": domain,
-        "query": query,
-        "file": config["file"],
-        "count": len(results),
-        "results": results
-    }
+def _planned_search(plan, query, max_results, backend):
+    if isinstance(plan, dict):
+        return plan
+    header, filepath, search_cols, output_cols = plan
+    results = _search_csv(filepath, search_cols, output_cols, query, max_results, backend)
+    return {**header, "count": len(results), "results": results}
 
 
-def search_stack(query, stack, max_results=MAX_RESULTS):
-    """Search stack-specific guidelines"""
-    if stack not in STACK_CONFIG:
-        return {"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"}
+def search(query, domain=None, max_results=MAX_RESULTS, backend="python"):
+    """Main search function with auto-domain detection"""
+    return _planned_search(_plan(query, domain), query, max_results, backend)
 
-    filepath = DATA_DIR / STACK_CONFIG[stack]["file"]
 
-    if not filepath.exists():
-        return {"error": f"Stack file not found: {filepath}", "stack": stack}
+def search_stack(query, stack, max_results=MAX_RESULTS, backend="python"):
+    """Search stack-specific guidelines"""
+    return _planned_search(_plan(query, stack=stack), query, max_results, backend)
+
+
+# ============ UNIFIED INDEX ============
+def _sources():
+    """(facet, file, search_cols, output_cols) for every domain CSV and stack CSV"""
+    for domain, config in CSV_CONFIG.items():
+        yield domain, config["file"], config["search_cols"], config["output_cols"]
+    for stack, config in STACK_CONFIG.items():
+        yield f"stack:{stack}", config["file"], _STACK_COLS["search_cols"], _STACK_COLS["output_cols"]
+
+
+class UnifiedIndex:
+    """
+    One BM25 index over every CSV in CSV_CONFIG and STACK_CONFIG.
+
+    Each document carries a domain facet ("style", "color", ..., "stack:react"),
+    so a single scoring pass answers "top-k per domain" for any set of domains.
+    IDF and average length are corpus-wide, so per-domain rankings can differ
+    slightly from search(), which fits each CSV on its own.
+    """
+
+    def __init__(self):
+        self.bm25 = BM25()
+        self.rows = []
+        self.facets = []
+        self.sources = {}
+
+    def fit(self):
+        documents = []
+        for facet, file, search_cols, output_cols in _sources():
+            filepath = DATA_DIR / file
+            if not filepath.exists():
+                continue
+            self.sources[facet] = {"file": file, "output_cols": output_cols}
+            table = _load_csv(filepath)
+            documents += [" ".join(cells) for cells in zip(*(table.column(col) for col in search_cols))]
+            self.rows += table
+            self.facets += [facet] * len(table)
+        self.bm25.fit(documents)
+        return self
+
+    def search(self, query, domains=None, max_results=MAX_RESULTS):
+        """Return {facet: [rows]} with the top max_results per facet (optionally only for domains)"""
+        wanted = set(domains) if domains else set(self.sources)
+        buckets = {facet: [] for facet in self.sources if facet in wanted}
+        open_facets = len(buckets)
+
+        for idx, score in self.bm25.score(query):
+            if score <= 0 or not open_facets:
+                break
+            bucket = buckets.get(self.facets[idx])
+            if bucket is None or len(bucket) >= max_results:
+                continue
+            bucket.append(self.rows[idx].select(self.sources[self.facets[idx]]["output_cols"]))
+            if len(bucket) == max_results:
+                open_facets -= 1
+        return buckets
+
+
+def get_unified_index():
+    """Return the fitted UnifiedIndex, rebuilding it only when a CSV changes"""
+    key = ("unified",) + tuple(
+        _fingerprint(DATA_DIR / file) for _, file, _, _ in _sources() if (DATA_DIR / file).exists()
+    )
+    index = _INDEX_CACHE.get(key)
+    if index is None:
+        index = UnifiedIndex().fit()
+        _INDEX_CACHE.put(key, index)
+    return index
+
+
+def search_all(query, domains=None, max_results=MAX_RESULTS):
+    """Search every domain and stack (or only `domains`) in one pass, top max_results each"""
+    index = get_unified_index()
+    unknown = set(domains or []) - set(index.sources)
+    if unknown:
+        return {"error": f"Unknown domain(s): {', '.join(sorted(unknown))}. Available: {', '.join(index.sources)}"}
+
+    results = {}
+    for facet, rows in index.search(query, domains, max_results).items():
+        entry = {"domain": facet, "query": query, "file": index.sources[facet]["file"], "count": len(rows), "results": rows}
+        if facet.startswith("stack:"):
+            entry.update(domain="stack", stack=facet[len("stack:"):])
+        results[facet] = entry
+    return {"query": query, "domains": results}
+
+
+def _request_error(request):
+    """Why a request dict cannot be searched, or None when it is valid"""
+    if not isinstance(request, Mapping):
+        return "Request must be a JSON object or a query string"
+    query = request.get("query")
+    if query is None or query == "":
+        return "Missing 'query'"
+    if not isinstance(query, str):
+        return "'query' must be a string"
+    domain, stack = request.get("domain"), request.get("stack")
+    if domain is not None and domain not in CSV_CONFIG:
+        return f"Unknown domain: {domain}. Available: {', '.join(CSV_CONFIG)}"
+    if stack is not None and not isinstance(stack, str):
+        return "'stack' must be a string"
+    max_results = request.get("max_results")
+    if max_results is not None and (not isinstance(max_results, int) or isinstance(max_results, bool) or max_results < 1):
+        return "'max_results' must be a positive integer"
+    return None
+
+
+def search_request(request, backend="python"):
+    """Run one search described by a dict: {"query", "domain"?, "stack"?, "max_results"?}"""
+    error = _request_error(request)
+    if error:
+        return {"error": error}
+    query = request["query"]
+    max_results = request.get("max_results") or MAX_RESULTS
+    if request.get("stack"):
+        return search_stack(query, request["stack"], max_results, backend)
+    return search(query, request.get("domain"), max_results, backend)
+
+
+def _error_result(e):
+    return {"error": f"{type(e).__name__}: {e}"}
+
+
+def _search_chunk(requests, backend="python"):
+    """
+    Results for a list of requests, in order. Requests that hit the same
+    index are scored with one bm25.score_batch call (the whole-batch matrix
+    path for NumpyBM25) and then ranked per query; results are the same as
+    search_request's. Invalid or failing requests get {"error": ...}.
+    """
+    results = [None] * len(requests)
+    groups = defaultdict(list)  # (filepath, search_cols, fingerprint) -> [(position, header, output_cols, query, n, key)]
+    for position, request in enumerate(requests):
+        try:
+            error = _request_error(request)
+            if error:
+                results[position] = {"error": error}
+                continue
+            query = request["query"]
+            max_results = request.get("max_results") or MAX_RESULTS
+            plan = _plan(query, request.get("domain"), request.get("stack") or None)
+            if isinstance(plan, dict):
+                results[position] = plan
+                continue
+            header, filepath, search_cols, output_cols = plan
+            fingerprint = _fingerprint(filepath)
+            key = _result_key(fingerprint, search_cols, output_cols, query, max_results)
+            cached = _RESULT_CACHE.get(key)
+            if cached is not None:
+                results[position] = {**header, "count": len(cached), "results": list(cached)}
+                continue
+            groups[(filepath, tuple(search_cols), fingerprint)].append(
+                (position, header, output_cols, query, max_results, key))
+        except Exception as e:  # one bad request must not abort the batch
+            results[position] = _error_result(e)
+
+    for (filepath, search_cols, fingerprint), items in groups.items():
+        try:
+            data, bm25 = _get_index(filepath, search_cols, fingerprint, backend)
+            rankings = bm25.score_batch([item[3] for item in items], max(item[4] for item in items))
+        except Exception as e:
+            for item in items:
+                results[item[0]] = _error_result(e)
+            continue
+        for (position, header, output_cols, _, max_results, key), ranked in zip(items, rankings):
+            rows = _top_rows(data, ranked, output_cols, max_results)
+            _RESULT_CACHE.put(key, rows)
+            results[position] = {**header, "count": len(rows), "results": list(rows)}
+    return results
 
-    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results)
 
-    return {
-        "domain": "stack",
-        "stack": stack,
-        "query": query,
-        "file": STACK_CONFIG[stack]["file"],
-        "count": len(results),
-        "results": results
-    }
+def _chunks(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def search_batch(requests, workers=1, backend="python"):
+    """
+    Run many searches against the shared index cache, yielding results in input order.
+
+    requests: iterable of request dicts (see search_request) or plain query strings
+    workers: number of threads scoring concurrently (1 = sequential)
+    backend: BM25 implementation, a BM25_BACKENDS key ("numpy" scores with
+        vectorized row additions; it pays off on large batches and needs numpy)
+
+    Requests are read in chunks of BATCH_CHUNK; within a chunk, queries for
+    the same index are scored together with one score_batch call. Invalid or
+    failing requests yield {"error": ...} in their place. Chunks are consumed
+    lazily (a bounded window ahead of the output), so results of a large batch
+    stream out while its input is still being read.
+    """
+    if backend not in BM25_BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}. Available: {', '.join(BM25_BACKENDS)}")
+    if backend == "numpy":
+        _import_numpy()  # fail once up front, not once per request
+    requests = ({"query": r} if isinstance(r, str) else r for r in requests)
+    chunks = _chunks(requests, BATCH_CHUNK)
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _search_chunk(chunk, backend)
+        return
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_search_chunk, chunk, backend))
+            while pending and (len(pending) >= workers * 2 or pending[0].done()):
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
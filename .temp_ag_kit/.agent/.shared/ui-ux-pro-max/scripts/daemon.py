@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Daemon - keeps every search index warm in one long-running process
+and answers JSON-line requests over a local Unix socket or stdin/stdout.
+
+Usage:
+    python search.py --serve                  # listen on the default Unix socket
+    python search.py --serve --socket /tmp/x.sock
+    python search.py --serve --stdio          # JSON lines on stdin -> stdout
+
+Request (one JSON object per line):
+    {"query": "glassmorphism", "domain": "style", "max_results": 3}
+    {"query": "forms", "stack": "react"}
+    {"query": "SaaS dashboard", "design_system": true, "project_name": "App", "format": "markdown"}
+
+Each request gets exactly one JSON line back: the search result dict, or
+{"output": "..."} for design systems, or {"error": "..."}.
+"""
+
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+
+# socket, socketserver, signal and tempfile are imported where used: every
+# search.py run checks for a daemon, and most of them find none.
+from core import CSV_CONFIG, STACK_CONFIG, _STACK_COLS, DATA_DIR, _get_index, search_request
+
+
+# ============ CONFIGURATION ============
+CLIENT_TIMEOUT = 5.0  # seconds before the client gives up and searches in-process
+
+
+def default_socket_path() -> str:
+    """
+    Per-user socket path, overridable with UIPRO_SOCKET: in $XDG_RUNTIME_DIR
+    when set, else in a private (0700) per-user directory under the temp dir.
+    """
+    if os.environ.get("UIPRO_SOCKET"):
+        return os.environ["UIPRO_SOCKET"]
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return str(Path(os.environ["XDG_RUNTIME_DIR"]) / "ui-ux-pro-max.sock")
+    return _temp_socket_path()
+
+
+def _temp_socket_path() -> str:
+    import tempfile
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    return str(Path(tempfile.gettempdir()) / f"ui-ux-pro-max-{user}" / "daemon.sock")
+
+
+def _owned(st) -> bool:
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+
+def _private_dir(path: str):
+    """Create the socket's directory 0700, or check an existing one is ours and private."""
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        os.mkdir(directory, 0o700)
+        return
+    except FileExistsError:
+        pass
+    st = os.lstat(directory)
+    if not stat.S_ISDIR(st.st_mode) or not _owned(st) or st.st_mode & 0o077:
+        raise OSError(f"{directory} is not a private directory owned by this user; remove it or use --socket")
+
+
+def trusted_socket(path: str) -> bool:
+    """True when path is a Unix socket owned by the current user."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and _owned(st)
+
+
+# ============ REQUEST HANDLING ============
+def warm_indexes() -> int:
+    """Load and fit every domain and stack index up front. Returns index count."""
+    count = 0
+    for config in CSV_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _get_index(filepath, config["search_cols"])
+            count += 1
+    for config in STACK_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _get_index(filepath, _STACK_COLS["search_cols"])
+            count += 1
+    return count
+
+
+def handle_request(request: dict) -> dict:
+    """Dispatch one request to search, search_stack or the design system generator."""
+    if request.get("design_system") and request.get("query"):
+        from design_system import generate_design_system
+        output = generate_design_system(
+            request["query"],
+            request.get("project_name"),
+            request.get("format", "ascii"),
+            persist=request.get("persist", False),
+            page=request.get("page"),
+            output_dir=request.get("output_dir")
+        )
+        return {"output": output}
+    return search_request(request)
+
+
+def _handle_line(line: str) -> str:
+    """Decode a JSON request line and encode its response line."""
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+        response = handle_request(request)
+    except Exception as e:  # one bad request must not take the daemon down
+        response = {"error": f"{type(e).__name__}: {e}"}
+    return json.dumps(response, ensure_ascii=False, default=dict) + "\n"
+
+
+# ============ SERVERS ============
+def _handle_stream(rfile, wfile):
+    """Answer every request line read from a socket connection."""
+    for raw in rfile:
+        line = raw.decode("utf-8").strip()
+        if line:
+            wfile.write(_handle_line(line).encode("utf-8"))
+            wfile.flush()
+
+
+def serve_stdio(stdin=None, stdout=None):
+    """Answer JSON-line requests from stdin until EOF."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    warm_indexes()
+    for line in stdin:
+        line = line.strip()
+        if line:
+            stdout.write(_handle_line(line))
+            stdout.flush()
+
+
+def serve_socket(path: str = None):
+    """Answer JSON-line requests on a Unix socket until interrupted."""
+    import signal
+    import socket
+    import socketserver
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            _handle_stream(self.rfile, self.wfile)
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix sockets are not available on this platform; use --stdio")
+    path = path or default_socket_path()
+    if path == _temp_socket_path():
+        _private_dir(path)
+    if os.path.lexists(path):
+        if not trusted_socket(path):
+            raise OSError(f"{path} exists and is not a socket owned by this user")
+        if query_daemon({"query": "ping", "max_results": 1}, path) is not None:
+            raise OSError(f"A daemon is already listening on {path}")
+        os.unlink(path)  # stale socket from a crashed daemon
+
+    count = warm_indexes()
+    umask = os.umask(0o177)  # the socket is created 0600, not chmod-ed after bind
+    try:
+        server = socketserver.ThreadingUnixStreamServer(path, RequestHandler)
+    finally:
+        os.umask(umask)
+    server.daemon_threads = True
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # run the cleanup below on kill
+    print(f"UI Pro Max daemon: {count} indexes warm, listening on {path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+# ============ CLIENT ============
+def query_daemon(request: dict, path: str = None, timeout: float = CLIENT_TIMEOUT):
+    """
+    Send one request to a running daemon.
+
+    Returns the decoded response, or None when no daemon is reachable (or the
+    socket is not ours, or the reply is garbled) so the caller can fall back to
+    in-process search.
+    """
+    path = path or default_socket_path()
+    if not trusted_socket(path):
+        return None  # missing, or planted by another user
+    import socket
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    try:
+        return json.loads(line.decode("utf-8"))
+    except ValueError:  # truncated or garbled reply
+        return None
@@ -11,14 +11,21 @@ Usage:
     # With persistence (Master + Overrides pattern)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True, page="dashboard")
+
+    # Many projects/pages in one pass from a manifest
+    summary = generate_from_manifest("design-manifest.json")
 """
 
 import csv
 import json
 import os
+import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+from core import search, DATA_DIR, _INDEX_CACHE, _fingerprint
+from templates import Template
 
 
 # ============ CONFIGURATION ============
@@ -33,75 +40,53 @@ SEARCH_CONFIG = {
 }
 
 
-# ============ DESIGN SYSTEM GENERATOR ============
-class DesignSystemGenerator:
-    """Generates design system recommendations from aggregated searches."""
-
-    def __init__(self):
-        self.reasoning_data = self._load_reasoning()
-
-    def _load_reasoning(self) -> list:
-        """Load reasoning rules from CSV."""
-        filepath = DATA_DIR / REASONING_FILE
-        if not filepath.exists():
-            return []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
-
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
-        for domain, config in SEARCH_CONFIG.items():
-            if domain == "style" and style_priority:
-                # For style, also search with priority keywords
-                priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
-            else:
-                results[domain] = search(query, domain, config["max_results"])
-        return results
-
-    def _find_reasoning_rule(self, category: str) -> dict:
-        """Find matching reasoning rule for a category."""
-        category_lower = category.lower()
-
-        # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
-
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
+# ============ REASONING RULES ============
+DEFAULT_REASONING = {
+    "pattern": "Hero + Features + CTA",
+    "style_priority": ["Minimalism", "Flat Design"],
+    "color_mood": "Professional",
+    "typography_mood": "Clean",
+    "key_effects": "Subtle hover transitions",
+    "anti_patterns": "",
+    "decision_rules": {},
+    "severity": "MEDIUM"
+}
 
-        # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
 
-        return {}
+class ReasoningIndex:
+    """
+    Precomputed lookup over ui-reasoning.csv.
 
-    def _apply_reasoning(self, category: str, search_results: dict) -> dict:
-        """Apply reasoning rules to search results."""
-        rule = self._find_reasoning_rule(category)
-
-        if not rule:
-            return {
-                "pattern": "Hero + Features + CTA",
-                "style_priority": ["Minimalism", "Flat Design"],
-                "color_mood": "Professional",
-                "typography_mood": "Clean",
-                "key_effects": "Subtle hover transitions",
-                "anti_patterns": "",
-                "decision_rules": {},
-                "severity": "MEDIUM"
-            }
+    Resolves a category with the same precedence as a linear scan (exact name,
+    then substring either way, then any name keyword inside the category, first
+    rule wins at each step) using an exact-match dict, a keyword inverted map
+    and a joined name string, and keeps each rule's parsed reasoning.
+    """
 
-        # Parse decision rules JSON
+    def __init__(self, rules: list):
+        self.rules = rules
+        self.exact = {}      # lowercased UI_Category -> first rule index
+        self.keywords = {}   # UI_Category keyword -> first rule index
+        self.reasoning = [self._parse(rule) for rule in rules]
+        self._memo = {}
+
+        names = [rule.get("UI_Category", "").lower() for rule in rules]
+        for idx, name in enumerate(names):
+            self.exact.setdefault(name, idx)
+            for kw in name.replace("/", " ").replace("-", " ").split():
+                self.keywords.setdefault(kw, idx)
+
+        # All names joined, so "category inside a name" is one str.find
+        self._haystack = "\n".join(names)
+        self._offsets = []
+        offset = 0
+        for name in names:
+            self._offsets.append(offset)
+            offset += len(name) + 1
+
+    @staticmethod
+    def _parse(rule: dict) -> dict:
+        """Turn a CSV rule into the reasoning dict used by the generator."""
         decision_rules = {}
         try:
             decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
@@ -119,6 +104,87 @@ class DesignSystemGenerator:
             "severity": rule.get("Severity", "MEDIUM")
         }
 
+    def find(self, category: str):
+        """Index of the matching rule for a category, or None."""
+        category_lower = category.lower()
+        if category_lower not in self._memo:
+            self._memo[category_lower] = self._resolve(category_lower)
+        return self._memo[category_lower]
+
+    def _resolve(self, category_lower: str):
+        # Exact match
+        if category_lower in self.exact:
+            return self.exact[category_lower]
+
+        substrings = {category_lower[i:j] for i in range(len(category_lower) + 1)
+                      for j in range(i, len(category_lower) + 1)}
+
+        # Partial match: rule name inside the category, or category inside a rule name
+        candidates = [self.exact[sub] for sub in substrings if sub in self.exact]
+        pos = self._haystack.find(category_lower) if "\n" not in category_lower else -1
+        if pos >= 0:
+            candidates.append(bisect_right(self._offsets, pos) - 1)
+        if candidates:
+            return min(candidates)
+
+        # Keyword match
+        candidates = [self.keywords[sub] for sub in substrings if sub in self.keywords]
+        return min(candidates) if candidates else None
+
+
+def load_reasoning_index() -> ReasoningIndex:
+    """Return the ReasoningIndex for ui-reasoning.csv, built once per file version."""
+    filepath = DATA_DIR / REASONING_FILE
+    if not filepath.exists():
+        return ReasoningIndex([])
+    key = ("reasoning", _fingerprint(filepath))
+    index = _INDEX_CACHE.get(key)
+    if index is None:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            index = ReasoningIndex(list(csv.DictReader(f)))
+        _INDEX_CACHE.put(key, index)
+    return index
+
+
+# ============ DESIGN SYSTEM GENERATOR ============
+class DesignSystemGenerator:
+    """Generates design system recommendations from aggregated searches."""
+
+    def __init__(self):
+        self._reasoning_index = None
+
+    @property
+    def reasoning_index(self) -> ReasoningIndex:
+        """ReasoningIndex, loaded on first lookup rather than at construction."""
+        if self._reasoning_index is None:
+            self._reasoning_index = load_reasoning_index()
+        return self._reasoning_index
+
+    @property
+    def reasoning_data(self) -> list:
+        return self.reasoning_index.rules
+
+    def _domain_query(self, query: str, domain: str, style_priority: list = None) -> str:
+        """Query for one domain; style also searches with the priority keywords."""
+        if domain == "style" and style_priority:
+            return f"{query} {' '.join(style_priority[:2])}"
+        return query
+
+    def _find_reasoning_rule(self, category: str) -> dict:
+        """Find matching reasoning rule for a category."""
+        idx = self.reasoning_index.find(category)
+        return self.reasoning_data[idx] if idx is not None else {}
+
+    def _apply_reasoning(self, category: str, search_results: dict) -> dict:
+        """Apply reasoning rules to search results."""
+        idx = self.reasoning_index.find(category)
+        reasoning = self.reasoning_index.reasoning[idx] if idx is not None else DEFAULT_REASONING
+
+        # Copy the mutable parts so callers cannot alter the shared index
+        return {**reasoning,
+                "style_priority": list(reasoning["style_priority"]),
+                "decision_rules": dict(reasoning["decision_rules"])}
+
     def _select_best_match(self, results: list, priority_keywords: list) -> dict:
         """Select best matching result based on priority keywords."""
         if not results:
@@ -162,20 +228,26 @@ class DesignSystemGenerator:
 
     def generate(self, query: str, project_name: str = None) -> dict:
         """Generate complete design system recommendation."""
-        # Step 1: First search product to get category
-        product_result = search(query, "product", 1)
-        product_results = product_result.get("results", [])
-        category = "General"
-        if product_results:
-            category = product_results[0].get("Product Type", "General")
+        with ThreadPoolExecutor(max_workers=len(SEARCH_CONFIG)) as pool:
+            # Step 1: Search product (to get category) alongside every domain that does not depend on it
+            futures = {
+                domain: pool.submit(search, query, domain, config["max_results"])
+                for domain, config in SEARCH_CONFIG.items() if domain != "style"
+            }
+            product_result = futures["product"].result()
+            product_results = product_result.get("results", [])
+            category = "General"
+            if product_results:
+                category = product_results[0].get("Product Type", "General")
 
-        # Step 2: Get reasoning rules for this category
-        reasoning = self._apply_reasoning(category, {})
-        style_priority = reasoning.get("style_priority", [])
+            # Step 2: Get reasoning rules for this category
+            reasoning = self._apply_reasoning(category, {})
+            style_priority = reasoning.get("style_priority", [])
 
-        # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
-        search_results["product"] = product_result  # Reuse product search
+            # Step 3: Style search with style priority hints, while the other domains finish
+            futures["style"] = pool.submit(search, self._domain_query(query, "style", style_priority),
+                                           "style", SEARCH_CONFIG["style"]["max_results"])
+            search_results = {domain: future.result() for domain, future in futures.items()}
 
         # Step 4: Select best matches from each domain using priority
         style_results = self._extract_results(search_results.get("style", {}))
@@ -238,224 +310,237 @@ class DesignSystemGenerator:
 
 # ============ OUTPUT FORMATTERS ============
 BOX_WIDTH = 90  # Wider box for more content
+BOX_BORDER = "+" + "-" * (BOX_WIDTH - 1) + "+"
+BOX_BLANK = "|" + " " * BOX_WIDTH + "|"
 
-def format_ascii_box(design_system: dict) -> str:
-    """Format design system as ASCII box with emojis (MCP-style)."""
-    project = design_system.get("project_name", "PROJECT")
-    pattern = design_system.get("pattern", {})
-    style = design_system.get("style", {})
-    colors = design_system.get("colors", {})
-    typography = design_system.get("typography", {})
-    effects = design_system.get("key_effects", "")
-    anti_patterns = design_system.get("anti_patterns", "")
-
-    def wrap_text(text: str, prefix: str, width: int) -> list:
-        """Wrap long text into multiple lines."""
-        if not text:
-            return []
-        words = text.split()
-        lines = []
-        current_line = prefix
-        for word in words:
-            if len(current_line) + len(word) + 1 <= width - 2:
-                current_line += (" " if current_line != prefix else "") + word
-            else:
-                if current_line != prefix:
-                    lines.append(current_line)
-                current_line = prefix + word
-        if current_line != prefix:
-            lines.append(current_line)
-        return lines
-
-    # Build sections from pattern
-    sections = pattern.get("sections", "").split(">")
-    sections = [s.strip() for s in sections if s.strip()]
-
-    # Build output lines
+DESIGN_PARAMS = ("project", "category", "pattern", "style", "colors", "typography", "effects", "anti_patterns")
+
+CHECKLIST_ITEMS = [
+    "[ ] No emojis as icons (use SVG: Heroicons/Lucide)",
+    "[ ] cursor-pointer on all clickable elements",
+    "[ ] Hover states with smooth transitions (150-300ms)",
+    "[ ] Light mode: text contrast 4.5:1 minimum",
+    "[ ] Focus states visible for keyboard nav",
+    "[ ] prefers-reduced-motion respected",
+    "[ ] Responsive: 375px, 768px, 1024px, 1440px"
+]
+
+
+def _design_context(design_system: dict) -> dict:
+    """Template variables shared by every design-system renderer."""
+    return {
+        "project": design_system.get("project_name", "PROJECT"),
+        "category": design_system.get("category", "General"),
+        "pattern": design_system.get("pattern", {}),
+        "style": design_system.get("style", {}),
+        "colors": design_system.get("colors", {}),
+        "typography": design_system.get("typography", {}),
+        "effects": design_system.get("key_effects", ""),
+        "anti_patterns": design_system.get("anti_patterns", "")
+    }
+
+
+def _wrap_text(text: str, prefix: str, width: int) -> list:
+    """Wrap long text into multiple lines."""
+    if not text:
+        return []
+    words = text.split()
     lines = []
-    w = BOX_WIDTH - 1
-
-    lines.append("+" + "-" * w + "+")
-    lines.append(f"|  TARGET: {project} - RECOMMENDED DESIGN SYSTEM".ljust(BOX_WIDTH) + "|")
-    lines.append("+" + "-" * w + "+")
-    lines.append("|" + " " * BOX_WIDTH + "|")
-
-    # Pattern section
-    lines.append(f"|  PATTERN: {pattern.get('name', '')}".ljust(BOX_WIDTH) + "|")
-    if pattern.get('conversion'):
-        lines.append(f"|     Conversion: {pattern.get('conversion', '')}".ljust(BOX_WIDTH) + "|")
-    if pattern.get('cta_placement'):
-        lines.append(f"|     CTA: {pattern.get('cta_placement', '')}".ljust(BOX_WIDTH) + "|")
-    lines.append("|     Sections:".ljust(BOX_WIDTH) + "|")
-    for i, section in enumerate(sections, 1):
-        lines.append(f"|       {i}. {section}".ljust(BOX_WIDTH) + "|")
-    lines.append("|" + " " * BOX_WIDTH + "|")
-
-    # Style section
-    lines.append(f"|  STYLE: {style.get('name', '')}".ljust(BOX_WIDTH) + "|")
-    if style.get("keywords"):
-        for line in wrap_text(f"Keywords: {style.get('keywords', '')}", "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
-    if style.get("best_for"):
-        for line in wrap_text(f"Best For: {style.get('best_for', '')}", "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
-    if style.get("performance") or style.get("accessibility"):
-        perf_a11y = f"Performance: {style.get('performance', '')} | Accessibility: {style.get('accessibility', '')}"
-        lines.append(f"|     {perf_a11y}".ljust(BOX_WIDTH) + "|")
-    lines.append("|" + " " * BOX_WIDTH + "|")
-
-    # Colors section
-    lines.append("|  COLORS:".ljust(BOX_WIDTH) + "|")
-    lines.append(f"|     Primary:    {colors.get('primary', '')}".ljust(BOX_WIDTH) + "|")
-    lines.append(f"|     Secondary:  {colors.get('secondary', '')}".ljust(BOX_WIDTH) + "|")
-    lines.append(f"|     CTA:        {colors.get('cta', '')}".ljust(BOX_WIDTH) + "|")
-    lines.append(f"|     Background: {colors.get('background', '')}".ljust(BOX_WIDTH) + "|")
-    lines.append(f"|     Text:       {colors.get('text', '')}".ljust(BOX_WIDTH) + "|")
-    if colors.get("notes"):
-        for line in wrap_text(f"Notes: {colors.get('notes', '')}", "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
-    lines.append("|" + " " * BOX_WIDTH + "|")
-
-    # Typography section
-    lines.append(f"|  TYPOGRAPHY: {typography.get('heading', '')} / {typography.get('body', '')}".ljust(BOX_WIDTH) + "|")
-    if typography.get("mood"):
-        for line in wrap_text(f"Mood: {typography.get('mood', '')}", "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
-    if typography.get("best_for"):
-        for line in wrap_text(f"Best For: {typography.get('best_for', '')}", "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
-    if typography.get("google_fonts_url"):
-        lines.append(f"|     Google Fonts: {typography.get('google_fonts_url', '')}".ljust(BOX_WIDTH) + "|")
-    if typography.get("css_import"):
-        lines.append(f"|     CSS Import: {typography.get('css_import', '')[:70]}...".ljust(BOX_WIDTH) + "|")
-    lines.append("|" + " " * BOX_WIDTH + "|")
-
-    # Key Effects section
-    if effects:
-        lines.append("|  KEY EFFECTS:".ljust(BOX_WIDTH) + "|")
-        for line in wrap_text(effects, "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
-        lines.append("|" + " " * BOX_WIDTH + "|")
-
-    # Anti-patterns section
-    if anti_patterns:
-        lines.append("|  AVOID (Anti-patterns):".ljust(BOX_WIDTH) + "|")
-        for line in wrap_text(anti_patterns, "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
-        lines.append("|" + " " * BOX_WIDTH + "|")
-
-    # Pre-Delivery Checklist section
-    lines.append("|  PRE-DELIVERY CHECKLIST:".ljust(BOX_WIDTH) + "|")
-    checklist_items = [
-        "[ ] No emojis as icons (use SVG: Heroicons/Lucide)",
-        "[ ] cursor-pointer on all clickable elements",
-        "[ ] Hover states with smooth transitions (150-300ms)",
-        "[ ] Light mode: text contrast 4.5:1 minimum",
-        "[ ] Focus states visible for keyboard nav",
-        "[ ] prefers-reduced-motion respected",
-        "[ ] Responsive: 375px, 768px, 1024px, 1440px"
-    ]
-    for item in checklist_items:
-        lines.append(f"|     {item}".ljust(BOX_WIDTH) + "|")
-    lines.append("|" + " " * BOX_WIDTH + "|")
+    current_line = prefix
+    for word in words:
+        if len(current_line) + len(word) + 1 <= width - 2:
+            current_line += (" " if current_line != prefix else "") + word
+        else:
+            if current_line != prefix:
+                lines.append(current_line)
+            current_line = prefix + word
+    if current_line != prefix:
+        lines.append(current_line)
+    return lines
+
+
+def _box_line(line: str) -> str:
+    """Pad a box line to the right border (borders and blank rows are pre-built)."""
+    if line == BOX_BORDER or line == BOX_BLANK:
+        return line
+    return line.ljust(BOX_WIDTH) + "|"
+
+
+ASCII_BOX_TEMPLATE = Template("""\
+{{ BORDER }}
+|  TARGET: {{ project }} - RECOMMENDED DESIGN SYSTEM
+{{ BORDER }}
+{{ BLANK }}
+|  PATTERN: {{ pattern.get('name', '') }}
+% if pattern.get('conversion'):
+|     Conversion: {{ pattern.get('conversion', '') }}
+% end
+% if pattern.get('cta_placement'):
+|     CTA: {{ pattern.get('cta_placement', '') }}
+% end
+|     Sections:
+% for i, section in enumerate(sections(pattern), 1):
+|       {{ i }}. {{ section }}
+% end
+{{ BLANK }}
+|  STYLE: {{ style.get('name', '') }}
+% if style.get("keywords"):
+% for line in wrap(f"Keywords: {style.get('keywords', '')}"):
+{{ line }}
+% end
+% end
+% if style.get("best_for"):
+% for line in wrap(f"Best For: {style.get('best_for', '')}"):
+{{ line }}
+% end
+% end
+% if style.get("performance") or style.get("accessibility"):
+|     Performance: {{ style.get('performance', '') }} | Accessibility: {{ style.get('accessibility', '') }}
+% end
+{{ BLANK }}
+|  COLORS:
+|     Primary:    {{ colors.get('primary', '') }}
+|     Secondary:  {{ colors.get('secondary', '') }}
+|     CTA:        {{ colors.get('cta', '') }}
+|     Background: {{ colors.get('background', '') }}
+|     Text:       {{ colors.get('text', '') }}
+% if colors.get("notes"):
+% for line in wrap(f"Notes: {colors.get('notes', '')}"):
+{{ line }}
+% end
+% end
+{{ BLANK }}
+|  TYPOGRAPHY: {{ typography.get('heading', '') }} / {{ typography.get('body', '') }}
+% if typography.get("mood"):
+% for line in wrap(f"Mood: {typography.get('mood', '')}"):
+{{ line }}
+% end
+% end
+% if typography.get("best_for"):
+% for line in wrap(f"Best For: {typography.get('best_for', '')}"):
+{{ line }}
+% end
+% end
+% if typography.get("google_fonts_url"):
+|     Google Fonts: {{ typography.get('google_fonts_url', '') }}
+% end
+% if typography.get("css_import"):
+|     CSS Import: {{ typography.get('css_import', '')[:70] }}...
+% end
+{{ BLANK }}
+% if effects:
+|  KEY EFFECTS:
+% for line in wrap(effects):
+{{ line }}
+% end
+{{ BLANK }}
+% end
+% if anti_patterns:
+|  AVOID (Anti-patterns):
+% for line in wrap(anti_patterns):
+{{ line }}
+% end
+{{ BLANK }}
+% end
+|  PRE-DELIVERY CHECKLIST:
+% for item in CHECKLIST_ITEMS:
+|     {{ item }}
+% end
+{{ BLANK }}
+{{ BORDER }}""", DESIGN_PARAMS, helpers={
+    "BORDER": BOX_BORDER,
+    "BLANK": BOX_BLANK,
+    "CHECKLIST_ITEMS": CHECKLIST_ITEMS,
+    "sections": lambda pattern: [s.strip() for s in pattern.get("sections", "").split(">") if s.strip()],
+    "wrap": lambda text: _wrap_text(text, "|     ", BOX_WIDTH)
+}, line_format=_box_line)
+
+
+MARKDOWN_TEMPLATE = Template("""\
+## Design System: {{ project }}
+
+### Pattern
+- **Name:** {{ pattern.get('name', '') }}
+% if pattern.get('conversion'):
+- **Conversion Focus:** {{ pattern.get('conversion', '') }}
+% end
+% if pattern.get('cta_placement'):
+- **CTA Placement:** {{ pattern.get('cta_placement', '') }}
+% end
+% if pattern.get('color_strategy'):
+- **Color Strategy:** {{ pattern.get('color_strategy', '') }}
+% end
+- **Sections:** {{ pattern.get('sections', '') }}
+
+### Style
+- **Name:** {{ style.get('name', '') }}
+% if style.get('keywords'):
+- **Keywords:** {{ style.get('keywords', '') }}
+% end
+% if style.get('best_for'):
+- **Best For:** {{ style.get('best_for', '') }}
+% end
+% if style.get('performance') or style.get('accessibility'):
+- **Performance:** {{ style.get('performance', '') }} | **Accessibility:** {{ style.get('accessibility', '') }}
+% end
+
+### Colors
+| Role | Hex |
+|------|-----|
+| Primary | {{ colors.get('primary', '') }} |
+| Secondary | {{ colors.get('secondary', '') }} |
+| CTA | {{ colors.get('cta', '') }} |
+| Background | {{ colors.get('background', '') }} |
+| Text | {{ colors.get('text', '') }} |
+% if colors.get("notes"):
+
+*Notes: {{ colors.get('notes', '') }}*
+% end
+
+### Typography
+- **Heading:** {{ typography.get('heading', '') }}
+- **Body:** {{ typography.get('body', '') }}
+% if typography.get("mood"):
+- **Mood:** {{ typography.get('mood', '') }}
+% end
+% if typography.get("best_for"):
+- **Best For:** {{ typography.get('best_for', '') }}
+% end
+% if typography.get("google_fonts_url"):
+- **Google Fonts:** {{ typography.get('google_fonts_url', '') }}
+% end
+% if typography.get("css_import"):
+- **CSS Import:**
+```css
+{{ typography.get('css_import', '') }}
+```
+% end
+
+% if effects:
+### Key Effects
+{{ effects }}
+
+% end
+% if anti_patterns:
+### Avoid (Anti-patterns)
+- {{ anti_patterns.replace(' + ', NEWLINE_BULLET) }}
+
+% end
+### Pre-Delivery Checklist
+% for item in CHECKLIST_ITEMS:
+- {{ item }}
+% end
+""", DESIGN_PARAMS, helpers={"CHECKLIST_ITEMS": CHECKLIST_ITEMS, "NEWLINE_BULLET": "\n- "})
 
-    lines.append("+" + "-" * w + "+")
 
-    return "\n".join(lines)
+def format_ascii_box(design_system: dict) -> str:
+    """Format design system as ASCII box with emojis (MCP-style)."""
+    return ASCII_BOX_TEMPLATE.render(**_design_context(design_system))
 
 
 def format_markdown(design_system: dict) -> str:
     """Format design system as markdown."""
-    project = design_system.get("project_name", "PROJECT")
-    pattern = design_system.get("pattern", {})
-    style = design_system.get("style", {})
-    colors = design_system.get("colors", {})
-    typography = design_system.get("typography", {})
-    effects = design_system.get("key_effects", "")
-    anti_patterns = design_system.get("anti_patterns", "")
-
-    lines = []
-    lines.append(f"## Design System: {project}")
-    lines.append("")
-
-    # Pattern section
-    lines.append("### Pattern")
-    lines.append(f"- **Name:** {pattern.get('name', '')}")
-    if pattern.get('conversion'):
-        lines.append(f"- **Conversion Focus:** {pattern.get('conversion', '')}")
-    if pattern.get('cta_placement'):
-        lines.append(f"- **CTA Placement:** {pattern.get('cta_placement', '')}")
-    if pattern.get('color_strategy'):
-        lines.append(f"- **Color Strategy:** {pattern.get('color_strategy', '')}")
-    lines.append(f"- **Sections:** {pattern.get('sections', '')}")
-    lines.append("")
-
-    # Style section
-    lines.append("### Style")
-    lines.append(f"- **Name:** {style.get('name', '')}")
-    if style.get('keywords'):
-        lines.append(f"- **Keywords:** {style.get('keywords', '')}")
-    if style.get('best_for'):
-        lines.append(f"- **Best For:** {style.get('best_for', '')}")
-    if style.get('performance') or style.get('accessibility'):
-        lines.append(f"- **Performance:** {style.get('performance', '')} | **Accessibility:** {style.get('accessibility', '')}")
-    lines.append("")
-
-    # Colors section
-    lines.append("### Colors")
-    lines.append(f"| Role | Hex |")
-    lines.append(f"|------|-----|")
-    lines.append(f"| Primary | {colors.get('primary', '')} |")
-    lines.append(f"| Secondary | {colors.get('secondary', '')} |")
-    lines.append(f"| CTA | {colors.get('cta', '')} |")
-    lines.append(f"| Background | {colors.get('background', '')} |")
-    lines.append(f"| Text | {colors.get('text', '')} |")
-    if colors.get("notes"):
-        lines.append(f"\n*Notes: {colors.get('notes', '')}*")
-    lines.append("")
-
-    # Typography section
-    lines.append("### Typography")
-    lines.append(f"- **Heading:** {typography.get('heading', '')}")
-    lines.append(f"- **Body:** {typography.get('body', '')}")
-    if typography.get("mood"):
-        lines.append(f"- **Mood:** {typography.get('mood', '')}")
-    if typography.get("best_for"):
-        lines.append(f"- **Best For:** {typography.get('best_for', '')}")
-    if typography.get("google_fonts_url"):
-        lines.append(f"- **Google Fonts:** {typography.get('google_fonts_url', '')}")
-    if typography.get("css_import"):
-        lines.append(f"- **CSS Import:**")
-        lines.append(f"```css")
-        lines.append(f"{typography.get('css_import', '')}")
-        lines.append(f"```")
-    lines.append("")
-
-    # Key Effects section
-    if effects:
-        lines.append("### Key Effects")
-        lines.append(f"{effects}")
-        lines.append("")
-
-    # Anti-patterns section
-    if anti_patterns:
-        lines.append("### Avoid (Anti-patterns)")
-        newline_bullet = '\n- '
-        lines.append(f"- {anti_patterns.replace(' + ', newline_bullet)}")
-        lines.append("")
-
-    # Pre-Delivery Checklist section
-    lines.append("### Pre-Delivery Checklist")
-    lines.append("- [ ] No emojis as icons (use SVG: Heroicons/Lucide)")
-    lines.append("- [ ] cursor-pointer on all clickable elements")
-    lines.append("- [ ] Hover states with smooth transitions (150-300ms)")
-    lines.append("- [ ] Light mode: text contrast 4.5:1 minimum")
-    lines.append("- [ ] Focus states visible for keyboard nav")
-    lines.append("- [ ] prefers-reduced-motion respected")
-    lines.append("- [ ] Responsive: 375px, 768px, 1024px, 1440px")
-    lines.append("")
-
-    return "\n".join(lines)
+    return MARKDOWN_TEMPLATE.render(**_design_context(design_system))
 
 
 # ============ MAIN ENTRY POINT ============
@@ -488,7 +573,26 @@ def generate_design_system(query: str, project_name: str = None, output_format:
 
 
 # ============ PERSISTENCE FUNCTIONS ============
-def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
+_GENERATED_LINE = re.compile(r"^.*\*\*Generated:\*\*.*$", re.MULTILINE)
+
+
+def _write_if_changed(path: Path, template: Template, context: dict) -> bool:
+    """Render into path unless the file already holds that content (ignoring the Generated timestamp)."""
+    if not path.exists():
+        template.write(path, **context)  # nothing to compare against: stream straight to disk
+        return True
+    content = template.render(**context)
+    with open(path, 'r', encoding='utf-8') as f:
+        existing = f.read()
+    if _GENERATED_LINE.sub("", existing) == _GENERATED_LINE.sub("", content):
+        return False
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+
+def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None,
+                          pages: list = None) -> dict:
     """
     Persist design system to design-system/<project>/ folder using Master + Overrides pattern.
     
@@ -497,9 +601,10 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
         page_query: Optional query string for intelligent page override generation
+        pages: Optional list of (page, page_query) pairs to write in the same pass
     
     Returns:
-        dict with created file paths and status
+        dict with created file paths, unchanged file paths and status
     """
     base_dir = Path(output_dir) if output_dir else Path.cwd()
     
@@ -511,404 +616,384 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
     pages_dir = design_system_dir / "pages"
     
     created_files = []
+    unchanged_files = []
     
     # Create directories
     design_system_dir.mkdir(parents=True, exist_ok=True)
     pages_dir.mkdir(parents=True, exist_ok=True)
     
-    master_file = design_system_dir / "MASTER.md"
-    
-    # Generate and write MASTER.md
-    master_content = format_master_md(design_system)
-    with open(master_file, 'w', encoding='utf-8') as f:
-        f.write(master_content)
-    created_files.append(str(master_file))
+    # Generate MASTER.md, then any page override files with intelligent content
+    outputs = [(design_system_dir / "MASTER.md", MASTER_MD_TEMPLATE, _master_context(design_system))]
+    page_specs = ([(page, page_query)] if page else []) + list(pages or [])
+    for page_name, query in page_specs:
+        page_file = pages_dir / f"{page_name.lower().replace(' ', '-')}.md"
+        outputs.append((page_file, PAGE_OVERRIDE_TEMPLATE, _page_override_context(design_system, page_name, query)))
     
-    # If page is specified, create page override file with intelligent content
-    if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
-        with open(page_file, 'w', encoding='utf-8') as f:
-            f.write(page_content)
-        created_files.append(str(page_file))
+    # Only rewrite files whose content changed
+    for path, template, context in outputs:
+        if _write_if_changed(path, template, context):
+            created_files.append(str(path))
+        else:
+            unchanged_files.append(str(path))
     
     return {
         "status": "success",
         "design_system_dir": str(design_system_dir),
-        "created_files": created_files
+        "created_files": created_files,
+        "unchanged_files": unchanged_files
+    }
+
+
+def generate_from_manifest(manifest, output_dir: str = None) -> list:
+    """
+    Generate and persist design systems for many projects and pages in one pass.
+
+    The manifest (a dict, or a path to a JSON file) looks like:
+        {"output_dir": "optional/base/dir",
+         "projects": [{"query": "SaaS dashboard", "project_name": "My App",
+                       "pages": ["dashboard", {"name": "checkout", "query": "checkout payment"}]}]}
+    A bare list of projects is accepted too. Pages without a query use the project query.
+    The reasoning index and search indexes are shared by every project.
+
+    Returns:
+        list of persist_design_system results, one per project
+    """
+    if isinstance(manifest, (str, Path)):
+        with open(manifest, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    if isinstance(manifest, list):
+        manifest = {"projects": manifest}
+    output_dir = output_dir or manifest.get("output_dir")
+
+    generator = DesignSystemGenerator()
+    summary = []
+    for project in manifest.get("projects", []):
+        query = project["query"]
+        design_system = generator.generate(query, project.get("project_name"))
+        pages = []
+        for page in project.get("pages", []):
+            if isinstance(page, str):
+                page = {"name": page}
+            pages.append((page["name"], page.get("query", query)))
+        summary.append(persist_design_system(design_system, output_dir=output_dir, pages=pages))
+    return summary
+
+
+MASTER_MD_TEMPLATE = Template("""\
+# Design System Master File
+
+> **LOGIC:** When building a specific page, first check `design-system/pages/[page-name].md`.
+> If that file exists, its rules **override** this Master file.
+> If not, strictly follow the rules below.
+
+---
+
+**Project:** {{ project }}
+**Generated:** {{ timestamp }}
+**Category:** {{ category }}
+
+---
+
+## Global Rules
+
+### Color Palette
+
+| Role | Hex | CSS Variable |
+|------|-----|--------------|
+| Primary | `{{ colors.get('primary', '#2563EB') }}` | `--color-primary` |
+| Secondary | `{{ colors.get('secondary', '#3B82F6') }}` | `--color-secondary` |
+| CTA/Accent | `{{ colors.get('cta', '#F97316') }}` | `--color-cta` |
+| Background | `{{ colors.get('background', '#F8FAFC') }}` | `--color-background` |
+| Text | `{{ colors.get('text', '#1E293B') }}` | `--color-text` |
+
+% if colors.get("notes"):
+**Color Notes:** {{ colors.get('notes', '') }}
+
+% end
+### Typography
+
+- **Heading Font:** {{ typography.get('heading', 'Inter') }}
+- **Body Font:** {{ typography.get('body', 'Inter') }}
+% if typography.get("mood"):
+- **Mood:** {{ typography.get('mood', '') }}
+% end
+% if typography.get("google_fonts_url"):
+- **Google Fonts:** [{{ typography.get('heading', '') }} + {{ typography.get('body', '') }}]({{ typography.get('google_fonts_url', '') }})
+% end
+
+% if typography.get("css_import"):
+**CSS Import:**
+```css
+{{ typography.get("css_import", "") }}
+```
+
+% end
+### Spacing Variables
+
+| Token | Value | Usage |
+|-------|-------|-------|
+| `--space-xs` | `4px` / `0.25rem` | Tight gaps |
+| `--space-sm` | `8px` / `0.5rem` | Icon gaps, inline spacing |
+| `--space-md` | `16px` / `1rem` | Standard padding |
+| `--space-lg` | `24px` / `1.5rem` | Section padding |
+| `--space-xl` | `32px` / `2rem` | Large gaps |
+| `--space-2xl` | `48px` / `3rem` | Section margins |
+| `--space-3xl` | `64px` / `4rem` | Hero padding |
+
+### Shadow Depths
+
+| Level | Value | Usage |
+|-------|-------|-------|
+| `--shadow-sm` | `0 1px 2px rgba(0,0,0,0.05)` | Subtle lift |
+| `--shadow-md` | `0 4px 6px rgba(0,0,0,0.1)` | Cards, buttons |
+| `--shadow-lg` | `0 10px 15px rgba(0,0,0,0.1)` | Modals, dropdowns |
+| `--shadow-xl` | `0 20px 25px rgba(0,0,0,0.15)` | Hero images, featured cards |
+
+---
+
+## Component Specs
+
+### Buttons
+
+```css
+/* Primary Button */
+.btn-primary {
+  background: {{ colors.get('cta', '#F97316') }};
+  color: white;
+  padding: 12px 24px;
+  border-radius: 8px;
+  font-weight: 600;
+  transition: all 200ms ease;
+  cursor: pointer;
+}
+
+.btn-primary:hover {
+  opacity: 0.9;
+  transform: translateY(-1px);
+}
+
+/* Secondary Button */
+.btn-secondary {
+  background: transparent;
+  color: {{ colors.get('primary', '#2563EB') }};
+  border: 2px solid {{ colors.get('primary', '#2563EB') }};
+  padding: 12px 24px;
+  border-radius: 8px;
+  font-weight: 600;
+  transition: all 200ms ease;
+  cursor: pointer;
+}
+```
+
+### Cards
+
+```css
+.card {
+  background: {{ colors.get('background', '#FFFFFF') }};
+  border-radius: 12px;
+  padding: 24px;
+  box-shadow: var(--shadow-md);
+  transition: all 200ms ease;
+  cursor: pointer;
+}
+
+.card:hover {
+  box-shadow: var(--shadow-lg);
+  transform: translateY(-2px);
+}
+```
+
+### Inputs
+
+```css
+.input {
+  padding: 12px 16px;
+  border: 1px solid #E2E8F0;
+  border-radius: 8px;
+  font-size: 16px;
+  transition: border-color 200ms ease;
+}
+
+.input:focus {
+  border-color: {{ colors.get('primary', '#2563EB') }};
+  outline: none;
+  box-shadow: 0 0 0 3px {{ colors.get('primary', '#2563EB') }}20;
+}
+```
+
+### Modals
+
+```css
+.modal-overlay {
+  background: rgba(0, 0, 0, 0.5);
+  backdrop-filter: blur(4px);
+}
+
+.modal {
+  background: white;
+  border-radius: 16px;
+  padding: 32px;
+  box-shadow: var(--shadow-xl);
+  max-width: 500px;
+  width: 90%;
+}
+```
+
+---
+
+## Style Guidelines
+
+**Style:** {{ style.get('name', 'Minimalism') }}
+
+% if style.get("keywords"):
+**Keywords:** {{ style.get('keywords', '') }}
+
+% end
+% if style.get("best_for"):
+**Best For:** {{ style.get('best_for', '') }}
+
+% end
+% if effects:
+**Key Effects:** {{ effects }}
+
+% end
+### Page Pattern
+
+**Pattern Name:** {{ pattern.get('name', '') }}
+
+% if pattern.get('conversion'):
+- **Conversion Strategy:** {{ pattern.get('conversion', '') }}
+% end
+% if pattern.get('cta_placement'):
+- **CTA Placement:** {{ pattern.get('cta_placement', '') }}
+% end
+- **Section Order:** {{ pattern.get('sections', '') }}
+
+---
+
+## Anti-Patterns (Do NOT Use)
+
+% for anti in [a.strip() for a in anti_patterns.split("+")] if anti_patterns else []:
+% if anti:
+- ❌ {{ anti }}
+% end
+% end
+
+### Additional Forbidden Patterns
+
+- ❌ **Emojis as icons** — Use SVG icons (Heroicons, Lucide, Simple Icons)
+- ❌ **Missing cursor:pointer** — All clickable elements must have cursor:pointer
+- ❌ **Layout-shifting hovers** — Avoid scale transforms that shift layout
+- ❌ **Low contrast text** — Maintain 4.5:1 minimum contrast ratio
+- ❌ **Instant state changes** — Always use transitions (150-300ms)
+- ❌ **Invisible focus states** — Focus states must be visible for a11y
+
+---
+
+## Pre-Delivery Checklist
+
+Before delivering any UI code, verify:
+
+- [ ] No emojis used as icons (use SVG instead)
+- [ ] All icons from consistent icon set (Heroicons/Lucide)
+- [ ] `cursor-pointer` on all clickable elements
+- [ ] Hover states with smooth transitions (150-300ms)
+- [ ] Light mode: text contrast 4.5:1 minimum
+- [ ] Focus states visible for keyboard navigation
+- [ ] `prefers-reduced-motion` respected
+- [ ] Responsive: 375px, 768px, 1024px, 1440px
+- [ ] No content hidden behind fixed navbars
+- [ ] No horizontal scroll on mobile
+""", DESIGN_PARAMS + ("timestamp",))
+
+
+PAGE_OVERRIDE_TEMPLATE = Template("""\
+# {{ page_title }} Page Overrides
+
+> **PROJECT:** {{ project }}
+> **Generated:** {{ timestamp }}
+> **Page Type:** {{ overrides.get('page_type', 'General') }}
+
+> ⚠️ **IMPORTANT:** Rules in this file **override** the Master file (`design-system/MASTER.md`).
+> Only deviations from the Master are documented here. For all other rules, refer to the Master.
+
+---
+
+## Page-Specific Rules
+
+% for title, key, fallback in OVERRIDE_SECTIONS:
+### {{ title }} Overrides
+
+% if overrides.get(key, {}):
+% for name, value in overrides[key].items():
+- **{{ name }}:** {{ value }}
+% end
+% else:
+- No overrides — use Master {{ fallback }}
+% end
+
+% end
+### Component Overrides
+
+% if overrides.get("components", []):
+% for comp in overrides["components"]:
+- {{ comp }}
+% end
+% else:
+- No overrides — use Master component specs
+% end
+
+---
+
+## Page-Specific Components
+
+% if overrides.get("unique_components", []):
+% for comp in overrides["unique_components"]:
+- {{ comp }}
+% end
+% else:
+- No unique components for this page
+% end
+
+---
+
+## Recommendations
+
+% for rec in overrides.get("recommendations", []):
+- {{ rec }}
+% end
+""", ("project", "timestamp", "page_title", "overrides"), helpers={
+    "OVERRIDE_SECTIONS": [
+        ("Layout", "layout", "layout"),
+        ("Spacing", "spacing", "spacing"),
+        ("Typography", "typography", "typography"),
+        ("Color", "colors", "colors")
+    ]
+})
+
+
+def _master_context(design_system: dict) -> dict:
+    return {**_design_context(design_system), "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+
+
+def _page_override_context(design_system: dict, page_name: str, page_query: str = None) -> dict:
+    return {
+        "project": design_system.get("project_name", "PROJECT"),
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "page_title": page_name.replace("-", " ").replace("_", " ").title(),
+        # Detect page type and generate intelligent overrides
+        "overrides": _generate_intelligent_overrides(page_name, page_query, design_system)
     }
 
 
 def format_master_md(design_system: dict) -> str:
     """Format design system as MASTER.md with hierarchical override logic."""
-    project = design_system.get("project_name", "PROJECT")
-    pattern = design_system.get("pattern", {})
-    style = design_system.get("style", {})
-    colors = design_system.get("colors", {})
-    typography = design_system.get("typography", {})
-    effects = design_system.get("key_effects", "")
-    anti_patterns = design_system.get("anti_patterns", "")
-    
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    lines = []
-    
-    # Logic header
-    lines.append("# Design System Master File")
-    lines.append("")
-    lines.append("> **LOGIC:** When building a specific page, first check `design-system/pages/[page-name].md`.")
-    lines.append("> If that file exists, its rules **override** this Master file.")
-    lines.append("> If not, strictly follow the rules below.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    lines.append(f"**Project:** {project}")
-    lines.append(f"**Generated:** {timestamp}")
-    lines.append(f"**Category:** {design_system.get('category', 'General')}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    
-    # Global Rules section
-    lines.append("## Global Rules")
-    lines.append("")
-    
-    # Color Palette
-    lines.append("### Color Palette")
-    lines.append("")
-    lines.append("| Role | Hex | CSS Variable |")
-    lines.append("|------|-----|--------------|")
-    lines.append(f"| Primary | `{colors.get('primary', '#2563EB')}` | `--color-primary` |")
-    lines.append(f"| Secondary | `{colors.get('secondary', '#3B82F6')}` | `--color-secondary` |")
-    lines.append(f"| CTA/Accent | `{colors.get('cta', '#F97316')}` | `--color-cta` |")
-    lines.append(f"| Background | `{colors.get('background', '#F8FAFC')}` | `--color-background` |")
-    lines.append(f"| Text | `{colors.get('text', '#1E293B')}` | `--color-text` |")
-    lines.append("")
-    if colors.get("notes"):
-        lines.append(f"**Color Notes:** {colors.get('notes', '')}")
-        lines.append("")
-    
-    # Typography
-    lines.append("### Typography")
-    lines.append("")
-    lines.append(f"- **Heading Font:** {typography.get('heading', 'Inter')}")
-    lines.append(f"- **Body Font:** {typography.get('body', 'Inter')}")
-    if typography.get("mood"):
-        lines.append(f"- **Mood:** {typography.get('mood', '')}")
-    if typography.get("google_fonts_url"):
-        lines.append(f"- **Google Fonts:** [{typography.get('heading', '')} + {typography.get('body', '')}]({typography.get('google_fonts_url', '')})")
-    lines.append("")
-    if typography.get("css_import"):
-        lines.append("**CSS Import:**")
-        lines.append("```css")
-        lines.append(typography.get("css_import", ""))
-        lines.append("```")
-        lines.append("")
-    
-    # Spacing Variables
-    lines.append("### Spacing Variables")
-    lines.append("")
-    lines.append("| Token | Value | Usage |")
-    lines.append("|-------|-------|-------|")
-    lines.append("| `--space-xs` | `4px` / `0.25rem` | Tight gaps |")
-    lines.append("| `--space-sm` | `8px` / `0.5rem` | Icon gaps, inline spacing |")
-    lines.append("| `--space-md` | `16px` / `1rem` | Standard padding |")
-    lines.append("| `--space-lg` | `24px` / `1.5rem` | Section padding |")
-    lines.append("| `--space-xl` | `32px` / `2rem` | Large gaps |")
-    lines.append("| `--space-2xl` | `48px` / `3rem` | Section margins |")
-    lines.append("| `--space-3xl` | `64px` / `4rem` | Hero padding |")
-    lines.append("")
-    
-    # Shadow Depths
-    lines.append("### Shadow Depths")
-    lines.append("")
-    lines.append("| Level | Value | Usage |")
-    lines.append("|-------|-------|-------|")
-    lines.append("| `--shadow-sm` | `0 1px 2px rgba(0,0,0,0.05)` | Subtle lift |")
-    lines.append("| `--shadow-md` | `0 4px 6px rgba(0,0,0,0.1)` | Cards, buttons |")
-    lines.append("| `--shadow-lg` | `0 10px 15px rgba(0,0,0,0.1)` | Modals, dropdowns |")
-    lines.append("| `--shadow-xl` | `0 20px 25px rgba(0,0,0,0.15)` | Hero images, featured cards |")
-    lines.append("")
-    
-    # Component Specs section
-    lines.append("---")
-    lines.append("")
-    lines.append("## Component Specs")
-    lines.append("")
-    
-    # Buttons
-    lines.append("### Buttons")
-    lines.append("")
-    lines.append("```css")
-    lines.append("/* Primary Button */")
-    lines.append(".btn-primary {")
-    lines.append(f"  background: {colors.get('cta', '#F97316')};")
-    lines.append("  color: white;")
-    lines.append("  padding: 12px 24px;")
-    lines.append("  border-radius: 8px;")
-    lines.append("  font-weight: 600;")
-    lines.append("  transition: all 200ms ease;")
-    lines.append("  cursor: pointer;")
-    lines.append("}")
-    lines.append("")
-    lines.append(".btn-primary:hover {")
-    lines.append("  opacity: 0.9;")
-    lines.append("  transform: translateY(-1px);")
-    lines.append("}")
-    lines.append("")
-    lines.append("/* Secondary Button */")
-    lines.append(".btn-secondary {")
-    lines.append(f"  background: transparent;")
-    lines.append(f"  color: {colors.get('primary', '#2563EB')};")
-    lines.append(f"  border: 2px solid {colors.get('primary', '#2563EB')};")
-    lines.append("  padding: 12px 24px;")
-    lines.append("  border-radius: 8px;")
-    lines.append("  font-weight: 600;")
-    lines.append("  transition: all 200ms ease;")
-    lines.append("  cursor: pointer;")
-    lines.append("}")
-    lines.append("```")
-    lines.append("")
-    
-    # Cards
-    lines.append("### Cards")
-    lines.append("")
-    lines.append("```css")
-    lines.append(".card {")
-    lines.append(f"  background: {colors.get('background', '#FFFFFF')};")
-    lines.append("  border-radius: 12px;")
-    lines.append("  padding: 24px;")
-    lines.append("  box-shadow: var(--shadow-md);")
-    lines.append("  transition: all 200ms ease;")
-    lines.append("  cursor: pointer;")
-    lines.append("}")
-    lines.append("")
-    lines.append(".card:hover {")
-    lines.append("  box-shadow: var(--shadow-lg);")
-    lines.append("  transform: translateY(-2px);")
-    lines.append("}")
-    lines.append("```")
-    lines.append("")
-    
-    # Inputs
-    lines.append("### Inputs")
-    lines.append("")
-    lines.append("```css")
-    lines.append(".input {")
-    lines.append("  padding: 12px 16px;")
-    lines.append("  border: 1px solid #E2E8F0;")
-    lines.append("  border-radius: 8px;")
-    lines.append("  font-size: 16px;")
-    lines.append("  transition: border-color 200ms ease;")
-    lines.append("}")
-    lines.append("")
-    lines.append(".input:focus {")
-    lines.append(f"  border-color: {colors.get('primary', '#2563EB')};")
-    lines.append("  outline: none;")
-    lines.append(f"  box-shadow: 0 0 0 3px {colors.get('primary', '#2563EB')}20;")
-    lines.append("}")
-    lines.append("```")
-    lines.append("")
-    
-    # Modals
-    lines.append("### Modals")
-    lines.append("")
-    lines.append("```css")
-    lines.append(".modal-overlay {")
-    lines.append("  background: rgba(0, 0, 0, 0.5);")
-    lines.append("  backdrop-filter: blur(4px);")
-    lines.append("}")
-    lines.append("")
-    lines.append(".modal {")
-    lines.append("  background: white;")
-    lines.append("  border-radius: 16px;")
-    lines.append("  padding: 32px;")
-    lines.append("  box-shadow: var(--shadow-xl);")
-    lines.append("  max-width: 500px;")
-    lines.append("  width: 90%;")
-    lines.append("}")
-    lines.append("```")
-    lines.append("")
-    
-    # Style section
-    lines.append("---")
-    lines.append("")
-    lines.append("## Style Guidelines")
-    lines.append("")
-    lines.append(f"**Style:** {style.get('name', 'Minimalism')}")
-    lines.append("")
-    if style.get("keywords"):
-        lines.append(f"**Keywords:** {style.get('keywords', '')}")
-        lines.append("")
-    if style.get("best_for"):
-        lines.append(f"**Best For:** {style.get('best_for', '')}")
-        lines.append("")
-    if effects:
-        lines.append(f"**Key Effects:** {effects}")
-        lines.append("")
-    
-    # Layout Pattern
-    lines.append("### Page Pattern")
-    lines.append("")
-    lines.append(f"**Pattern Name:** {pattern.get('name', '')}")
-    lines.append("")
-    if pattern.get('conversion'):
-        lines.append(f"- **Conversion Strategy:** {pattern.get('conversion', '')}")
-    if pattern.get('cta_placement'):
-        lines.append(f"- **CTA Placement:** {pattern.get('cta_placement', '')}")
-    lines.append(f"- **Section Order:** {pattern.get('sections', '')}")
-    lines.append("")
-    
-    # Anti-Patterns section
-    lines.append("---")
-    lines.append("")
-    lines.append("## Anti-Patterns (Do NOT Use)")
-    lines.append("")
-    if anti_patterns:
-        anti_list = [a.strip() for a in anti_patterns.split("+")]
-        for anti in anti_list:
-            if anti:
-                lines.append(f"- ❌ {anti}")
-    lines.append("")
-    lines.append("### Additional Forbidden Patterns")
-    lines.append("")
-    lines.append("- ❌ **Emojis as icons** — Use SVG icons (Heroicons, Lucide, Simple Icons)")
-    lines.append("- ❌ **Missing cursor:pointer** — All clickable elements must have cursor:pointer")
-    lines.append("- ❌ **Layout-shifting hovers** — Avoid scale transforms that shift layout")
-    lines.append("- ❌ **Low contrast text** — Maintain 4.5:1 minimum contrast ratio")
-    lines.append("- ❌ **Instant state changes** — Always use transitions (150-300ms)")
-    lines.append("- ❌ **Invisible focus states** — Focus states must be visible for a11y")
-    lines.append("")
-    
-    # Pre-Delivery Checklist
-    lines.append("---")
-    lines.append("")
-    lines.append("## Pre-Delivery Checklist")
-    lines.append("")
-    lines.append("Before delivering any UI code, verify:")
-    lines.append("")
-    lines.append("- [ ] No emojis used as icons (use SVG instead)")
-    lines.append("- [ ] All icons from consistent icon set (Heroicons/Lucide)")
-    lines.append("- [ ] `cursor-pointer` on all clickable elements")
-    lines.append("- [ ] Hover states with smooth transitions (150-300ms)")
-    lines.append("- [ ] Light mode: text contrast 4.5:1 minimum")
-    lines.append("- [ ] Focus states visible for keyboard navigation")
-    lines.append("- [ ] `prefers-reduced-motion` respected")
-    lines.append("- [ ] Responsive: 375px, 768px, 1024px, 1440px")
-    lines.append("- [ ] No content hidden behind fixed navbars")
-    lines.append("- [ ] No horizontal scroll on mobile")
-    lines.append("")
-    
-    return "\n".join(lines)
+    return MASTER_MD_TEMPLATE.render(**_master_context(design_system))
 
 
 def format_page_override_md(design_system: dict, page_name: str, page_query: str = None) -> str:
     """Format a page-specific override file with intelligent AI-generated content."""
-    project = design_system.get("project_name", "PROJECT")
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    page_title = page_name.replace("-", " ").replace("_", " ").title()
-    
-    # Detect page type and generate intelligent overrides
-    page_overrides = _generate_intelligent_overrides(page_name, page_query, design_system)
-    
-    lines = []
-    
-    lines.append(f"# {page_title} Page Overrides")
-    lines.append("")
-    lines.append(f"> **PROJECT:** {project}")
-    lines.append(f"> **Generated:** {timestamp}")
-    lines.append(f"> **Page Type:** {page_overrides.get('page_type', 'General')}")
-    lines.append("")
-    lines.append("> ⚠️ **IMPORTANT:** Rules in this file **override** the Master file (`design-system/MASTER.md`).")
-    lines.append("> Only deviations from the Master are documented here. For all other rules, refer to the Master.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    
-    # Page-specific rules with actual content
-    lines.append("## Page-Specific Rules")
-    lines.append("")
-    
-    # Layout Overrides
-    lines.append("### Layout Overrides")
-    lines.append("")
-    layout = page_overrides.get("layout", {})
-    if layout:
-        for key, value in layout.items():
-            lines.append(f"- **{key}:** {value}")
-    else:
-        lines.append("- No overrides — use Master layout")
-    lines.append("")
-    
-    # Spacing Overrides
-    lines.append("### Spacing Overrides")
-    lines.append("")
-    spacing = page_overrides.get("spacing", {})
-    if spacing:
-        for key, value in spacing.items():
-            lines.append(f"- **{key}:** {value}")
-    else:
-        lines.append("- No overrides — use Master spacing")
-    lines.append("")
-    
-    # Typography Overrides
-    lines.append("### Typography Overrides")
-    lines.append("")
-    typography = page_overrides.get("typography", {})
-    if typography:
-        for key, value in typography.items():
-            lines.append(f"- **{key}:** {value}")
-    else:
-        lines.append("- No overrides — use Master typography")
-    lines.append("")
-    
-    # Color Overrides
-    lines.append("### Color Overrides")
-    lines.append("")
-    colors = page_overrides.get("colors", {})
-    if colors:
-        for key, value in colors.items():
-            lines.append(f"- **{key}:** {value}")
-    else:
-        lines.append("- No overrides — use Master colors")
-    lines.append("")
-    
-    # Component Overrides
-    lines.append("### Component Overrides")
-    lines.append("")
-    components = page_overrides.get("components", [])
-    if components:
-        for comp in components:
-            lines.append(f"- {comp}")
-    else:
-        lines.append("- No overrides — use Master component specs")
-    lines.append("")
-    
-    # Page-Specific Components
-    lines.append("---")
-    lines.append("")
-    lines.append("## Page-Specific Components")
-    lines.append("")
-    unique_components = page_overrides.get("unique_components", [])
-    if unique_components:
-        for comp in unique_components:
-            lines.append(f"- {comp}")
-    else:
-        lines.append("- No unique components for this page")
-    lines.append("")
-    
-    # Recommendations
-    lines.append("---")
-    lines.append("")
-    lines.append("## Recommendations")
-    lines.append("")
-    recommendations = page_overrides.get("recommendations", [])
-    if recommendations:
-        for rec in recommendations:
-            lines.append(f"- {rec}")
-    lines.append("")
-    
-    return "\n".join(lines)
+    return PAGE_OVERRIDE_TEMPLATE.render(**_page_override_context(design_system, page_name, page_query))
 
 
 def _generate_intelligent_overrides(page_name: str, page_query: str, design_system: dict) -> dict:
@@ -1057,11 +1142,20 @@ if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Generate Design System")
-    parser.add_argument("query", help="Search query (e.g., 'SaaS dashboard')")
+    parser.add_argument("query", nargs="?", help="Search query (e.g., 'SaaS dashboard')")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name")
     parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format")
+    parser.add_argument("--manifest", "-m", type=str, default=None, help="JSON manifest of projects/pages to generate and persist in one pass")
+    parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for --manifest (default: manifest output_dir or cwd)")
 
     args = parser.parse_args()
 
-    result = generate_design_system(args.query, args.project_name, args.format)
-    print(result)
+    if args.manifest:
+        for project in generate_from_manifest(args.manifest, args.output_dir):
+            print(f"{project['design_system_dir']}: {len(project['created_files'])} written, "
+                  f"{len(project['unchanged_files'])} unchanged")
+    elif not args.query:
+        parser.error("the following arguments are required: query (or --manifest)")
+    else:
+        result = generate_design_system(args.query, args.project_name, args.format)
+        print(result)
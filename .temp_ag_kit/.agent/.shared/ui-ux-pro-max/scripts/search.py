@@ -5,6 +5,10 @@ UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py "<query>" --all [--domains style color stack:react] [-n 3]
+       python search.py --manifest design-manifest.json [-o <output-dir>]
+       python search.py --batch queries.jsonl [--workers 4] [--backend numpy]   (use "-" for stdin)
+       python search.py --serve [--socket PATH | --stdio]
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
 Stacks: html-tailwind, react, nextjs
@@ -12,11 +16,28 @@ Stacks: html-tailwind, react, nextjs
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+  --manifest   Generate and persist many projects/pages in one pass (see
+               design_system.generate_from_manifest); unchanged files are not rewritten
+
+Batch mode (one process, shared indexes, JSON lines out):
+  --batch      File with one query per line: plain text or a JSON object
+               {"query": ..., "domain": ..., "stack": ..., "max_results": ...}.
+               --domain/--stack/--max-results act as defaults for every line.
+  --backend    numpy scores with a sparse term matrix (same rankings; needs numpy)
+
+Daemon mode (indexes stay warm between queries):
+  --serve      Answer JSON-line requests on a Unix socket (or stdin with --stdio)
+  Regular invocations use a running daemon automatically and fall back to
+  in-process search when none is reachable (--no-daemon forces in-process).
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+import json
+import os
+import sys
+from core import CSV_CONFIG, AVAILABLE_STACKS, BM25_BACKENDS, MAX_RESULTS, search, search_stack, search_batch, search_all
+from daemon import query_daemon, serve_socket, serve_stdio
+# design_system is imported only by the --design-system / --manifest paths to keep plain searches fast to start
 
 
 def format_output(result):
@@ -45,13 +66,41 @@ def format_output(result):
     return "\n".join(output)
 
 
+def read_batch(lines, defaults):
+    """Parse batch input lines (plain queries or JSON objects) into request dicts."""
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if not line.startswith("{"):
+            yield {**defaults, "query": line}
+            continue
+        try:
+            yield {**defaults, **json.loads(line)}
+        except (json.JSONDecodeError, TypeError) as e:
+            print(f"Skipping batch line {lineno}: {e}", file=sys.stderr)
+
+
+def run_batch(source, defaults, workers=1, backend="python"):
+    """Stream one JSON result line per batch request to stdout."""
+    stream = sys.stdin if source == "-" else open(source, "r", encoding="utf-8")
+    try:
+        for result in search_batch(read_batch(stream, defaults), workers, backend):
+            print(json.dumps(result, ensure_ascii=False, default=dict), flush=True)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--all", action="store_true", help="Search every domain and stack in one pass (top --max-results per domain)")
+    parser.add_argument("--domains", nargs="+", default=None, help="With --all: only these domains (stacks as stack:<name>)")
     # Design system generation
     parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
@@ -60,19 +109,64 @@ if __name__ == "__main__":
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    parser.add_argument("--manifest", type=str, default=None, help="JSON manifest of projects/pages to generate and persist in one pass")
+    # Batch mode
+    parser.add_argument("--batch", type=str, default=None, metavar="FILE", help="Run every query in FILE (plain lines or JSONL, '-' for stdin), output JSON lines")
+    parser.add_argument("--workers", type=int, default=1, help="Threads used to score batch queries (default: 1)")
+    parser.add_argument("--backend", choices=list(BM25_BACKENDS), default="python", help="BM25 implementation for batch scoring (numpy needs numpy; see benchmark.py --backend)")
+    # Daemon mode
+    parser.add_argument("--serve", action="store_true", help="Run as a long-lived daemon with all indexes kept warm")
+    parser.add_argument("--stdio", action="store_true", help="With --serve: read JSON-line requests from stdin instead of a socket")
+    parser.add_argument("--socket", type=str, default=None, help="Daemon Unix socket path (default: $UIPRO_SOCKET, $XDG_RUNTIME_DIR or a private per-user temp dir)")
+    parser.add_argument("--no-daemon", action="store_true", help="Always search in-process, even if a daemon is running")
 
     args = parser.parse_args()
 
+    if args.serve:
+        if args.stdio:
+            serve_stdio()
+        else:
+            try:
+                serve_socket(args.socket)
+            except OSError as e:
+                parser.exit(1, f"Error: {e}\n")
+        raise SystemExit(0)
+    if args.manifest:
+        from design_system import generate_from_manifest
+        for project in generate_from_manifest(args.manifest, args.output_dir):
+            print(f"✅ {project['design_system_dir']}: {len(project['created_files'])} written, "
+                  f"{len(project['unchanged_files'])} unchanged")
+        raise SystemExit(0)
+    if args.batch:
+        defaults = {"domain": args.domain, "stack": args.stack, "max_results": args.max_results}
+        try:
+            run_batch(args.batch, defaults, args.workers, args.backend)
+        except ImportError as e:
+            parser.exit(1, f"Error: {e}\n")
+        raise SystemExit(0)
+    if not args.query:
+        parser.error("the following arguments are required: query")
+
+    def run(request, fallback):
+        """Ask a running daemon first, otherwise compute in-process."""
+        response = None if args.no_daemon else query_daemon(request, args.socket)
+        return response if response is not None else fallback()
+
     # Design system takes priority
     if args.design_system:
-        result = generate_design_system(
-            args.query, 
-            args.project_name, 
+        from design_system import generate_design_system
+        output_dir = os.path.abspath(args.output_dir or os.getcwd())
+        request = {"query": args.query, "design_system": True, "project_name": args.project_name, "format": args.format,
+                   "persist": args.persist, "page": args.page, "output_dir": output_dir}
+        response = run(request, lambda: {"output": generate_design_system(
+            args.query,
+            args.project_name,
             args.format,
             persist=args.persist,
             page=args.page,
-            output_dir=args.output_dir
-        )
+            output_dir=output_dir
+        )})
+        result = response.get("output") or f"Error: {response.get('error')}"
         print(result)
         
         # Print persistence confirmation
@@ -88,19 +182,28 @@ if __name__ == "__main__":
             print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
             print(f"   If exists, its rules override MASTER.md. Otherwise, use MASTER.md.")
             print("=" * 60)
+    # Cross-domain search
+    elif args.all:
+        result = search_all(args.query, args.domains, args.max_results)
+        if args.json:
+            print(json.dumps(result, indent=2, ensure_ascii=False, default=dict))
+        elif "error" in result:
+            print(format_output(result))
+        else:
+            print("\n".join(format_output(r) for r in result["domains"].values() if r["count"]))
     # Stack search
     elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
+        request = {"query": args.query, "stack": args.stack, "max_results": args.max_results}
+        result = run(request, lambda: search_stack(args.query, args.stack, args.max_results))
         if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
+            print(json.dumps(result, indent=2, ensure_ascii=False, default=dict))
         else:
             print(format_output(result))
     # Domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
+        request = {"query": args.query, "domain": args.domain, "max_results": args.max_results}
+        result = run(request, lambda: search(args.query, args.domain, args.max_results))
         if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
+            print(json.dumps(result, indent=2, ensure_ascii=False, default=dict))
         else:
             print(format_output(result))
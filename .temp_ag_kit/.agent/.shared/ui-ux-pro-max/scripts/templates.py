@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Templates - tiny line-oriented template engine for design-system output
+
+Templates are compiled on first use into Python generator functions (cached by source)
+that yield output in chunks: consecutive text lines become a single chunk with
+literals pre-joined at compile time, so output can be joined into a string or
+streamed straight to a file. With a line_format callable, every output line is
+yielded (and formatted) separately instead.
+
+Syntax:
+    {{ expr }}                  substitute str(expr)
+    % if cond: / % elif cond: / % else:
+    % for a, b in items:
+    % end                       close the innermost if/for block
+
+Control lines start with "%" in column 0 and produce no output.
+
+Usage:
+    from templates import Template
+    tpl = Template("Hello {{ name }}\\n% for x in items:\\n- {{ x }}\\n% end", ("name", "items"))
+    tpl.render(name="World", items=[1, 2])    # "Hello World\\n- 1\\n- 2"
+    tpl.write("out.md", name="World", items=[])
+"""
+
+import re
+
+
+_EXPR = re.compile(r"\{\{(.*?)\}\}")
+_BLOCK_CONTINUATIONS = ("elif ", "else")
+
+# Compiled render functions, keyed by (source, params, helpers, line_format)
+_COMPILED = {}
+
+
+class TemplateError(ValueError):
+    """Raised when a template cannot be compiled."""
+
+
+def _pieces(line: str) -> list:
+    """Split a text line into ("text", literal) and ("expr", code) pieces."""
+    parts = _EXPR.split(line)
+    return [("expr", part.strip()) if i % 2 else ("text", part) for i, part in enumerate(parts) if i % 2 or part]
+
+
+def _chunk_expr(pieces: list) -> str:
+    """Python expression concatenating pieces, with adjacent literals pre-joined."""
+    merged = []
+    for kind, value in pieces:
+        if kind == "text" and merged and merged[-1][0] == "text":
+            merged[-1] = ("text", merged[-1][1] + value)
+        else:
+            merged.append((kind, value))
+    return " + ".join(repr(value) if kind == "text" else f"_str({value})" for kind, value in merged) or repr("")
+
+
+def _compile(source: str, params: tuple, helpers: dict, line_format):
+    code = ["def _render(" + ", ".join(params) + "):", "    if False:", "        yield ''"]
+    depth = 1
+    pending = []  # consecutive text lines, yielded as one chunk
+
+    def flush():
+        if pending:
+            pieces = []
+            for i, line in enumerate(pending):
+                pieces += ([("text", "\n")] if i else []) + _pieces(line)
+            code.append("    " * depth + f"yield {_chunk_expr(pieces)}")
+            pending.clear()
+
+    for lineno, line in enumerate(source.split("\n"), 1):
+        if not line.startswith("%"):
+            if line_format:
+                code.append("    " * depth + f"yield _fmt({_chunk_expr(_pieces(line))})")
+            else:
+                pending.append(line)
+            continue
+
+        flush()
+        indent = "    " * depth
+        stmt = line[1:].strip()
+        if stmt == "end":
+            depth -= 1
+            if depth < 1:
+                raise TemplateError(f"line {lineno}: unmatched '% end'")
+            continue
+        if stmt.startswith(_BLOCK_CONTINUATIONS):
+            if depth < 2:
+                raise TemplateError(f"line {lineno}: '{stmt}' outside a block")
+            code.append("    " * (depth - 1) + stmt)
+            code.append(indent + "pass")
+            continue
+        if not stmt.endswith(":"):
+            raise TemplateError(f"line {lineno}: control line must open a block: {stmt!r}")
+        code.append(indent + stmt)
+        depth += 1
+        code.append("    " * depth + "pass")
+
+    flush()
+    if depth != 1:
+        raise TemplateError("unclosed block at end of template (missing '% end')")
+
+    namespace = {"_str": str, "_fmt": line_format, **helpers}
+    try:
+        exec(compile("\n".join(code), "<template>", "exec"), namespace)
+    except SyntaxError as e:
+        raise TemplateError(f"invalid expression in template: {e}") from e
+    return namespace["_render"]
+
+
+class Template:
+    """A compiled line-oriented template (see module docstring for syntax)."""
+
+    def __init__(self, source: str, params: tuple, helpers: dict = None, line_format=None):
+        """
+        Args:
+            source: Template text
+            params: Names of the variables passed to render()
+            helpers: Extra names (functions, constants) visible to expressions
+            line_format: Optional callable applied to every output line
+        """
+        self._args = (source, tuple(params), helpers or {}, line_format)
+        self._compiled = None
+
+    @property
+    def _render(self):
+        """Render function, compiled on first use so importing templates stays cheap."""
+        if self._compiled is None:
+            source, params, helpers, line_format = self._args
+            key = (source, params, tuple(sorted((name, id(value)) for name, value in helpers.items())), line_format)
+            if key not in _COMPILED:
+                _COMPILED[key] = _compile(source, params, helpers, line_format)
+            self._compiled = _COMPILED[key]
+        return self._compiled
+
+    def compile(self):
+        """Compile now (raising TemplateError for bad templates) instead of on first render."""
+        self._render
+        return self
+
+    def chunks(self, **context):
+        """Yield rendered output chunks (to be joined with newlines)."""
+        return self._render(**context)
+
+    def render(self, **context) -> str:
+        return "\n".join(self._render(**context))
+
+    def stream(self, write, **context):
+        """Pass rendered text to write() chunk by chunk."""
+        first = True
+        for line in self._render(**context):
+            write(line if first else "\n" + line)
+            first = False
+
+    def write(self, path, **context):
+        """Stream rendered text into a file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            self.stream(f.write, **context)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Check Run History - Antigravity Kit
+===================================
+
+Structured per-check metrics for verify_all.py runs, kept per project so slow
+checks and performance regressions show up over time.
+
+Every run records, for each check: status, duration, the child's peak memory
+(subprocess runs only), files scanned and findings count. The last two are
+read best-effort from the check's own output (its JSON summary, else its text
+summary lines) and are empty when a check reports neither.
+
+Storage (per project, under $XDG_CACHE_HOME/antigravity-kit/verify_all/<id>/):
+    history.jsonl   one JSON run report per line, appended
+    latest.json     the last run report
+    latest.csv      the last run's checks, one row each
+
+Usage (CLI, slowest checks and regressions):
+    python scripts/check_history.py <project_path> [--runs 20] [--top 10]
+"""
+
+import os
+import re
+import csv
+import json
+import hashlib
+import argparse
+import statistics
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+HISTORY_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "antigravity-kit" / "verify_all"
+REPORT_FORMAT = 1
+
+CSV_FIELDS = ["name", "category", "status", "mode", "duration_s", "peak_memory_kb", "files_scanned", "findings"]
+
+# A check is a regression when it is this much slower than its usual run time
+REGRESSION_RATIO = 1.5
+REGRESSION_MIN_SECONDS = 1.0
+
+# JSON summary keys, in order of preference (dotted = nested)
+FILES_KEYS = ("files_checked", "pages_checked", "schemas_checked", "files_scanned", "incremental.files")
+FINDINGS_KEYS = ("issues_found", "total_findings", "summary.total_findings")
+
+FILES_PATTERNS = [
+    re.compile(r'\b(\d+) (?:[\w-]+ ){0,2}files? checked', re.I),
+    re.compile(r'\bAnalyzed (\d+) (?:[\w-]+ )?files', re.I),
+    re.compile(r'\bFound (\d+) (?:[\w/-]+ ){0,2}(?:files|pages)\b', re.I),
+]
+FINDINGS_PATTERNS = [
+    re.compile(r'\b(?:ISSUES|WARNINGS) \((\d+)\)'),
+    re.compile(r'\b(\d+) (?:critical )?issues(?: found)?\b', re.I),
+]
+MARKER_LINE = re.compile(r'^\s*\[(?:X|!)\]', re.M)
+
+
+# ============ METRICS ============
+def _json_summary(output: str) -> Optional[Dict]:
+    """The last top-level JSON object a check printed, if any."""
+    for match in reversed(list(re.finditer(r'^\{', output, re.M))):
+        try:
+            data, _ = json.JSONDecoder().raw_decode(output, match.start())
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            return data
+    return None
+
+
+def _lookup(data: Dict, keys) -> Optional[int]:
+    for key in keys:
+        value = data
+        for part in key.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    return None
+
+
+def parse_metrics(output: str) -> Tuple[Optional[int], Optional[int]]:
+    """(files scanned, findings) reported in a check's output; None where unknown."""
+    if not output:
+        return None, None
+    files = findings = None
+    summary = _json_summary(output)
+    if summary is not None:
+        files, findings = _lookup(summary, FILES_KEYS), _lookup(summary, FINDINGS_KEYS)
+    if files is None:
+        for pattern in FILES_PATTERNS:
+            counts = [int(n) for n in pattern.findall(output)]
+            if counts:
+                files = sum(counts)  # e.g. "Analyzed N TypeScript files" + "... Python files"
+                break
+    if findings is None:
+        for pattern in FINDINGS_PATTERNS:
+            counts = [int(n) for n in pattern.findall(output)]
+            if counts:
+                findings = sum(counts)
+                break
+        else:
+            markers = len(MARKER_LINE.findall(output))
+            findings = markers if markers else None
+    return files, findings
+
+
+def _status(result: Dict) -> str:
+    if result.get("cancelled"):
+        return "cancelled"
+    if result.get("skipped"):
+        return "skipped"
+    return "passed" if result.get("passed") else "failed"
+
+
+def build_report(project_path, results: List[Dict], started: datetime, duration: float, options: Dict) -> Dict:
+    """A run report from verify_all result dicts (see run_script)."""
+    checks = []
+    for r in results:
+        checks.append({
+            "name": r["name"],
+            "category": r.get("category"),
+            "status": _status(r),
+            "mode": r.get("mode"),
+            "duration_s": round(r.get("duration", 0.0), 3),
+            "peak_memory_kb": r.get("peak_memory_kb"),
+            "files_scanned": r.get("files_scanned"),
+            "findings": r.get("findings"),
+        })
+    return {
+        "format": REPORT_FORMAT,
+        "project": str(project_path),
+        "started": started.isoformat(timespec="seconds"),
+        "duration_s": round(duration, 3),
+        "options": options,
+        "checks": checks,
+    }
+
+
+# ============ STORAGE ============
+def history_dir(project_path) -> Path:
+    key = hashlib.sha1(os.path.abspath(project_path).encode("utf-8")).hexdigest()[:16]
+    return HISTORY_DIR / key
+
+
+def write_report(report: Dict, directory: Path):
+    """Write latest.json and latest.csv into directory."""
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / "latest.json", 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    with open(directory / "latest.csv", 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for check in report["checks"]:
+            writer.writerow({k: ("" if check.get(k) is None else check.get(k)) for k in CSV_FIELDS})
+
+
+def record_run(report: Dict, report_dir: Optional[Path] = None) -> Optional[Path]:
+    """
+    Append a run report to the project's history and refresh its latest.*
+    files (and copies in report_dir, if given). Returns the history
+    directory, or None when it could not be written (best effort).
+    """
+    directory = history_dir(report["project"])
+    try:
+        write_report(report, directory)
+        with open(directory / "history.jsonl", 'a', encoding='utf-8') as f:
+            f.write(json.dumps(report) + "\n")
+    except OSError:
+        directory = None
+    if report_dir is not None:
+        write_report(report, Path(report_dir))  # explicitly requested: let errors surface
+    return directory
+
+
+def load_history(project_path, runs: Optional[int] = None) -> List[Dict]:
+    """The project's recorded run reports, oldest first (the last `runs` only)."""
+    reports = []
+    try:
+        with open(history_dir(project_path) / "history.jsonl", 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    report = json.loads(line)
+                except ValueError:
+                    continue  # a torn write from an interrupted run
+                if isinstance(report, dict) and report.get("format") == REPORT_FORMAT:
+                    reports.append(report)
+    except OSError:
+        pass
+    return reports[-runs:] if runs else reports
+
+
+# ============ ANALYSIS ============
+def _durations(reports: List[Dict], key=lambda check: check["name"]) -> Dict:
+    """key(check) -> durations of its completed (not skipped) runs, oldest first."""
+    durations = {}
+    for report in reports:
+        for check in report["checks"]:
+            if check["status"] not in ("skipped", "cancelled"):
+                durations.setdefault(key(check), []).append(check["duration_s"])
+    return durations
+
+
+def slowest_checks(reports: List[Dict], top: int = 10) -> List[Dict]:
+    """Checks ranked by mean duration over the given runs."""
+    rows = []
+    for name, values in _durations(reports).items():
+        rows.append({"name": name, "runs": len(values), "mean_s": statistics.mean(values),
+                     "max_s": max(values), "last_s": values[-1]})
+    rows.sort(key=lambda row: row["mean_s"], reverse=True)
+    return rows[:top]
+
+
+def regressions(reports: List[Dict]) -> List[Dict]:
+    """
+    Checks whose latest run is much slower than the median of their earlier
+    runs. Only runs with the same options (url, isolate, workers) in which the
+    check ran the same way (in-process or subprocess) count as its baseline.
+    """
+    if not reports:
+        return []
+    latest = reports[-1]
+    comparable = [report for report in reports[:-1] if report.get("options") == latest.get("options")]
+    earlier = _durations(comparable, key=lambda check: (check["name"], check.get("mode")))
+    found = []
+    for check in latest["checks"]:
+        baseline = earlier.get((check["name"], check.get("mode")))
+        if check["status"] in ("skipped", "cancelled") or not baseline:
+            continue
+        median = statistics.median(baseline)
+        latest_s = check["duration_s"]
+        if latest_s > median * REGRESSION_RATIO and latest_s - median > REGRESSION_MIN_SECONDS:
+            found.append({"name": check["name"], "latest_s": latest_s, "median_s": median, "runs": len(baseline)})
+    found.sort(key=lambda row: row["latest_s"] - row["median_s"], reverse=True)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the slowest verify_all checks and recent regressions")
+    parser.add_argument("project", nargs="?", default=".", help="Project path")
+    parser.add_argument("--runs", type=int, default=20, help="Only consider the last N runs (default: 20)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest checks to list (default: 10)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    project_path = Path(args.project).resolve()
+    reports = load_history(project_path, args.runs)
+    slow, regressed = slowest_checks(reports, args.top), regressions(reports)
+
+    if args.json:
+        print(json.dumps({"project": str(project_path), "runs": len(reports),
+                          "slowest": slow, "regressions": regressed}, indent=2))
+        return
+    if not reports:
+        print(f"No verify_all runs recorded for {project_path}")
+        return
+
+    print(f"Project: {project_path}")
+    print(f"Runs: {len(reports)} ({reports[0]['started']} .. {reports[-1]['started']})")
+    print(f"\nSLOWEST CHECKS (mean over runs)")
+    print("-" * 60)
+    for row in slow:
+        print(f"  {row['mean_s']:7.2f}s  max {row['max_s']:7.2f}s  last {row['last_s']:7.2f}s  "
+              f"{row['name']} ({row['runs']} runs)")
+    print(f"\nREGRESSIONS (last run vs median of earlier runs with the same options)")
+    print("-" * 60)
+    if not regressed:
+        print("  None")
+    for row in regressed:
+        ratio = f" ({row['latest_s'] / row['median_s']:.1f}x)" if row['median_s'] else ""
+        print(f"  [!] {row['name']}: {row['latest_s']:.2f}s vs {row['median_s']:.2f}s median{ratio}")
+
+
+if __name__ == "__main__":
+    main()
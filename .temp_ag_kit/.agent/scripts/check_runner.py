@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+In-Process Check Runner - Antigravity Kit
+=========================================
+
+Runs skill validation scripts inside the master script's own interpreter, so
+they share one project_index: the project is walked once and every file is
+read (or memory-mapped) once for the whole checklist instead of once per check.
+
+Plugin API:
+    A check script is run in-process when it defines a module-level main()
+    that reads its arguments from sys.argv and reports through stdout/stderr
+    and sys.exit() - the same contract as `python script.py <project> [url]`
+    (returning normally means exit 0). Scripts that read files through
+    project_index.get_index() / read_text() share the run's cache for free.
+    Scripts without main() (logic under `if __name__ == "__main__"` only)
+    are run as subprocesses, as are scripts that set RUN_AS_SUBPROCESS = True
+    (checks whose work is waiting on external tools: linters, test runners,
+    npm audit) and all scripts with the master's --isolate flag.
+
+In-process runs do not swap process-wide state: sys.argv, sys.stdout and
+sys.stderr are replaced once by thread-aware stand-ins, so each check thread
+sees its own arguments and writes to its own capture while other checks run
+concurrently (see run_scheduled) and the rest of the program keeps printing
+to the console. They still share one interpreter lock, and there is no
+per-check timeout, memory limit or cancellation once main() has started
+(use --isolate for those). That is why only pure-Python file auditors should
+run in-process.
+
+Streaming:
+    Both kinds of run hand each output line to an on_line callback as it is
+    written and keep only the last OUTPUT_LIMIT characters of each stream
+    (OutputTail), so a chatty check cannot fill memory. progress() picks out
+    the lines worth showing while a check runs: "[3/10] ...", "42% ...",
+    "Found N ...", "Analyzed N ...", "Scanning ..." and "Checking ...".
+    Subprocess runs can also be cancelled through a threading.Event (e.g.
+    when a sibling's critical check failed) and get a data-segment rlimit of
+    memory_limit_mb, inherited by anything they spawn. Each child leads its
+    own process group, so a cancel or timeout also stops what it spawned
+    (npm, npx, browsers) instead of leaving them holding the output pipes.
+
+Scheduling:
+    run_scheduled() runs checks on a thread pool, started in priority order,
+    and yields each result as it completes. A stop condition (e.g. a failed
+    required check) cancels every check that has not started yet.
+
+Result cache:
+    ResultCache keeps the last result of every check per project, keyed by the
+    check script (and project_index) content, the stat fingerprint of the
+    project files the check reads, and its arguments, so an unchanged check
+    can replay its PASS/FAIL output instead of running again.
+"""
+
+import os
+import re
+import sys
+import errno
+import json
+import time
+import signal
+import shutil
+import hashlib
+import threading
+import subprocess
+import traceback
+import importlib.util
+from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits
+    resource = None
+
+from project_index import get_index
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "antigravity-kit" / "checklist"
+CACHE_FORMAT = 1
+
+# Characters of stdout/stderr kept per check (the tail, where the summary is)
+OUTPUT_LIMIT = 1024 * 1024
+# Default per-check memory limit for subprocess runs (0: unlimited)
+DEFAULT_MEMORY_LIMIT_MB = 4096
+# Seconds a cancelled check gets to exit after SIGTERM before SIGKILL
+TERMINATE_GRACE = 2.0
+_KILL = getattr(signal, "SIGKILL", signal.SIGTERM)  # Windows has no SIGKILL
+
+PROGRESS_LINE = re.compile(
+    r'^\s*(?:\[(?:OK|\*)\]\s*)?(?:\[\d+/\d+\]|\d{1,3}%\s|(?:Found|Analyzed) \d+ |(?:Scanning|Checking)\b)')
+MEMORY_ERROR = re.compile(r'MemoryError|out of memory|Cannot allocate memory|bad_alloc', re.I)
+# Sets the rlimit in a fresh interpreter and execs the check in its place (same
+# pid, so wait4 still reports the check's peak memory). preexec_fn would do it
+# in the forked child, which is not safe while other threads are running.
+_RLIMIT_EXEC = ("import os, resource, sys; "
+                "resource.setrlimit(int(sys.argv[1]), (int(sys.argv[2]), int(sys.argv[3]))); "
+                "os.execv(sys.argv[4], sys.argv[4:])")
+
+# Loaded check modules by resolved script path (None: run it as a subprocess)
+_MODULES = {}
+_LOCK = threading.Lock()  # module loading and installing the thread-aware sys stand-ins
+
+
+def load_check(script_path: Path):
+    """Import a check script once; returns the module, or None if it must run as a subprocess."""
+    key = str(Path(script_path).resolve())
+    with _LOCK:
+        if key not in _MODULES:
+            name = f"_check_{Path(key).stem}"
+            spec = importlib.util.spec_from_file_location(name, key)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module  # so pickling its functions and classes can find the module
+            saved_path = list(sys.path)
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[name]
+                raise
+            finally:
+                sys.path[:] = saved_path  # scripts extend sys.path for their own imports
+            in_process = callable(getattr(module, "main", None)) and not getattr(module, "RUN_AS_SUBPROCESS", False)
+            _MODULES[key] = module if in_process else None
+        return _MODULES[key]
+
+
+def supports_in_process(script_path: Path) -> bool:
+    """True when the script follows the plugin API (see module docstring)."""
+    try:
+        return load_check(script_path) is not None
+    except (Exception, SystemExit):
+        return False  # broken at import time: the subprocess run reports it
+
+
+class OutputTail:
+    """
+    Write-only text sink that passes complete lines to on_line as they
+    arrive and keeps the last `limit` characters (whole lines) in a ring buffer.
+    """
+
+    def __init__(self, limit: int = OUTPUT_LIMIT, on_line: Optional[Callable[[str], None]] = None):
+        self.limit = limit
+        self.on_line = on_line
+        self.lines = deque()
+        self.size = 0
+        self.dropped = 0
+        self.partial = ""
+
+    def write(self, text: str) -> int:
+        data = self.partial + text
+        lines = data.split("\n")
+        self.partial = lines.pop()
+        for line in lines:
+            self._add(line + "\n")
+        if len(self.partial) > self.limit:  # a runaway line without newlines
+            self._add(self.partial)
+            self.partial = ""
+        return len(text)
+
+    def _add(self, line: str):
+        if self.on_line is not None:
+            self.on_line(line)
+        self.lines.append(line)
+        self.size += len(line)
+        while self.size > self.limit and len(self.lines) > 1:
+            self.size -= len(self.lines.popleft())
+            self.dropped += 1
+
+    def flush(self):
+        pass
+
+    def close(self):
+        """Hand over a trailing line without a newline."""
+        if self.partial:
+            self._add(self.partial)
+            self.partial = ""
+
+    def getvalue(self) -> str:
+        head = f"[... {self.dropped} earlier lines dropped ...]\n" if self.dropped else ""
+        return head + "".join(self.lines) + self.partial
+
+
+def progress(line: str) -> Optional[str]:
+    """The line, stripped, if a check printed it to report progress (see module docstring)."""
+    return line.strip() if PROGRESS_LINE.match(line) else None
+
+
+class _ThreadStream:
+    """sys.stdout/stderr stand-in: a thread running an in-process check writes to its OutputTail, others pass through."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def _target(self):
+        tail = getattr(self.local, "tail", None)
+        return self.stream if tail is None else tail
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        return self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+
+class _ThreadArgv(list):
+    """sys.argv stand-in: a thread running an in-process check sees that check's argv, others the real one."""
+
+    def __init__(self, argv):
+        super().__init__(argv)
+        self.local = threading.local()
+
+    def _view(self) -> list:
+        argv = getattr(self.local, "argv", None)
+        return list(super().__iter__()) if argv is None else argv
+
+    def __radd__(self, other):
+        return list(other) + self._view()
+
+
+def _thread_view(name: str):
+    return lambda self, *args: getattr(self._view(), name)(*args)
+
+
+# Every read goes to the calling thread's view: sys.argv[1:], len(), .index("--flag"),
+# iteration, comparisons, concatenation
+for _name in ("__getitem__", "__len__", "__iter__", "__reversed__", "__contains__", "__add__", "__mul__",
+              "__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__", "__repr__", "index", "count", "copy"):
+    setattr(_ThreadArgv, _name, _thread_view(_name))
+del _name
+
+
+def _thread_aware_sys() -> Tuple[_ThreadArgv, _ThreadStream, _ThreadStream]:
+    """Install the per-thread sys.argv/stdout/stderr stand-ins (once; again if someone replaced them)."""
+    with _LOCK:
+        if not isinstance(sys.argv, _ThreadArgv):
+            sys.argv = _ThreadArgv(sys.argv)
+        if not isinstance(sys.stdout, _ThreadStream):
+            sys.stdout = _ThreadStream(sys.stdout)
+        if not isinstance(sys.stderr, _ThreadStream):
+            sys.stderr = _ThreadStream(sys.stderr)
+        return sys.argv, sys.stdout, sys.stderr
+
+
+def _exit_code(code) -> Tuple[int, str]:
+    """Translate a SystemExit code the way the interpreter does."""
+    if code is None:
+        return 0, ""
+    if isinstance(code, int):
+        return code, ""
+    return 1, f"{code}\n"
+
+
+def _cancelled_result() -> Dict:
+    """What a run returns when cancel was set before the check started."""
+    return {"returncode": None, "stdout": "", "stderr": "", "duration": 0.0, "peak_memory_kb": None,
+            "cancelled": True, "memory_exceeded": False}
+
+
+def run_in_process(script_path: Path, args: List[str], on_line: Optional[Callable[[str], None]] = None,
+                   cancel: Optional[threading.Event] = None) -> Dict:
+    """
+    Run a check's main() with sys.argv = [script, *args], passing every
+    output line to on_line as it is written. If cancel is already set once
+    the check is loaded, main() is not started and the result is cancelled.
+
+    Other in-process checks may run at the same time on other threads; the
+    argv and output of this one are private to the calling thread.
+
+    Returns:
+        dict with keys: returncode, stdout, stderr, duration (seconds),
+        peak_memory_kb (None: not measurable per check in a shared process),
+        cancelled
+    """
+    module = load_check(script_path)
+    argv, stdout, stderr = _thread_aware_sys()
+    if cancel is not None and cancel.is_set():  # e.g. a sibling failed while this one waited for the lock
+        return _cancelled_result()
+    out, err = OutputTail(on_line=on_line), OutputTail(on_line=on_line)
+    start = time.perf_counter()
+    argv.local.argv = [str(script_path)] + list(args)
+    stdout.local.tail, stderr.local.tail = out, err
+    try:
+        module.main()
+        code, message = 0, ""
+    except SystemExit as e:
+        code, message = _exit_code(e.code)
+    except Exception:
+        traceback.print_exc()
+        code, message = 1, ""
+    finally:
+        argv.local.argv = stdout.local.tail = stderr.local.tail = None
+    out.close()
+    err.close()
+    return {"returncode": code, "stdout": out.getvalue(), "stderr": err.getvalue() + message,
+            "duration": time.perf_counter() - start, "peak_memory_kb": None, "cancelled": False}
+
+
+# ============ SUBPROCESS RUNS ============
+def _maxrss_kb(rusage) -> int:
+    # ru_maxrss is in kilobytes on Linux but in bytes on macOS
+    return rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+
+
+def _memory_limiter(limit_mb: int):
+    """The rlimit to cap a child's memory with: (resource, (soft, hard)), or None."""
+    if resource is None or not limit_mb:
+        return None
+    # RLIMIT_DATA counts heap and private writable mappings but not address
+    # space merely reserved (which Node/V8 does by the gigabyte); RLIMIT_AS
+    # is the fallback where it does not exist
+    which = getattr(resource, "RLIMIT_DATA", None) or resource.RLIMIT_AS
+    limit = limit_mb * 1024 * 1024
+    _, hard = resource.getrlimit(which)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    return which, (limit, hard)
+
+
+def _reap(proc: subprocess.Popen, block: bool = False) -> Tuple[bool, Optional[int]]:
+    """(exited, peak memory in KB) - wait4 reaps the child and returns its rusage in one call."""
+    if hasattr(os, "wait4"):
+        pid, status, rusage = os.wait4(proc.pid, 0 if block else os.WNOHANG)
+        if not pid:
+            return False, None
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        return True, _maxrss_kb(rusage)
+    if block:
+        proc.wait()
+    return proc.poll() is not None, None
+
+
+def _signal_group(proc: subprocess.Popen, sig: int):
+    """Send sig to the child's whole process group (just the child without killpg)."""
+    if not hasattr(os, "killpg"):
+        proc.send_signal(sig)
+        return
+    try:
+        os.killpg(proc.pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass  # the group is already gone
+
+
+def _terminate(proc: subprocess.Popen) -> Optional[int]:
+    """SIGTERM the child's group, SIGKILL it after TERMINATE_GRACE; returns the peak memory."""
+    _signal_group(proc, signal.SIGTERM)
+    deadline = time.perf_counter() + TERMINATE_GRACE
+    peak = None
+    while time.perf_counter() < deadline:
+        exited, peak = _reap(proc)
+        if exited:
+            break
+        time.sleep(0.05)
+    _signal_group(proc, _KILL)  # stragglers
+    if proc.returncode is None:
+        peak = _reap(proc, block=True)[1]
+    return peak
+
+
+def run_subprocess(cmd: List[str], timeout: Optional[float] = None,
+                   on_line: Optional[Callable[[str], None]] = None,
+                   cancel: Optional[threading.Event] = None,
+                   memory_limit_mb: int = 0) -> Dict:
+    """
+    Run cmd with its output streamed to on_line (line by line) and to a
+    bounded OutputTail per stream.
+
+    Args:
+        timeout: Seconds before the child is killed (TimeoutExpired)
+        cancel: Terminates the child as soon as it is set
+        memory_limit_mb: Data-segment rlimit for the child (0: none)
+
+    Returns:
+        dict with keys: returncode, stdout, stderr, duration, peak_memory_kb
+        (None where wait4 is missing), cancelled, memory_exceeded
+    Raises:
+        subprocess.TimeoutExpired after killing the child
+    """
+    if cancel is not None and cancel.is_set():
+        return _cancelled_result()  # never start a check that is already cancelled
+    start = time.perf_counter()
+    limiter = _memory_limiter(memory_limit_mb)
+    if limiter is not None:
+        executable = shutil.which(cmd[0])
+        if executable is None:  # fail here, as Popen would, not inside the wrapper
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), cmd[0])
+        which, (soft, hard) = limiter
+        cmd = [sys.executable, "-c", _RLIMIT_EXEC, str(which), str(soft), str(hard), executable, *cmd[1:]]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                            errors="replace", bufsize=1, start_new_session=True)
+
+    tails = {"stdout": OutputTail(on_line=on_line), "stderr": OutputTail(on_line=on_line)}
+
+    def pump(pipe, tail):
+        for line in pipe:
+            tail.write(line)
+        tail.close()
+
+    readers = [threading.Thread(target=pump, args=(proc.stdout, tails["stdout"]), daemon=True),
+               threading.Thread(target=pump, args=(proc.stderr, tails["stderr"]), daemon=True)]
+    for reader in readers:
+        reader.start()
+
+    # Poll instead of Popen.wait() so a timeout or cancellation stops the wait
+    deadline = None if timeout is None else start + timeout
+    delay = 0.005
+    cancelled = False
+    while True:
+        exited, peak = _reap(proc)
+        if exited:
+            break
+        if cancel is not None and cancel.is_set():
+            peak = _terminate(proc)
+            cancelled = True
+            break
+        if deadline is not None and time.perf_counter() >= deadline:
+            _signal_group(proc, _KILL)
+            _reap(proc, block=True)
+            for reader in readers:
+                reader.join(TERMINATE_GRACE)  # a child that left the group may still hold a pipe
+            raise subprocess.TimeoutExpired(cmd, timeout, tails["stdout"].getvalue(), tails["stderr"].getvalue())
+        if cancel is not None:
+            cancel.wait(delay)
+        else:
+            time.sleep(delay)
+        delay = min(delay * 2, 0.1)
+    for reader in readers:
+        reader.join(TERMINATE_GRACE if cancelled else None)
+    stderr = tails["stderr"].getvalue()
+    return {"returncode": proc.returncode, "stdout": tails["stdout"].getvalue(), "stderr": stderr,
+            "duration": time.perf_counter() - start, "peak_memory_kb": peak, "cancelled": cancelled,
+            "memory_exceeded": bool(limiter and proc.returncode and MEMORY_ERROR.search(stderr))}
+
+
+_OUTPUT_LOCK = threading.Lock()
+
+
+def emit(text: str = ""):
+    """
+    print() for progress lines that may come from several check threads at
+    once, including from inside an in-process check (past its capture).
+    """
+    stream = sys.stdout
+    while isinstance(stream, _ThreadStream):
+        stream = stream.stream
+    with _OUTPUT_LOCK:
+        stream.write(text + "\n")
+        stream.flush()
+
+
+def run_scheduled(jobs: Sequence[Callable[[], Dict]], workers: int = 1,
+                  stop: Optional[Callable[[int, Dict], bool]] = None) -> Iterator[Tuple[int, Dict]]:
+    """
+    Run jobs on up to `workers` threads, yielding (position, result) as each completes.
+
+    Jobs start in list order and at most `workers` are in flight, so workers=1
+    is exactly a sequential run. Once stop(position, result) returns True, no
+    further job is started; jobs already running finish and are still yielded.
+    """
+    workers = max(1, workers)
+    queue = iter(enumerate(jobs))
+    running = {}
+    stopped = False
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            while not stopped and len(running) < workers:
+                item = next(queue, None)
+                if item is None:
+                    break
+                running[pool.submit(item[1])] = item[0]
+            if not running:
+                return
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=running.get):
+                position = running.pop(future)
+                result = future.result()
+                yield position, result
+                if stop is not None and stop(position, result):
+                    stopped = True
+
+
+# ============ RESULT CACHE ============
+def _file_digest(path: Path) -> str:
+    try:
+        return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def fileset_digest(project_path, extensions: Optional[Tuple[str, ...]] = None) -> str:
+    """
+    Fingerprint of the project files (path, size, mtime) with the given
+    extensions, or of all of them. Git-ignored files count (.env files
+    matter to the security scan); pruned dependency directories do not.
+    .gitignore files always count: checks that read through a gitignore-aware
+    index see a different file set when they change.
+    """
+    exts = tuple(e.lower() for e in extensions) if extensions else None
+    digest = hashlib.sha1()
+    for _, parts, st in get_index(project_path, gitignore=False).entries:
+        if exts is None or parts[-1].lower().endswith(exts) or parts[-1] == ".gitignore":
+            digest.update(f"{'/'.join(parts)}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Last result of each check for one project, persisted between runs. An
+    entry is replayed only while its key (script hash, input file-set hash
+    and arguments) is unchanged.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("format") == CACHE_FORMAT:
+                self.entries = data.get("checks", {})
+        except (OSError, ValueError, AttributeError):
+            pass  # missing or corrupt cache: start empty
+
+    @classmethod
+    def for_project(cls, project_path) -> "ResultCache":
+        key = hashlib.sha1(os.path.abspath(project_path).encode("utf-8")).hexdigest()[:16]
+        return cls(CACHE_DIR / f"{key}.json")
+
+    @staticmethod
+    def key(script_path: Path, project_path, args: Sequence[str],
+            extensions: Optional[Tuple[str, ...]] = None) -> str:
+        """Cache key for running script_path with args over the project's files."""
+        parts = [
+            _file_digest(script_path),
+            _file_digest(Path(__file__).with_name("project_index.py")),  # shapes every check's file set
+            fileset_digest(project_path, extensions),
+            json.dumps(list(args)),
+        ]
+        return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, name: str, key: str) -> Optional[Dict]:
+        entry = self.entries.get(name)
+        if entry is not None and entry.get("key") == key:
+            return dict(entry["result"])
+        return None
+
+    def put(self, name: str, key: str, result: Dict):
+        self.entries[name] = {"key": key, "result": result}
+
+    def save(self):
+        """Write the cache atomically (best effort)."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({"format": CACHE_FORMAT, "checks": self.entries}, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # caching is best effort; the results are still valid
@@ -9,6 +9,23 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --isolate          # One subprocess per check
+    python scripts/checklist.py . --workers 1        # Run checks one at a time
+    python scripts/checklist.py . --no-cache         # Re-run checks even if unchanged
+
+Checks that support it run in-process and share one file index and content
+cache (see check_runner.py); the rest, and all checks with --isolate, run as
+subprocesses. Independent checks run concurrently (--workers, default: CPU
+count) and report as they finish; a failing required check cancels every
+check that has not started yet and stops those running as subprocesses.
+Progress lines are shown while checks run, only the tail of each check's
+output is kept, and subprocess checks run under a memory limit
+(--memory-limit MB).
+
+Core check results are cached per project: a check whose script, arguments
+and input files (see CHECK_INPUTS) are unchanged since its last run replays
+its PASS/FAIL output instead of running again (--no-cache forces a run).
+Checks that consult live data (see LIVE_CHECKS) always run.
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -20,12 +37,17 @@ Priority Order:
     P6: Performance (lighthouse - requires URL)
 """
 
+import os
 import sys
+import threading
 import subprocess
 import argparse
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+from check_runner import (DEFAULT_MEMORY_LIMIT_MB, ResultCache, emit, progress, run_in_process, run_scheduled,
+                          run_subprocess, supports_in_process)
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -43,16 +65,16 @@ def print_header(text: str):
     print(f"{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.ENDC}\n")
 
 def print_step(text: str):
-    print(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
+    emit(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
 
 def print_success(text: str):
-    print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
+    emit(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
 
 def print_warning(text: str):
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
+    emit(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
 
 def print_error(text: str):
-    print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
+    emit(f"{Colors.RED}❌ {text}{Colors.ENDC}")
 
 # Define priority-ordered checks
 CORE_CHECKS = [
@@ -64,6 +86,20 @@ CORE_CHECKS = [
     ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False),
 ]
 
+# File types a core check reads, so changes to other files keep its cached result.
+# Checks not listed depend on the whole project.
+CHECK_INPUTS = {
+    "Schema Validation": ('.prisma', '.ts'),
+    "UX Audit": ('.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'),
+    "SEO Check": ('.html', '.htm', '.jsx', '.tsx'),
+}
+
+# Checks whose result can change with no change to the hashed files, so a cached
+# result is never replayed: npm audit queries the live advisory database, and
+# linters and test runners depend on installed packages (node_modules, virtualenvs,
+# pruned from the digest) and on toolchain versions.
+LIVE_CHECKS = {"Security Scan", "Lint Check", "Test Runner"}
+
 PERFORMANCE_CHECKS = [
     ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True),
     ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False),
@@ -73,9 +109,14 @@ def check_script_exists(script_path: Path) -> bool:
     """Check if script file exists"""
     return script_path.exists() and script_path.is_file()
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               isolate: bool = False, cancel: Optional[threading.Event] = None,
+               memory_limit_mb: int = DEFAULT_MEMORY_LIMIT_MB) -> dict:
     """
-    Run a validation script and capture results
+    Run a validation script and capture results (in-process unless isolate
+    is set or the script does not support it). Progress lines are shown as
+    the script prints them; setting cancel stops a subprocess run and keeps
+    a check that has not started yet from starting.
     
     Returns:
         dict with keys: name, passed, output, skipped
@@ -83,9 +124,17 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     if not check_script_exists(script_path):
         print_warning(f"{name}: Script not found, skipping")
         return {"name": name, "passed": True, "output": "", "skipped": True}
+    if cancel is not None and cancel.is_set():  # queued before a required check failed
+        print_warning(f"{name}: CANCELLED")
+        return {"name": name, "passed": False, "output": "", "skipped": True, "cancelled": True}
     
     print_step(f"Running: {name}")
     
+    def show_progress(line):
+        text = progress(line)
+        if text:
+            emit(f"   ↳ {name}: {text}")
+    
     # Build command
     cmd = ["python", str(script_path), project_path]
     if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
@@ -93,28 +142,33 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     
     # Run script
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+        if not isolate and supports_in_process(script_path):
+            result = run_in_process(script_path, cmd[2:], on_line=show_progress, cancel=cancel)
+        else:
+            result = run_subprocess(cmd, timeout=300, on_line=show_progress,  # 5 minute timeout
+                                    cancel=cancel, memory_limit_mb=memory_limit_mb)
         
-        passed = result.returncode == 0
+        if result.get("cancelled"):
+            print_warning(f"{name}: CANCELLED")
+            return {"name": name, "passed": False, "output": result["stdout"], "error": result["stderr"],
+                    "skipped": True, "cancelled": True}
+        
+        passed = result["returncode"] == 0
         
         if passed:
             print_success(f"{name}: PASSED")
         else:
-            print_error(f"{name}: FAILED")
-            if result.stderr:
-                print(f"  Error: {result.stderr[:200]}")
+            print_error(f"{name}: FAILED" + (f" (over {memory_limit_mb} MB memory limit)" if result.get("memory_exceeded") else ""))
+            if result["stderr"]:
+                emit(f"  Error: {result['stderr'][:200]}")
         
         return {
             "name": name,
             "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
-            "skipped": False
+            "output": result["stdout"],
+            "error": result["stderr"],
+            "skipped": False,
+            "returncode": result["returncode"]
         }
     
     except subprocess.TimeoutExpired:
@@ -125,6 +179,18 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
         print_error(f"{name}: ERROR - {str(e)}")
         return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False}
 
+def replay_result(result: dict) -> dict:
+    """Report a cached result the way run_script reports a fresh one"""
+    name = result["name"]
+    if result["passed"]:
+        print_success(f"{name}: PASSED (cached)")
+    else:
+        print_error(f"{name}: FAILED (cached)")
+        if result.get("error"):
+            emit(f"  Error: {result['error'][:200]}")
+    result["cached"] = True
+    return result
+
 def print_summary(results: List[dict]):
     """Print final summary report"""
     print_header("📊 CHECKLIST SUMMARY")
@@ -148,7 +214,7 @@ def print_summary(results: List[dict]):
         else:
             status = f"{Colors.RED}❌{Colors.ENDC}"
         
-        print(f"{status} {r['name']}")
+        print(f"{status} {r['name']}" + (" (cached)" if r.get("cached") else ""))
     
     print()
     
@@ -172,6 +238,11 @@ Examples:
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--isolate", action="store_true", help="Run every check in its own subprocess (no shared file cache)")
+    parser.add_argument("--memory-limit", type=int, default=DEFAULT_MEMORY_LIMIT_MB, metavar="MB",
+                        help=f"Memory limit per subprocess check (default: {DEFAULT_MEMORY_LIMIT_MB}, 0: none)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Checks run at the same time (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Run every check even if nothing it depends on changed")
     
     args = parser.parse_args()
     
@@ -185,28 +256,54 @@ Examples:
     print(f"Project: {project_path}")
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
     
-    results = []
+    # Core checks first, then performance checks if URL provided (priority order)
+    checks = [(name, script_path, required, None) for name, script_path, required in CORE_CHECKS]
+    if args.url and not args.skip_performance:
+        checks += [(name, script_path, False, args.url) for name, script_path, required in PERFORMANCE_CHECKS]
+    
+    cache = ResultCache.for_project(project_path)
+    cancel = threading.Event()  # set when a required check fails: stops running subprocess checks
+    options = {"isolate": args.isolate, "cancel": cancel, "memory_limit_mb": args.memory_limit}
     
-    # Run core checks
-    print_header("📋 CORE CHECKS")
-    for name, script_path, required in CORE_CHECKS:
+    def job(name, script_path, url):
         script = project_path / script_path
-        result = run_script(name, script, str(project_path))
-        results.append(result)
+        if url is not None or name in LIVE_CHECKS or not script.is_file():
+            # Performance checks measure a live URL; never replay them
+            return lambda: run_script(name, script, str(project_path), url, **options)
+        
+        key = ResultCache.key(script, project_path, [str(project_path)], CHECK_INPUTS.get(name))
+        cached = None if args.no_cache else cache.get(name, key)
+        if cached is not None:
+            return lambda: replay_result(cached)
         
-        # If required check fails, stop
-        if required and not result["passed"] and not result.get("skipped"):
-            print_error(f"CRITICAL: {name} failed. Stopping checklist.")
-            print_summary(results)
-            sys.exit(1)
+        def run():
+            result = run_script(name, script, str(project_path), **options)
+            if "returncode" in result:  # ran to completion (no timeout or crash)
+                cache.put(name, key, result)
+            return result
+        return run
     
-    # Run performance checks if URL provided
-    if args.url and not args.skip_performance:
-        print_header("⚡ PERFORMANCE CHECKS")
-        for name, script_path, required in PERFORMANCE_CHECKS:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            results.append(result)
+    def critical_failure(position, result):
+        # A failed required check cancels everything not started yet, and stops
+        # checks still running in subprocesses
+        return checks[position][2] and not result["passed"] and not result.get("skipped")
+    
+    print_header("📋 CORE + ⚡ PERFORMANCE CHECKS" if len(checks) > len(CORE_CHECKS) else "📋 CORE CHECKS")
+    finished = {}
+    stopped = None
+    jobs = [job(name, script_path, url) for name, script_path, required, url in checks]
+    for position, result in run_scheduled(jobs, args.workers, critical_failure):
+        finished[position] = result
+        if stopped is None and critical_failure(position, result):
+            stopped = result["name"]
+            cancel.set()
+    results = [finished[position] for position in sorted(finished)]
+    cache.save()
+    
+    if stopped:
+        print_error(f"CRITICAL: {stopped} failed. Stopping checklist.")
+        print_summary(results)
+        sys.exit(1)
     
     # Print summary
     all_passed = print_summary(results)
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Project File Index - Antigravity Kit
+====================================
+
+Shared, pruned view of a project's files for the skill audit scripts.
+
+The project tree is walked once per run: dependency/build directories are
+pruned during traversal (never descended into), .gitignore rules are honoured,
+and every file's stat result is kept from the walk. Checkers then filter the
+cached list by extension, glob pattern and their own extra skip directories
+instead of running Path.rglob over node_modules themselves.
+
+Decoded file text is cached too (read_text; large files are decoded straight
+from a memory map), so checkers run in one process by the master checklist
+read each file once. The cache keeps only the text, not the raw bytes, and is
+bounded (TEXT_CACHE_LIMIT, least recently used text evicted first).
+
+Usage (from a skill script):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+    from project_index import get_index
+
+    index = get_index(project_path)
+    pages = index.files(('.html', '.jsx', '.tsx'), skip_dirs={'docs', 'tests'})
+    locales = index.glob('**/locales/**/*.json')
+    content = read_text(pages[0], errors='ignore')
+
+Usage (CLI, lists the indexed files):
+    python scripts/project_index.py <project_path> [--ext .tsx .ts] [--no-gitignore]
+"""
+
+import os
+import re
+import sys
+import mmap
+import argparse
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+# Directories that never hold project sources; pruned for every checker
+SKIP_DIRS = frozenset({
+    'node_modules', '.git', '.hg', '.svn', '__pycache__',
+    '.next', '.nuxt', '.svelte-kit', '.turbo', '.cache', 'dist', 'build',
+    'venv', '.venv', '.tox', '.mypy_cache', '.pytest_cache', 'coverage',
+})
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_MIN_BYTES = 1024 * 1024
+# Characters of decoded text kept in the content cache (about as many bytes for ASCII sources)
+TEXT_CACHE_LIMIT = 256 * 1024 * 1024
+
+# Indexes built this run, keyed by (resolved root, honour .gitignore)
+_INDEXES = {}
+_INDEX_LOCK = threading.Lock()  # checks running concurrently share one walk
+# Decoded file text, (path, errors) -> str, least recently used first
+_TEXTS = OrderedDict()
+_TEXTS_SIZE = 0
+_TEXTS_LOCK = threading.Lock()
+
+
+# ============ GITIGNORE ============
+def _translate(pattern: str) -> str:
+    """Translate a gitignore/glob pattern (with ** support) to a regex body."""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern.startswith('**', i):
+                i += 2
+                if i < n and pattern[i] == '/':
+                    out.append('(?:.*/)?')  # "**/" matches zero or more directories
+                    i += 1
+                else:
+                    out.append('.*')
+                continue
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            end = pattern.find(']', i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                out.append('[' + body.replace('\\', '\\\\') + ']')
+                i = end
+        elif c == '\\' and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return ''.join(out)
+
+
+class GitIgnore:
+    """The rules of one .gitignore file, matched relative to its directory."""
+
+    def __init__(self, lines: Iterable[str]):
+        self.rules = []  # (regex, negated, dir_only, match_basename)
+        for line in lines:
+            line = line.rstrip('\n').rstrip('\r')
+            if not line.strip() or line.startswith('#'):
+                continue
+            if not line.endswith('\\ '):  # trailing spaces count only when escaped
+                line = line.rstrip()
+            negated = line.startswith('!')
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+            if not line:
+                continue
+            # A slash anywhere but the end anchors the pattern to this directory
+            anchored = '/' in line
+            line = line.lstrip('/')
+            self.rules.append((re.compile(_translate(line) + r'\Z', re.S), negated, dir_only, not anchored))
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['GitIgnore']:
+        try:
+            rules = cls(path.read_text(encoding='utf-8', errors='ignore').splitlines())
+        except OSError:
+            return None
+        return rules if rules.rules else None
+
+    def match(self, rel: str, name: str, is_dir: bool) -> Optional[bool]:
+        """True (ignored), False (re-included by "!") or None when no rule applies."""
+        result = None
+        for regex, negated, dir_only, basename in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(name if basename else rel):
+                result = not negated
+        return result
+
+
+# ============ INDEX ============
+class ProjectIndex:
+    """One pruned walk of a project tree, with per-file stat results."""
+
+    def __init__(self, root, skip_dirs: Iterable[str] = SKIP_DIRS, gitignore: bool = True):
+        self.root = Path(root).resolve()
+        self.skip_dirs = frozenset(skip_dirs)
+        self.gitignore = gitignore
+        self._entries = None   # [(path, rel parts, stat)] in sorted walk order
+        self._stats = {}       # path -> os.stat_result
+        self._queries = {}     # memoised files()/glob() results
+
+    def _walk(self) -> List[Tuple[Path, Tuple[str, ...], os.stat_result]]:
+        entries = []
+        # Stack of (directory, rel parts, active .gitignore rules with their base parts)
+        stack = [(self.root, (), ())]
+        while stack:
+            directory, parts, rules = stack.pop()
+            if self.gitignore:
+                own = GitIgnore.load(directory / '.gitignore')
+                if own:
+                    rules = rules + ((own, len(parts)),)
+            try:
+                with os.scandir(directory) as it:
+                    children = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+            subdirs = []
+            for entry in children:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if not is_dir and not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                if is_dir and entry.name in self.skip_dirs:
+                    continue
+                child_parts = parts + (entry.name,)
+                if rules and self._ignored(rules, child_parts, is_dir):
+                    continue
+                if is_dir:
+                    subdirs.append((Path(entry.path), child_parts, rules))
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                path = Path(entry.path)
+                entries.append((path, child_parts, st))
+                self._stats[path] = st
+            stack.extend(reversed(subdirs))
+        return entries
+
+    @staticmethod
+    def _ignored(rules, parts: Tuple[str, ...], is_dir: bool) -> bool:
+        ignored = False
+        for rule, base in rules:  # outer .gitignore first, so deeper files win
+            verdict = rule.match('/'.join(parts[base:]), parts[-1], is_dir)
+            if verdict is not None:
+                ignored = verdict
+        return ignored
+
+    @property
+    def entries(self) -> List[Tuple[Path, Tuple[str, ...], os.stat_result]]:
+        if self._entries is None:
+            self._entries = self._walk()
+        return self._entries
+
+    def files(self, extensions: Optional[Iterable[str]] = None, skip_dirs: Iterable[str] = ()) -> List[Path]:
+        """
+        Files in walk order, optionally limited to some extensions.
+
+        Args:
+            extensions: Suffixes such as '.tsx' (case-insensitive); compound
+                suffixes like '.d.ts' also work. None means every file.
+            skip_dirs: Extra directory names (anywhere below the root) to leave out.
+        """
+        exts = tuple(sorted(e.lower() for e in extensions)) if extensions is not None else None
+        skip = frozenset(skip_dirs)
+        key = ('files', exts, skip)
+        if key not in self._queries:
+            self._queries[key] = [
+                path for path, parts, _ in self.entries
+                if (exts is None or parts[-1].lower().endswith(exts))
+                and not (skip and skip.intersection(parts[:-1]))
+            ]
+        return self._queries[key]
+
+    def glob(self, *patterns: str, skip_dirs: Iterable[str] = ()) -> List[Path]:
+        """Files whose root-relative path matches any glob pattern ('**/' = any depth)."""
+        skip = frozenset(skip_dirs)
+        key = ('glob', patterns, skip)
+        if key not in self._queries:
+            regex = re.compile('|'.join(f'(?:{_translate(p)})' for p in patterns) + r'\Z', re.S)
+            self._queries[key] = [
+                path for path, parts, _ in self.entries
+                if regex.match('/'.join(parts)) and not (skip and skip.intersection(parts[:-1]))
+            ]
+        return self._queries[key]
+
+    def stat(self, path) -> os.stat_result:
+        """Stat result from the walk (falls back to os.stat for files outside it)."""
+        path = Path(path)
+        st = self._stats.get(path)
+        if st is None:
+            self.entries
+            st = self._stats.get(path)
+            if st is None:
+                st = self._stats[path] = path.stat()
+        return st
+
+    def size(self, path) -> int:
+        return self.stat(path).st_size
+
+    def relative(self, path) -> str:
+        """Root-relative POSIX path of an indexed file."""
+        return Path(path).relative_to(self.root).as_posix()
+
+
+def get_index(root, gitignore: bool = True) -> ProjectIndex:
+    """The shared index for a project root, walked at most once per run."""
+    key = (str(Path(root).resolve()), gitignore)
+    with _INDEX_LOCK:
+        if key not in _INDEXES:
+            _INDEXES[key] = ProjectIndex(key[0], gitignore=gitignore)
+        return _INDEXES[key]
+
+
+def clear_cache():
+    """Forget every index and cached file content (e.g. after the tree was modified)."""
+    global _TEXTS_SIZE
+    _INDEXES.clear()
+    with _TEXTS_LOCK:
+        _TEXTS.clear()
+        _TEXTS_SIZE = 0
+
+
+# ============ CONTENT CACHE ============
+def read_bytes(path):
+    """
+    Raw file content (not cached: read_text caches the decoded text).
+
+    Files of MMAP_MIN_BYTES or more come back as a read-only mmap (which
+    supports slicing, len() and bytes()) instead of a copy in memory.
+    Raises OSError like open() would.
+    """
+    with open(os.fspath(path), 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_MIN_BYTES:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return f.read()
+
+
+def _cache_text(key, text: str):
+    global _TEXTS_SIZE
+    if len(text) > TEXT_CACHE_LIMIT // 4:
+        return  # one huge file would evict everything else
+    with _TEXTS_LOCK:
+        if key in _TEXTS:
+            return
+        _TEXTS[key] = text
+        _TEXTS_SIZE += len(text)
+        while _TEXTS_SIZE > TEXT_CACHE_LIMIT:
+            _, evicted = _TEXTS.popitem(last=False)
+            _TEXTS_SIZE -= len(evicted)
+
+
+def read_text(path, errors: str = 'strict') -> str:
+    """
+    UTF-8 file text as open(path, encoding='utf-8', errors=errors).read()
+    returns it (universal newlines), decoded once per run and errors mode
+    while it stays in the bounded cache.
+    """
+    key = (os.fspath(path), errors)
+    with _TEXTS_LOCK:
+        text = _TEXTS.get(key)
+        if text is not None:
+            _TEXTS.move_to_end(key)
+            return text
+    data = read_bytes(path)
+    try:
+        text = str(data, 'utf-8', errors)  # decodes an mmap without copying it first
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    _cache_text(key, text)
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List the files the audit scripts would index")
+    parser.add_argument("project", nargs="?", default=".", help="Project path")
+    parser.add_argument("--ext", nargs="+", default=None, help="Only these extensions (e.g. .ts .tsx)")
+    parser.add_argument("--no-gitignore", action="store_true", help="Do not apply .gitignore rules")
+    args = parser.parse_args()
+
+    index = get_index(args.project, gitignore=not args.no_gitignore)
+    files = index.files(args.ext)
+    for path in files:
+        print(index.relative(path))
+    print(f"{len(files)} files", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
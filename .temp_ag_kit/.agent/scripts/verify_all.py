@@ -8,6 +8,23 @@ Use this before deployment or major releases.
 
 Usage:
     python scripts/verify_all.py . --url <URL>
+    python scripts/verify_all.py . --url <URL> --isolate   # One subprocess per check
+    python scripts/verify_all.py . --url <URL> --workers 1 # One check at a time
+    python scripts/verify_all.py . --url <URL> --report-dir reports/  # Also write the run report there
+    python scripts/check_history.py .                      # Slowest checks and regressions over time
+
+Checks that support it run in-process and share one file index and content
+cache (see check_runner.py); the rest, and all checks with --isolate, run as
+subprocesses. Independent checks run concurrently across categories
+(--workers, default: CPU count) and report as they finish; with
+--stop-on-fail a failing critical check cancels checks not started yet and
+stops those running as subprocesses. Progress lines are shown while checks
+run, only the tail of each check's output is kept, and subprocess checks run
+under a memory limit (--memory-limit MB).
+
+Every run writes a JSON/CSV report (duration, child peak memory, files scanned
+and findings per check) and appends it to the project's run history (see
+check_history.py).
 
 Includes ALL checks:
     ✅ Security Scan (OWASP, secrets, dependencies)
@@ -22,13 +39,20 @@ Includes ALL checks:
     ✅ Mobile Audit (if applicable)
 """
 
+import os
 import sys
+import time
+import threading
 import subprocess
 import argparse
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from check_runner import (DEFAULT_MEMORY_LIMIT_MB, emit, progress, run_in_process, run_scheduled, run_subprocess,
+                          supports_in_process)
+from check_history import build_report, parse_metrics, record_run
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -46,16 +70,16 @@ def print_header(text: str):
     print(f"{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.ENDC}\n")
 
 def print_step(text: str):
-    print(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
+    emit(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
 
 def print_success(text: str):
-    print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
+    emit(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
 
 def print_warning(text: str):
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
+    emit(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
 
 def print_error(text: str):
-    print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
+    emit(f"{Colors.RED}❌ {text}{Colors.ENDC}")
 
 # Complete verification suite
 VERIFICATION_SUITE = [
@@ -147,14 +171,24 @@ VERIFICATION_SUITE = [
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               isolate: bool = False, cancel: Optional[threading.Event] = None,
+               memory_limit_mb: int = DEFAULT_MEMORY_LIMIT_MB) -> dict:
+    """Run validation script (in-process unless isolate is set or unsupported), showing its progress lines"""
     if not script_path.exists():
         print_warning(f"{name}: Script not found, skipping")
         return {"name": name, "passed": True, "skipped": True, "duration": 0}
+    if cancel is not None and cancel.is_set():  # queued before a critical check failed
+        print_warning(f"{name}: CANCELLED")
+        return {"name": name, "passed": False, "skipped": True, "cancelled": True, "duration": 0}
     
     print_step(f"Running: {name}")
-    start_time = datetime.now()
+    start_time = time.perf_counter()
+    
+    def show_progress(line):
+        text = progress(line)
+        if text:
+            emit(f"   ↳ {name}: {text}")
     
     # Build command
     cmd = ["python", str(script_path), project_path]
@@ -163,39 +197,52 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     
     # Run
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout for slow checks
-        )
+        if not isolate and supports_in_process(script_path):
+            mode = "in-process"
+            result = run_in_process(script_path, cmd[2:], on_line=show_progress, cancel=cancel)
+        else:
+            mode = "subprocess"
+            result = run_subprocess(cmd, timeout=600, on_line=show_progress,  # 10 minute timeout for slow checks
+                                    cancel=cancel, memory_limit_mb=memory_limit_mb)
         
-        duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
+        duration = result["duration"]
+        if result.get("cancelled"):
+            print_warning(f"{name}: CANCELLED ({duration:.1f}s)")
+            return {"name": name, "passed": False, "output": result["stdout"], "error": result["stderr"],
+                    "skipped": True, "cancelled": True, "duration": duration, "mode": mode,
+                    "peak_memory_kb": result["peak_memory_kb"]}
+        
+        passed = result["returncode"] == 0
         
         if passed:
             print_success(f"{name}: PASSED ({duration:.1f}s)")
         else:
-            print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
+            over = f", over {memory_limit_mb} MB memory limit" if result.get("memory_exceeded") else ""
+            print_error(f"{name}: FAILED ({duration:.1f}s{over})")
+            if result["stderr"]:
+                emit(f"  {result['stderr'][:300]}")
         
+        files_scanned, findings = parse_metrics(result["stdout"])
         return {
             "name": name,
             "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
+            "output": result["stdout"],
+            "error": result["stderr"],
             "skipped": False,
-            "duration": duration
+            "duration": duration,
+            "mode": mode,
+            "peak_memory_kb": result["peak_memory_kb"],
+            "files_scanned": files_scanned,
+            "findings": findings
         }
     
     except subprocess.TimeoutExpired:
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
         return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": "Timeout"}
     
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         print_error(f"{name}: ERROR - {str(e)}")
         return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
 
@@ -274,6 +321,11 @@ Examples:
     parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
     parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--isolate", action="store_true", help="Run every check in its own subprocess (no shared file cache)")
+    parser.add_argument("--memory-limit", type=int, default=DEFAULT_MEMORY_LIMIT_MB, metavar="MB",
+                        help=f"Memory limit per subprocess check (default: {DEFAULT_MEMORY_LIMIT_MB}, 0: none)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Checks run at the same time (default: CPU count)")
+    parser.add_argument("--report-dir", type=str, default=None, help="Also write the run report (latest.json/latest.csv) here")
     
     args = parser.parse_args()
     
@@ -289,9 +341,9 @@ Examples:
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     start_time = datetime.now()
-    results = []
+    checks = []
     
-    # Run all verification categories
+    # Collect all verification categories (priority order)
     for suite in VERIFICATION_SUITE:
         category = suite["category"]
         requires_url = suite.get("requires_url", False)
@@ -304,19 +356,51 @@ Examples:
         if args.no_e2e and category == "E2E Testing":
             continue
         
-        print_header(f"📋 {category.upper()}")
-        
         for name, script_path, required in suite["checks"]:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
+            checks.append((category, name, script_path, required))
+    
+    current_category = None
+    cancel = threading.Event()  # set on a critical failure with --stop-on-fail
+    
+    def job(category, name, script_path):
+        def run():
+            nonlocal current_category
+            # Category headers only make sense when checks run one at a time
+            if args.workers <= 1 and category != current_category:
+                print_header(f"📋 {category.upper()}")
+            current_category = category
+            result = run_script(name, project_path / script_path, str(project_path), args.url, isolate=args.isolate,
+                                cancel=cancel, memory_limit_mb=args.memory_limit)
             result["category"] = category
-            results.append(result)
-            
-            # Stop on critical failure if flag set
-            if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
-                sys.exit(1)
+            return result
+        return run
+    
+    def critical_failure(position, result):
+        # Stop on critical failure if flag set
+        return args.stop_on_fail and checks[position][3] and not result["passed"] and not result.get("skipped")
+    
+    if args.workers > 1:
+        print_header(f"📋 RUNNING {len(checks)} CHECKS ({args.workers} at a time)")
+    finished = {}
+    stopped = None
+    jobs = [job(category, name, script_path) for category, name, script_path, required in checks]
+    for position, result in run_scheduled(jobs, args.workers, critical_failure):
+        finished[position] = result
+        if stopped is None and critical_failure(position, result):
+            stopped = result["name"]
+            cancel.set()
+    results = [finished[position] for position in sorted(finished)]
+    
+    report = build_report(project_path, results, start_time, (datetime.now() - start_time).total_seconds(),
+                          {"url": args.url, "isolate": args.isolate, "workers": args.workers})
+    history = record_run(report, args.report_dir)
+    if history is not None:
+        emit(f"Run report: {history / 'latest.json'} (history: python scripts/check_history.py {args.project})")
+    
+    if stopped:
+        print_error(f"CRITICAL: {stopped} failed. Stopping verification.")
+        print_final_report(results, start_time)
+        sys.exit(1)
     
     # Print final report
     all_passed = print_final_report(results, start_time)
@@ -19,6 +19,9 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_index import get_index, read_text
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -29,14 +32,14 @@ except:
 def find_schema_files(project_path: Path) -> list:
     """Find database schema files."""
     schemas = []
+    index = get_index(project_path)
     
     # Prisma schema
-    prisma_files = list(project_path.glob('**/prisma/schema.prisma'))
+    prisma_files = index.glob('**/prisma/schema.prisma')
     schemas.extend([('prisma', f) for f in prisma_files])
     
     # Drizzle schema files
-    drizzle_files = list(project_path.glob('**/drizzle/*.ts'))
-    drizzle_files.extend(project_path.glob('**/schema/*.ts'))
+    drizzle_files = index.glob('**/drizzle/*.ts') + index.glob('**/schema/*.ts')
     for f in drizzle_files:
         if 'schema' in f.name.lower() or 'table' in f.name.lower():
             schemas.append(('drizzle', f))
@@ -49,7 +52,7 @@ def validate_prisma_schema(file_path: Path) -> list:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path, errors='ignore')
         
         # Find all models
         models = re.findall(r'model\s+(\w+)\s*{([^}]+)}', content, re.DOTALL)
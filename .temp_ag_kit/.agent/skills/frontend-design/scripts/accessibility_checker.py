@@ -20,6 +20,9 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_index import get_index, read_text
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -29,14 +32,8 @@ except:
 
 def find_html_files(project_path: Path) -> list:
     """Find all HTML/JSX/TSX files."""
-    patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
-    skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
+    # node_modules, .next, dist, build, .git are pruned by the shared index
+    files = get_index(project_path).files(('.html', '.jsx', '.tsx'))
     
     return files[:50]
 
@@ -46,7 +43,7 @@ def check_accessibility(file_path: Path) -> list:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path, errors='ignore')
         
         # Check for form inputs without labels
         inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
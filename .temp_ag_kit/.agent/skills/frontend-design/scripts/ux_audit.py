@@ -87,6 +87,13 @@ Analyzes code for compliance with:
    - Form labels
 
 Total: 80+ checks across all design principles
+
+Rule engine:
+   Checks are declared in RULES as (level, label, message, condition) and
+   read shared facts from FileFacts: every pattern in PATTERNS is compiled
+   once and evaluated at most once per file, on first use, however many
+   rules depend on it. To add a check, add its patterns to PATTERNS and a
+   Rule to RULES. Directories are audited on a process pool (--workers N).
 """
 
 import sys
@@ -94,590 +101,607 @@ import os
 import re
 import json
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_index import get_index, read_text
+
+PARALLEL_MIN_FILES = 64  # below this, starting a process pool costs more than it saves
+
+# ============ SHARED PATTERNS ============
+# name -> (regex, flags); rules refer to them by name through FileFacts
+PATTERN_SOURCES = {
+    # Common flags
+    'long_text': (r'<p|<div.*class=.*text|article|<span.*text', re.I),
+    'form': (r'<form|<input|password|credit|card|payment', re.I),
+    'complex_element': (r'<input|<select|<textarea|<option', re.I),
+    # Psychology laws
+    'nav_item': (r'<NavLink|<Link|<a\s+href|nav-item', re.I),
+    'nav_label': (r'<NavLink|<Link|<a\s+href[^>]*>([^<]+)</a>', re.I),
+    'small_height': (r'height:\s*([0-3]\d)px', 0),
+    'small_h_class': (r'h-[1-9]\b|h-10\b', 0),
+    'form_field': (r'<input|<select|<textarea', re.I),
+    'multi_step': (r'step|wizard|stage', re.I),
+    'primary_cta': (r'primary|bg-primary|Button.*primary|variant=["\']primary', re.I),
+    # Emotional design
+    'hero': (r'hero|<h1|banner', re.I),
+    'gradient': (r'gradient', 0),
+    'animation': (r'@keyframes|transition:|animate-', 0),
+    'background': (r'background:|bg-', 0),
+    'feedback': (r'transition|animate|hover:|focus:|disabled|loading|spinner', re.I),
+    'state_change': (r'setState|useState|disabled|loading', 0),
+    'reflective': (r'about|story|mission|values|why we|our journey|testimonials', re.I),
+    # Trust
+    'security_signal': (r'ssl|secure|encrypt|lock|padlock|https', re.I),
+    'checkout': (r'checkout|payment', re.I),
+    'social_proof': (r'review|testimonial|rating|star|trust|trusted by|customer|logo', re.I),
+    'footer': (r'footer|<footer', re.I),
+    'authority': (r'certif|award|media|press|featured|as seen in', re.I),
+    # Cognitive load
+    'progressive': (r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more', re.I),
+    'color_token': (r'#[0-9a-fA-F]{3,6}|rgb|hsl', 0),
+    'border_token': (r'border:|border-', 0),
+    'label': (r'<label|placeholder|aria-label', re.I),
+    # Persuasion
+    'default_value': (r'checked|selected|default|value=["\'].*["\']', 0),
+    'radio': (r'type=["\']radio', re.I),
+    'price': (r'price|pricing|cost|\$\d+', re.I),
+    'anchor_price': (r'original|was|strike|del|save \d+%', re.I),
+    'social_word': (r'join|subscriber|member|user', re.I),
+    'specific_count': (r'\d[+kmb]|\d,\d', 0),  # searched only: same hits as \d+[+kmb]|\d+,\d+
+    'progress': (r'progress|step \d+|complete|%|bar', re.I),
+    # Typography
+    'font_face': (r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', re.I),
+    'google_font': (r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', re.I),
+    'font_family': (r'font-family:\s*([^;]+)', re.I),
+    'line_length': (r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch', 0),
+    'text_element': (r'<p|<span|<div.*text|<h[1-6]', re.I),
+    'line_height': (r'leading-|line-height:', 0),
+    'heading_or_large_text': (r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', re.I),
+    'line_height_value': (r'(?:leading-|line-height:\s*)([\d.]+)', 0),
+    'uppercase': (r'uppercase|text-transform:\s*uppercase', re.I),
+    'tracking': (r'tracking-|letter-spacing:', 0),
+    'display_text': (r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx', 0),
+    'tracking_tight': (r'tracking-tight|letter-spacing:\s*-[0-9]', 0),
+    'font_weight': (r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)', re.I),
+    'font_size_decl': (r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)', 0),
+    'fluid_type': (r'clamp\(|responsive:', 0),
+    'heading': (r'<(h[1-6])', re.I),
+    'font_size_value': (r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)', 0),
+    'paragraph': (r'<p[^>]*>([^<]+)</p>', re.I),
+    'subheading': (r'<h[2-6]', re.I),
+    # Visual effects
+    'blur': (r'backdrop-filter|blur\(', 0),
+    'translucent_bg': (r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+', 0),
+    'motion': (r'@keyframes|transition:', 0),
+    'layout_prop': (r'width|height|top|left|right|bottom|margin|padding', 0),
+    'reduced_motion': (r'prefers-reduced-motion', 0),
+    'box_shadow': (r'box-shadow:\s*([^;]+)', 0),
+    'y_offset': (r'\d+px\s+[1-9]\d*px', 0),
+    'rgba_alpha': (r'rgba?\([^)]+,\s*([\d.]+)\)', 0),
+    'gradient_any_case': (r'gradient', re.I),
+    'border_decl': (r'border:', 0),
+    'text_shadow': (r'text-shadow:', 0),
+    'glow_shadow': (r'box-shadow:\s*[^;]*0\s+0\s+', 0),
+    'image': (r'<img|background-image:|bg-\[url', 0),
+    'overlay': (r'overlay|rgba\(0|gradient.*transparent|::after|::before', 0),
+    'will_change': (r'will-change:', 0),
+    'will_change_value': (r'will-change:\s*([^;]+)', 0),
+    # Color system
+    'hex_color': (r'#[0-9a-fA-F]{3,6}', 0),
+    'hex6_color': (r'#[0-9a-fA-F]{6}', 0),
+    'hsl_call': (r'hsl\(', 0),
+    'hsl_hue': (r'hsl\((\d+),\s*\d+%,\s*\d+%\)', 0),
+    'bg_decl': (r'(?:background|bg-|bg\[)([^;}\s]+)', 0),
+    'text_decl': (r'(?:color|text-)([^;}\s]+)', 0),
+    'pure_black': (r'color:\s*#000000|#000\b', 0),
+    'pure_white': (r'background:\s*#ffffff|#fff\b', 0),
+    'dark_mode': (r'dark:', 0),
+    'light_contrast': (r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]', 0),
+    'dark_contrast': (r'bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]', 0),
+    'blue': (r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}', 0),
+    'food': (r'restaurant|food|cooking|recipe|menu|dish|meal', re.I),
+    'color_var': (r'--color-|color-|primary-|secondary-', 0),
+    # Animation
+    'duration': (r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)', 0),
+    'ease_in_entry': (r'ease-in\s+.*entry|fade-in.*ease-in', 0),
+    'ease_out_exit': (r'ease-out\s+.*exit|fade-out.*ease-out', 0),
+    'interactive': (r'<button|<a\s+href|onClick|@click', 0),
+    'hover_focus': (r'hover:|focus:|:hover|:focus', 0),
+    'async': (r'async|await|fetch|axios|loading|isLoading', 0),
+    'loading_indicator': (r'skeleton|spinner|progress|loading|<circle.*animate', 0),
+    'routing': (r'router|navigate|Link.*to|useHistory', 0),
+    'page_transition': (r'AnimatePresence|motion\.|transition.*page|fade.*route', 0),
+    'scroll_anim': (r'onScroll|scroll.*trigger|IntersectionObserver', 0),
+    'scroll_layout': (r'onScroll.*[^\w](width|height|top|left)', 0),
+    # Motion graphics
+    'lottie': (r'lottie|Lottie|@lottie-react', 0),
+    'lottie_fallback': (r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop', 0),
+    'gsap': (r'gsap|ScrollTrigger|from\(.*gsap', 0),
+    'gsap_cleanup': (r'kill\(|revert\(|useEffect.*return.*gsap', 0),
+    'svg_animation': (r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset', 0),
+    'transform_3d': (r'transform3d|perspective\(|rotate3d|translate3d', 0),
+    'perspective': (r'perspective:\s*\d+px|perspective\s*\(', 0),
+    'particles': (r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js', 0),
+    'scroll_driven': (r'IntersectionObserver.*animate|scroll.*progress|view-timeline', 0),
+    'throttle': (r'throttle|debounce|requestAnimationFrame', 0),
+    'functional_animation': (r'hover:|focus:|disabled|loading|error|success', 0),
+    # Accessibility
+    'img_without_alt': (r'<img(?![^>]*alt=)[^>]*>', 0),
+}
+
+def _literals(regex: str) -> Optional[Tuple[str, ...]]:
+    """The alternatives of a plain 'word|other\\.word' pattern, or None if it uses any regex syntax."""
+    words = []
+    for alternative in regex.split('|'):
+        word = re.sub(r'\\([^\w\s])', r'\1', alternative)  # drop escapes of punctuation
+        if not word or re.search(r'[\\.^$*+?{}\[\]()]', re.sub(r'\\[^\w\s]', '', alternative)):
+            return None
+        words.append(word)
+    return tuple(words)
+
+
+# re.IGNORECASE is slow in alternations, so case-insensitive patterns are
+# matched lowercased against the file's lowercased text (one lower() per file)
+CASELESS = frozenset(name for name, (_, flags) in PATTERN_SOURCES.items() if flags & re.I)
+PATTERNS = {name: re.compile(regex.lower(), flags & ~re.I) if name in CASELESS else re.compile(regex, flags)
+            for name, (regex, flags) in PATTERN_SOURCES.items()}
+# Plain word alternations are searched with str "in", several times faster than re
+LITERALS = {name: words for name, words in
+            ((name, _literals(PATTERNS[name].pattern)) for name in PATTERNS) if words}
+
+GENERIC_FONTS = {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial', 'georgia', 'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}
+WEIGHT_NAMES = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500', 'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
+MODULAR_RATIOS = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}  # Minor Second .. Golden Ratio
+LAYOUT_PROPERTIES = ['width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding']
+IMPORTANT_NAV_WORDS = ['contact', 'login', 'sign', 'get started', 'cta', 'button']
+PURPLE_COLORS = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
+                 '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
+                 '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
+                 'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
+
+
+class FileFacts:
+    """Shared sub-matches of one file; each pattern runs at most once, on first use."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self._lower = None
+        self._found = {}     # name -> findall() result
+        self._searched = {}  # name -> bool
+        self._derived = {}   # name -> value of a DERIVED fact
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.content.lower()
+        return self._lower
+
+    def _text(self, name: str) -> str:
+        return self.lower if name in CASELESS else self.content
+
+    def findall(self, name: str) -> list:
+        if name not in self._found:
+            self._found[name] = PATTERNS[name].findall(self._text(name))
+        return self._found[name]
+
+    def has(self, name: str) -> bool:
+        if name in self._found:
+            return bool(self._found[name])
+        if name not in self._searched:
+            text = self._text(name)
+            words = LITERALS.get(name)
+            if words is not None:
+                self._searched[name] = any(word in text for word in words)
+            else:
+                self._searched[name] = PATTERNS[name].search(text) is not None
+        return self._searched[name]
+
+    def count(self, name: str) -> int:
+        return len(self.findall(name))
+
+    def __getitem__(self, name: str):
+        if name not in self._derived:
+            self._derived[name] = DERIVED[name](self)
+        return self._derived[name]
+
+
+# ============ DERIVED FACTS ============
+def _weight_values(f: FileFacts) -> List[int]:
+    values = []
+    for numeric, fw in f.findall('font_weight'):
+        val = numeric or fw
+        if val:
+            val = WEIGHT_NAMES.get(val.lower(), val)
+            try:
+                values.append(int(val))
+            except ValueError:
+                pass
+    return values
+
+
+DERIVED = {
+    'weights': _weight_values,
+    'effect_count': lambda f: ((1 if f.has('gradient') else 0) + f.count('box_shadow')
+                               + f.count('blur') + f.count('text_shadow')),
+    'total_animations': lambda f: (f.count('animation') + (1 if f.has('lottie') else 0)
+                                   + (1 if f.has('gsap') else 0)),
+}
+
+
+# ============ RULE CONDITIONS ============
+# A condition returns a falsy value (no finding), True (the message as is), a
+# tuple of message.format() arguments, or a list of such tuples (one finding each)
+
+def _serial_position(f: FileFacts):
+    if f.count('nav_item') <= 3:
+        return False
+    labels = f.findall('nav_label')
+    if len(labels) <= 2:
+        return False
+    last_item = labels[-1].lower()
+    return not any(x in last_item for x in IMPORTANT_NAV_WORDS)
+
+
+def _font_families(f: FileFacts):
+    families = set()
+    for font in f.findall('font_face'):
+        families.add(font.strip().lower())
+    for font in f.findall('google_font'):
+        for name in font.replace('+', ' ').split('|'):
+            families.add(name.split(':')[0].strip().lower())
+    for family in f.findall('font_family'):
+        first_font = family.split(',')[0].strip().strip('"\'')  # first font of the stack
+        if first_font.lower() not in GENERIC_FONTS:
+            families.add(first_font.lower())
+    return len(families) > 3 and (len(families),)
+
+
+def _loose_heading_leading(f: FileFacts):
+    if not f.has('heading_or_large_text'):
+        return False
+    return [(lh,) for lh in f.findall('line_height_value') if float(lh) > 1.5]
+
+
+def _adjacent_weights(f: FileFacts):
+    weights = f['weights']
+    return [(weights[i], weights[i + 1]) for i in range(len(weights) - 1)
+            if abs(weights[i] - weights[i + 1]) == 100]
+
+
+def _skipped_heading_levels(f: FileFacts):
+    headings = f.findall('heading')
+    pairs = [(int(a[1]), int(b[1])) for a, b in zip(headings, headings[1:])]
+    return [(curr, next_h) for curr, next_h in pairs if next_h > curr + 1]
+
+
+def _off_scale_font_sizes(f: FileFacts):
+    sizes = [float(size) / 16 if unit == 'px' else float(size)  # normalised to rem
+             for size, unit in f.findall('font_size_value')]
+    if len(sizes) <= 2:
+        return False
+    sorted_sizes = sorted(set(sizes))
+    ratios = [b / a for a, b in zip(sorted_sizes, sorted_sizes[1:]) if a > 0]
+    for ratio in ratios[:3]:
+        if not any(abs(ratio - cr) < 0.05 for cr in MODULAR_RATIOS):
+            return (ratio,)
+    return False
+
+
+def _uniform_shadow_opacity(f: FileFacts):
+    if not f.findall('box_shadow'):
+        return False
+    opacities = [float(o) for o in f.findall('rgba_alpha') if float(o) < 0.5]
+    return f.count('box_shadow') >= 3 and bool(opacities) and len(set(opacities)) < 2
+
+
+def _layout_will_change(f: FileFacts):
+    if not f.has('will_change'):
+        return False
+    props = [prop.strip().lower() for prop in f.findall('will_change_value')]
+    return [(prop,) for prop in props if prop in LAYOUT_PROPERTIES]
+
+
+def _purple(f: FileFacts):
+    for purple in PURPLE_COLORS:
+        if purple.lower() in f.lower:
+            return (purple,)
+    return False
+
+
+def _distinct_colors(f: FileFacts):
+    if f.count('hex_color') + f.count('hsl_call') <= 3:
+        return False
+    if not (f.has('bg_decl') and f.has('text_decl')):
+        return False
+    unique_hexes = len(set(f.findall('hex6_color')))
+    return unique_hexes > 5 and (unique_hexes,)
+
+
+def _monochromatic(f: FileFacts):
+    hues = [int(h) for h in f.findall('hsl_hue')]
+    if len(hues) < 3:
+        return False
+    hue_range = max(hues) - min(hues)
+    return hue_range < 10 and (hue_range,)
+
+
+def _duration_findings(f: FileFacts):
+    findings = []
+    for duration, unit in f.findall('duration'):
+        duration_ms = float(duration) * (1000 if unit == 's' else 1)
+        if duration_ms < 50:
+            findings.append((f"Very fast animation ({duration}{unit}). Minimum 50ms for visibility.",))
+        elif duration_ms > 1000 and 'transition' in f.lower:
+            findings.append((f"Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness.",))
+    return findings
+
+
+def _decorative_motion(f: FileFacts):
+    total = f['total_animations']
+    return total > 5 and f.count('functional_animation') < total / 2 and (total,)
+
+
+# ============ RULES ============
+ISSUE, WARNING, PASSED = "issue", "warning", "passed"
+
+
+class Rule(NamedTuple):
+    level: str                             # ISSUE, WARNING or PASSED (counted only)
+    label: str                             # shown as "[label] file: message"
+    message: str                           # str.format() template for the condition's tuple
+    condition: Callable[[FileFacts], object]
+
+
+RULES = [
+    # --- 1. PSYCHOLOGY LAWS ---
+    Rule(ISSUE, "Hick's Law", "{} nav items (Max 7)",
+         lambda f: f.count('nav_item') > 7 and (f.count('nav_item'),)),
+    Rule(WARNING, "Fitts' Law", "Small targets (< 44px)",
+         lambda f: f.has('small_height') or f.has('small_h_class')),
+    Rule(WARNING, "Miller's Law", "Complex form ({} fields)",
+         lambda f: f.count('form_field') > 7 and not f.has('multi_step') and (f.count('form_field'),)),
+    Rule(WARNING, "Von Restorff", "No primary CTA",
+         lambda f: 'button' in f.lower and not f.has('primary_cta')),
+    Rule(WARNING, "Serial Position", "Last nav item may not be important. Place key actions at start/end.",
+         _serial_position),
+
+    # --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
+    Rule(WARNING, "Visceral", "Hero section lacks visual appeal. Consider gradients or subtle animations.",
+         lambda f: f.has('hero') and not (f.has('gradient') or f.has('animation')) and not f.has('background')),
+    Rule(WARNING, "Behavioral", "Interactive elements lack immediate feedback. Add hover/focus/disabled states.",
+         lambda f: ('onClick' in f.content or '@click' in f.content or 'onclick' in f.content)
+         and not f.has('feedback') and not f.has('state_change')),
+    Rule(WARNING, "Reflective", "Long-form content without brand story/values. Add 'About' or 'Why We Exist' section.",
+         lambda f: f.has('long_text') and not f.has('reflective')),
+
+    # --- 1.6 TRUST BUILDING ---
+    Rule(WARNING, "Trust", "Form without security indicators. Add 'SSL Secure' or lock icon.",
+         lambda f: f.has('form') and not f.has('security_signal') and not f.has('checkout')),
+    Rule(PASSED, "Trust", "Social proof present",
+         lambda f: f.has('social_proof')),
+    Rule(WARNING, "Trust", "No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos.",
+         lambda f: not f.has('social_proof') and f.has('long_text')),
+    Rule(WARNING, "Trust", "Footer lacks authority signals. Add certifications, awards, or media mentions.",
+         lambda f: f.has('footer') and not f.has('authority')),
+
+    # --- 1.7 COGNITIVE LOAD MANAGEMENT ---
+    Rule(WARNING, "Cognitive Load", "Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle.",
+         lambda f: f.count('complex_element') > 5 and not f.has('progressive')),
+    Rule(WARNING, "Cognitive Load", "High visual noise detected. Many colors and borders increase cognitive load.",
+         lambda f: f.count('color_token') > 15 and f.count('border_token') > 10),
+    Rule(ISSUE, "Cognitive Load", "Form inputs without labels. Use <label> for accessibility and clarity.",
+         lambda f: f.has('form') and not f.has('label')),
+
+    # --- 1.8 PERSUASIVE DESIGN (Ethical) ---
+    Rule(WARNING, "Persuasion", "Radio buttons without default selection. Pre-select recommended option.",
+         lambda f: f.has('form') and f.has('radio') and not f.has('default_value')),
+    Rule(WARNING, "Persuasion", "Prices without anchoring. Show original price to frame discount value.",
+         lambda f: f.has('price') and not f.has('anchor_price')),
+    Rule(WARNING, "Persuasion", "Social proof without specific numbers. Use 'Join 10,000+' format.",
+         lambda f: f.has('social_word') and not f.has('specific_count')),
+    Rule(WARNING, "Persuasion", "Long form without progress indicator. Add progress bar or 'Step X of Y'.",
+         lambda f: f.has('form') and f.count('complex_element') > 5 and not f.has('progress')),
+
+    # --- 2. TYPOGRAPHY SYSTEM ---
+    Rule(ISSUE, "Typography", "{} font families detected. Limit to 2-3 for cohesion.",
+         _font_families),
+    Rule(WARNING, "Typography", "No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch].",
+         lambda f: f.has('long_text') and not f.has('line_length')),
+    Rule(WARNING, "Typography", "Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3",
+         lambda f: f.has('text_element') and not f.has('line_height')),
+    Rule(WARNING, "Typography", "Heading has line-height {} (>1.3). Headings should be tighter (1.1-1.3).",
+         _loose_heading_leading),
+    Rule(WARNING, "Typography", "Uppercase text without tracking. ALL CAPS needs +5-10% spacing.",
+         lambda f: f.has('uppercase') and not f.has('tracking')),
+    Rule(WARNING, "Typography", "Large display text without tracking-tight. Big text needs -1% to -4% spacing.",
+         lambda f: f.has('display_text') and not f.has('tracking_tight')),
+    Rule(WARNING, "Typography", "Adjacent font weights ({}/{}). Skip at least 2 levels for contrast.",
+         _adjacent_weights),
+    Rule(WARNING, "Typography", "{} font weights. Limit to 3-4 per page.",
+         lambda f: len(set(f['weights'])) > 4 and (len(set(f['weights'])),)),
+    Rule(WARNING, "Typography", "Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)",
+         lambda f: f.has('font_size_decl') and not f.has('fluid_type')),
+    Rule(WARNING, "Typography", "Skipped heading level (h{} -> h{}). Maintain sequential hierarchy.",
+         _skipped_heading_levels),
+    Rule(WARNING, "Typography", "No h1 found. Each page should have one primary heading.",
+         lambda f: f.findall('heading') and 'h1' not in [h.lower() for h in f.findall('heading')] and f.has('long_text')),
+    Rule(WARNING, "Typography", "Font sizes may not follow modular scale (ratio: {:.2f}). Consider consistent ratio like 1.25 (Major Third).",
+         _off_scale_font_sizes),
+    Rule(WARNING, "Typography", "Long paragraph detected ({} words). Break into 3-4 line chunks for readability.",
+         lambda f: [(len(p.split()),) for p in f.findall('paragraph') if len(p.split()) > 100]),
+    Rule(WARNING, "Typography", "Long content without subheadings. Add h2/h3 to break up text.",
+         lambda f: f.count('paragraph') > 5 and not f.has('subheading')),
+
+    # --- 3. VISUAL EFFECTS ---
+    Rule(WARNING, "Visual", "Blur used without semi-transparent background (Glassmorphism fail)",
+         lambda f: f.has('blur') and not f.has('translucent_bg')),
+    Rule(WARNING, "Performance", "Animating expensive properties ({}). Use transform/opacity where possible.",
+         lambda f: f.has('motion') and f.findall('layout_prop') and (', '.join(set(f.findall('layout_prop'))),)),
+    Rule(WARNING, "Accessibility", "Animations found without prefers-reduced-motion check",
+         lambda f: f.has('motion') and not f.has('reduced_motion')),
+    Rule(WARNING, "Visual", "Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.",
+         lambda f: [() for s in f.findall('box_shadow') if ',' not in s and not PATTERNS['y_offset'].search(s)]),
+    Rule(WARNING, "Visual", "Neomorphism inset detected. Ensure adequate contrast for accessibility.",
+         lambda f: [() for s in f.findall('box_shadow') if ',' in s and '-' in s and 'inset' in s]),
+    Rule(WARNING, "Visual", "All shadows at same opacity level. Vary shadow intensity for elevation hierarchy.",
+         _uniform_shadow_opacity),
+    Rule(WARNING, "Visual", "Many gradients detected ({}). Ensure this serves purpose, not decoration.",
+         lambda f: f.has('gradient') and f.count('gradient_any_case') > 5 and (f.count('gradient_any_case'),)),
+    Rule(WARNING, "Visual", "Hero section without visual interest. Consider gradient for depth.",
+         lambda f: not f.has('gradient') and f.has('hero') and not f.has('background')),
+    Rule(WARNING, "Visual", "Many border declarations ({}). Simplify for cleaner look.",
+         lambda f: f.has('border_token') and f.count('border_decl') > 8 and (f.count('border_decl'),)),
+    Rule(WARNING, "Visual", "Text glow effect detected. Ensure readability is maintained.",
+         lambda f: [() for ts in f.findall('text_shadow') if ',' in ts]),
+    Rule(WARNING, "Visual", "Multiple glow effects detected. Use sparingly for emphasis only.",
+         lambda f: f.count('glow_shadow') > 2),
+    Rule(WARNING, "Visual", "Text over image without overlay. Add gradient overlay for readability.",
+         lambda f: f.has('image') and f.has('long_text') and not f.has('overlay')),
+    Rule(ISSUE, "Performance", "will-change on '{}' (layout property). Use only for transform/opacity.",
+         _layout_will_change),
+    Rule(WARNING, "Performance", "Many will-change declarations ({}). Use sparingly, only for heavy animations.",
+         lambda f: f.count('will_change') > 3 and (f.count('will_change'),)),
+    Rule(WARNING, "Visual", "Many visual effects ({}). Ensure effects serve purpose, not decoration.",
+         lambda f: f['effect_count'] > 10 and (f['effect_count'],)),
+    Rule(WARNING, "Visual", "Flat design with no depth. Consider shadows or subtle gradients for hierarchy.",
+         lambda f: f.has('long_text') and f['effect_count'] == 0),
+
+    # --- 4. COLOR SYSTEM ---
+    Rule(ISSUE, "Color", "PURPLE DETECTED ('{}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.",
+         _purple),
+    Rule(WARNING, "Color", "{} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%).",
+         _distinct_colors),
+    Rule(WARNING, "Color", "Monochromatic palette detected (hue variance: {}deg). Ensure adequate contrast.",
+         _monochromatic),
+    Rule(WARNING, "Color", "Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode.",
+         lambda f: f.has('pure_black')),
+    Rule(WARNING, "Color", "Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain.",
+         lambda f: f.has('pure_white') and f.has('dark_mode')),
+    Rule(WARNING, "Color", "Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).",
+         lambda f: f.has('light_contrast') or f.has('dark_contrast')),
+    Rule(WARNING, "Color", "Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow).",
+         lambda f: f.has('blue') and f.has('food')),
+    Rule(WARNING, "Color", "Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness).",
+         lambda f: f.has('color_var') and not f.has('hsl_call')),
+
+    # --- 5. ANIMATION GUIDE ---
+    Rule(WARNING, "Animation", "{}",
+         _duration_findings),
+    Rule(WARNING, "Animation", "Entry animation with ease-in. Entry should use ease-out for snappy feel.",
+         lambda f: f.has('ease_in_entry')),
+    Rule(WARNING, "Animation", "Exit animation with ease-out. Exit should use ease-in for natural feel.",
+         lambda f: f.has('ease_out_exit')),
+    Rule(WARNING, "Animation", "Interactive elements without hover/focus states. Add micro-interactions for feedback.",
+         lambda f: f.count('interactive') > 2 and not f.has('hover_focus')),
+    Rule(WARNING, "Animation", "Async operations without loading indicator. Add skeleton or spinner for perceived performance.",
+         lambda f: f.has('async') and not f.has('loading_indicator')),
+    Rule(WARNING, "Animation", "Routing detected without page transitions. Consider fade/slide for context continuity.",
+         lambda f: f.has('routing') and not f.has('page_transition')),
+    Rule(ISSUE, "Animation", "Scroll handler animating layout properties. Use transform/opacity for 60fps.",
+         lambda f: f.has('scroll_anim') and f.has('scroll_layout')),
+
+    # --- 6. MOTION GRAPHICS ---
+    Rule(WARNING, "Motion", "Lottie animation without reduced-motion fallback. Add pause/stop for accessibility.",
+         lambda f: f.has('lottie') and not f.has('lottie_fallback')),
+    Rule(ISSUE, "Motion", "GSAP animation without cleanup (kill/revert). Memory leak risk on unmount.",
+         lambda f: f.has('gsap') and not f.has('gsap_cleanup')),
+    Rule(WARNING, "Motion", "Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance.",
+         lambda f: f.count('svg_animation') > 3),
+    Rule(WARNING, "Motion", "3D transform without perspective parent. Add perspective: 1000px for realistic depth.",
+         lambda f: f.has('transform_3d') and not f.has('perspective')),
+    Rule(WARNING, "Motion", "3D transforms detected. Test on mobile; can impact performance on low-end devices.",
+         lambda f: f.has('transform_3d')),
+    Rule(WARNING, "Motion", "Particle effects detected. Ensure fallback or reduced-quality option for mobile devices.",
+         lambda f: f.has('particles')),
+    Rule(ISSUE, "Motion", "Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps.",
+         lambda f: f.has('scroll_driven') and not f.has('throttle')),
+    Rule(WARNING, "Motion", "Many animations ({}). Ensure majority serve functional purpose (feedback, guidance), not decoration.",
+         _decorative_motion),
+
+    # --- 7. ACCESSIBILITY ---
+    Rule(ISSUE, "Accessibility", "Missing img alt text",
+         lambda f: f.has('img_without_alt')),
+]
+
+
+def evaluate(content: str, filename: str) -> Tuple[List[str], List[str], int]:
+    """Run every rule over one file's content: (issues, warnings, passed count)."""
+    facts = FileFacts(content)
+    issues, warnings, passed = [], [], 0
+    for rule in RULES:
+        result = rule.condition(facts)
+        if not result:
+            continue
+        if rule.level == PASSED:
+            passed += 1
+            continue
+        found = issues if rule.level == ISSUE else warnings
+        for args in (result if isinstance(result, list) else [result]):
+            message = rule.message.format(*args) if isinstance(args, tuple) else rule.message
+            found.append(f"[{rule.label}] {filename}: {message}")
+    return issues, warnings, passed
+
+
+def _audit_path(filepath: str) -> Optional[Tuple[List[str], List[str], int]]:
+    """evaluate() for one file path (process pool worker); None if unreadable."""
+    try:
+        content = read_text(filepath, errors='replace')
+    except OSError:
+        return None
+    return evaluate(content, os.path.basename(filepath))
+
+
+def _default_workers() -> int:
+    """
+    A worker per core for a standalone run. Imported (e.g. run in-process by
+    check_runner, whose scheduler and pipe threads make forking unsafe) the
+    audit stays in this process.
+    """
+    return (os.cpu_count() or 1) if __name__ == "__main__" else 1
+
+
+def _run_tasks(paths: List[str], workers: int) -> list:
+    """_audit_path over paths in order, on a process pool when it is worth it."""
+    if workers > 1 and len(paths) >= PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(_audit_path, paths, chunksize=max(1, len(paths) // (workers * 4))))
+        except (OSError, NotImplementedError):
+            pass  # no multiprocessing support here (e.g. sandboxed /dev/shm)
+        except BrokenProcessPool as e:
+            print(f"[!] Audit worker pool failed ({e}); auditing serially", file=sys.stderr)
+    return [_audit_path(path) for path in paths]
+
 
 class UXAuditor:
-    def __init__(self):
+    def __init__(self, workers: int = None):
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
-    
-    def audit_file(self, filepath: str) -> None:
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-        except: return
-        
+        self.workers = workers or _default_workers()
+
+    def _add(self, result) -> None:
+        if result is None:
+            return
+        issues, warnings, passed = result
         self.files_checked += 1
-        filename = os.path.basename(filepath)
-
-        # Pre-calculate common flags
-        has_long_text = bool(re.search(r'<p|<div.*class=.*text|article|<span.*text', content, re.IGNORECASE))
-        has_form = bool(re.search(r'<form|<input|password|credit|card|payment', content, re.IGNORECASE))
-        complex_elements = len(re.findall(r'<input|<select|<textarea|<option', content, re.IGNORECASE))
-
-        # --- 1. PSYCHOLOGY LAWS ---
-        # Hick's Law
-        nav_items = len(re.findall(r'<NavLink|<Link|<a\s+href|nav-item', content, re.IGNORECASE))
-        if nav_items > 7:
-            self.issues.append(f"[Hick's Law] {filename}: {nav_items} nav items (Max 7)")
-        
-        # Fitts' Law
-        if re.search(r'height:\s*([0-3]\d)px', content) or re.search(r'h-[1-9]\b|h-10\b', content):
-            self.warnings.append(f"[Fitts' Law] {filename}: Small targets (< 44px)")
-        
-        # Miller's Law
-        form_fields = len(re.findall(r'<input|<select|<textarea', content, re.IGNORECASE))
-        if form_fields > 7 and not re.search(r'step|wizard|stage', content, re.IGNORECASE):
-            self.warnings.append(f"[Miller's Law] {filename}: Complex form ({form_fields} fields)")
-            
-        # Von Restorff
-        if 'button' in content.lower() and not re.search(r'primary|bg-primary|Button.*primary|variant=["\']primary', content, re.IGNORECASE):
-            self.warnings.append(f"[Von Restorff] {filename}: No primary CTA")
-
-        # Serial Position Effect - Important items at beginning/end
-        if nav_items > 3:
-            # Check if last nav item is important (contact, login, etc.)
-            nav_content = re.findall(r'<NavLink|<Link|<a\s+href[^>]*>([^<]+)</a>', content, re.IGNORECASE)
-            if nav_content and len(nav_content) > 2:
-                last_item = nav_content[-1].lower() if nav_content else ''
-                if not any(x in last_item for x in ['contact', 'login', 'sign', 'get started', 'cta', 'button']):
-                    self.warnings.append(f"[Serial Position] {filename}: Last nav item may not be important. Place key actions at start/end.")
-
-        # --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
-
-        # Visceral: First impressions (aesthetics, gradients, animations)
-        has_hero = bool(re.search(r'hero|<h1|banner', content, re.IGNORECASE))
-        if has_hero:
-            # Check for visual appeal elements
-            has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient', content))
-            has_animation = bool(re.search(r'@keyframes|transition:|animate-', content))
-            has_visual_interest = has_gradient or has_animation
-
-            if not has_visual_interest and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visceral] {filename}: Hero section lacks visual appeal. Consider gradients or subtle animations.")
-
-        # Behavioral: Instant feedback and usability
-        if 'onClick' in content or '@click' in content or 'onclick' in content:
-            has_feedback = re.search(r'transition|animate|hover:|focus:|disabled|loading|spinner', content, re.IGNORECASE)
-            has_state_change = re.search(r'setState|useState|disabled|loading', content)
-
-            if not has_feedback and not has_state_change:
-                self.warnings.append(f"[Behavioral] {filename}: Interactive elements lack immediate feedback. Add hover/focus/disabled states.")
-
-        # Reflective: Brand story, values, identity
-        has_reflective = bool(re.search(r'about|story|mission|values|why we|our journey|testimonials', content, re.IGNORECASE))
-        if has_long_text and not has_reflective:
-            self.warnings.append(f"[Reflective] {filename}: Long-form content without brand story/values. Add 'About' or 'Why We Exist' section.")
-
-        # --- 1.6 TRUST BUILDING (Enhanced) ---
-
-        # Security signals
-        if has_form:
-            security_signals = re.findall(r'ssl|secure|encrypt|lock|padlock|https', content, re.IGNORECASE)
-            if len(security_signals) == 0 and not re.search(r'checkout|payment', content, re.IGNORECASE):
-                self.warnings.append(f"[Trust] {filename}: Form without security indicators. Add 'SSL Secure' or lock icon.")
-
-        # Social proof elements
-        social_proof = re.findall(r'review|testimonial|rating|star|trust|trusted by|customer|logo', content, re.IGNORECASE)
-        if len(social_proof) > 0:
-            self.passed_count += 1
-        else:
-            if has_long_text:
-                self.warnings.append(f"[Trust] {filename}: No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos.")
-
-        # Authority indicators
-        has_footer = bool(re.search(r'footer|<footer', content, re.IGNORECASE))
-        if has_footer:
-            authority = re.findall(r'certif|award|media|press|featured|as seen in', content, re.IGNORECASE)
-            if len(authority) == 0:
-                self.warnings.append(f"[Trust] {filename}: Footer lacks authority signals. Add certifications, awards, or media mentions.")
-
-        # --- 1.7 COGNITIVE LOAD MANAGEMENT ---
-
-        # Progressive disclosure
-        if complex_elements > 5:
-            has_progressive = re.search(r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more', content, re.IGNORECASE)
-            if not has_progressive:
-                self.warnings.append(f"[Cognitive Load] {filename}: Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle.")
-
-        # Visual noise check
-        has_many_colors = len(re.findall(r'#[0-9a-fA-F]{3,6}|rgb|hsl', content)) > 15
-        has_many_borders = len(re.findall(r'border:|border-', content)) > 10
-        if has_many_colors and has_many_borders:
-            self.warnings.append(f"[Cognitive Load] {filename}: High visual noise detected. Many colors and borders increase cognitive load.")
-
-        # Familiar patterns
-        if has_form:
-            has_standard_labels = bool(re.search(r'<label|placeholder|aria-label', content, re.IGNORECASE))
-            if not has_standard_labels:
-                self.issues.append(f"[Cognitive Load] {filename}: Form inputs without labels. Use <label> for accessibility and clarity.")
-
-        # --- 1.8 PERSUASIVE DESIGN (Ethical) ---
-
-        # Smart defaults
-        if has_form:
-            has_defaults = bool(re.search(r'checked|selected|default|value=["\'].*["\']', content))
-            radio_inputs = len(re.findall(r'type=["\']radio', content, re.IGNORECASE))
-            if radio_inputs > 0 and not has_defaults:
-                self.warnings.append(f"[Persuasion] {filename}: Radio buttons without default selection. Pre-select recommended option.")
-
-        # Anchoring (showing original price)
-        if re.search(r'price|pricing|cost|\$\d+', content, re.IGNORECASE):
-            has_anchor = bool(re.search(r'original|was|strike|del|save \d+%', content, re.IGNORECASE))
-            if not has_anchor:
-                self.warnings.append(f"[Persuasion] {filename}: Prices without anchoring. Show original price to frame discount value.")
-
-        # Social proof live indicators
-        has_social = bool(re.search(r'join|subscriber|member|user', content, re.IGNORECASE))
-        if has_social:
-            has_count = bool(re.findall(r'\d+[+kmb]|\d+,\d+', content))
-            if not has_count:
-                self.warnings.append(f"[Persuasion] {filename}: Social proof without specific numbers. Use 'Join 10,000+' format.")
-
-        # Progress indicators
-        if has_form:
-            has_progress = bool(re.search(r'progress|step \d+|complete|%|bar', content, re.IGNORECASE))
-            if complex_elements > 5 and not has_progress:
-                self.warnings.append(f"[Persuasion] {filename}: Long form without progress indicator. Add progress bar or 'Step X of Y'.")
-
-        # --- 2. TYPOGRAPHY SYSTEM (Complete Coverage) ---
-
-        # 2.1 Font Pairing - Too many font families
-        font_families = set()
-        # Check for @font-face, Google Fonts, font-family declarations
-        font_faces = re.findall(r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', content, re.IGNORECASE)
-        google_fonts = re.findall(r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', content, re.IGNORECASE)
-        font_family_css = re.findall(r'font-family:\s*([^;]+)', content, re.IGNORECASE)
-
-        for font in font_faces: font_families.add(font.strip().lower())
-        for font in google_fonts:
-            for f in font.replace('+', ' ').split('|'):
-                font_families.add(f.split(':')[0].strip().lower())
-        for family in font_family_css:
-            # Extract first font from stack
-            first_font = family.split(',')[0].strip().strip('"\'')
-
-            if first_font.lower() not in {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial', 'georgia', 'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}:
-                font_families.add(first_font.lower())
-
-        if len(font_families) > 3:
-            self.issues.append(f"[Typography] {filename}: {len(font_families)} font families detected. Limit to 2-3 for cohesion.")
-
-        # 2.2 Line Length - Character-based width
-        if has_long_text and not re.search(r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch', content):
-            self.warnings.append(f"[Typography] {filename}: No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch].")
-
-        # 2.3 Line Height - Proper leading ratios
-        # Check for text without proper line-height
-        text_elements = len(re.findall(r'<p|<span|<div.*text|<h[1-6]', content, re.IGNORECASE))
-        if text_elements > 0 and not re.search(r'leading-|line-height:', content):
-            self.warnings.append(f"[Typography] {filename}: Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3")
-
-        # Check for heading-specific line height issues
-        if re.search(r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', content, re.IGNORECASE):
-            # Extract line-height values
-            line_heights = re.findall(r'(?:leading-|line-height:\s*)([\d.]+)', content)
-            for lh in line_heights:
-                if float(lh) > 1.5:
-                    self.warnings.append(f"[Typography] {filename}: Heading has line-height {lh} (>1.3). Headings should be tighter (1.1-1.3).")
-
-        # 2.4 Letter Spacing (Tracking)
-        # Uppercase without tracking
-        if re.search(r'uppercase|text-transform:\s*uppercase', content, re.IGNORECASE):
-            if not re.search(r'tracking-|letter-spacing:', content):
-                self.warnings.append(f"[Typography] {filename}: Uppercase text without tracking. ALL CAPS needs +5-10% spacing.")
-
-        # Large text (display/hero) should have negative tracking
-        if re.search(r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx', content):
-            if not re.search(r'tracking-tight|letter-spacing:\s*-[0-9]', content):
-                self.warnings.append(f"[Typography] {filename}: Large display text without tracking-tight. Big text needs -1% to -4% spacing.")
-
-        # 2.5 Weight and Emphasis - Contrast levels
-        # Check for adjacent weight levels (poor contrast)
-        weights = re.findall(r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)', content, re.IGNORECASE)
-        weight_values = []
-        for w in weights:
-            val = w[0] or w[1]
-            if val:
-                # Map named weights to numbers
-                weight_map = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500', 'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
-                val = weight_map.get(val.lower(), val)
-                try:
-                    weight_values.append(int(val))
-                except: pass
-
-        # Check for adjacent weights (400/500, 500/600, etc.)
-        for i in range(len(weight_values) - 1):
-            diff = abs(weight_values[i] - weight_values[i+1])
-            if diff == 100:
-                self.warnings.append(f"[Typography] {filename}: Adjacent font weights ({weight_values[i]}/{weight_values[i+1]}). Skip at least 2 levels for contrast.")
-
-        # Too many weight levels
-        unique_weights = set(weight_values)
-        if len(unique_weights) > 4:
-            self.warnings.append(f"[Typography] {filename}: {len(unique_weights)} font weights. Limit to 3-4 per page.")
-
-        # 2.6 Responsive Typography - Fluid sizing with clamp()
-        has_font_sizes = bool(re.search(r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)', content))
-        if has_font_sizes and not re.search(r'clamp\(|responsive:', content):
-            self.warnings.append(f"[Typography] {filename}: Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)")
-
-        # 2.7 Hierarchy - Heading structure
-        headings = re.findall(r'<(h[1-6])', content, re.IGNORECASE)
-        if headings:
-            # Check for skipped levels (h1 -> h3)
-            for i in range(len(headings) - 1):
-                curr = int(headings[i][1])
-                next_h = int(headings[i+1][1])
-                if next_h > curr + 1:
-                    self.warnings.append(f"[Typography] {filename}: Skipped heading level (h{curr} -> h{next_h}). Maintain sequential hierarchy.")
-
-            # Check if h1 exists for main content
-            if 'h1' not in [h.lower() for h in headings] and has_long_text:
-                self.warnings.append(f"[Typography] {filename}: No h1 found. Each page should have one primary heading.")
-
-        # 2.8 Modular Scale - Consistent sizing
-        # Extract font-size values
-        font_sizes = re.findall(r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)', content)
-        size_values = []
-        for size, unit in font_sizes:
-            if unit == 'rem' or unit == 'em':
-                size_values.append(float(size))
-            elif unit == 'px':
-                size_values.append(float(size) / 16)  # Normalize to rem
-
-        if len(size_values) > 2:
-            # Check if sizes follow a modular scale roughly
-            sorted_sizes = sorted(set(size_values))
-            ratios = []
-            for i in range(1, len(sorted_sizes)):
-                if sorted_sizes[i-1] > 0:
-                    ratios.append(sorted_sizes[i] / sorted_sizes[i-1])
-
-            # Common scale ratios: 1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618
-            common_ratios = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}
-            for ratio in ratios[:3]:  # Check first 3 ratios
-                if not any(abs(ratio - cr) < 0.05 for cr in common_ratios):
-                    self.warnings.append(f"[Typography] {filename}: Font sizes may not follow modular scale (ratio: {ratio:.2f}). Consider consistent ratio like 1.25 (Major Third).")
-                    break
-
-        # 2.9 Readability - Content chunking
-        # Check for very long paragraphs (>5 lines estimated)
-        paragraphs = re.findall(r'<p[^>]*>([^<]+)</p>', content, re.IGNORECASE)
-        for p in paragraphs:
-            word_count = len(p.split())
-            if word_count > 100:  # ~5-6 lines
-                self.warnings.append(f"[Typography] {filename}: Long paragraph detected ({word_count} words). Break into 3-4 line chunks for readability.")
-
-        # Check for missing subheadings in long content
-        if len(paragraphs) > 5:
-            subheadings = len(re.findall(r'<h[2-6]', content, re.IGNORECASE))
-            if subheadings == 0:
-                self.warnings.append(f"[Typography] {filename}: Long content without subheadings. Add h2/h3 to break up text.")
-
-        # --- 3. VISUAL EFFECTS (visual-effects.md) ---
-        
-        # Glassmorphism Check
-        if 'backdrop-filter' in content or 'blur(' in content:
-            if not re.search(r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+', content):
-                self.warnings.append(f"[Visual] {filename}: Blur used without semi-transparent background (Glassmorphism fail)")
-        
-        # GPU Acceleration / Performance
-        if re.search(r'@keyframes|transition:', content):
-            expensive_props = re.findall(r'width|height|top|left|right|bottom|margin|padding', content)
-            if expensive_props:
-                self.warnings.append(f"[Performance] {filename}: Animating expensive properties ({', '.join(set(expensive_props))}). Use transform/opacity where possible.")
-            
-            # Reduced Motion
-            if not re.search(r'prefers-reduced-motion', content):
-                self.warnings.append(f"[Accessibility] {filename}: Animations found without prefers-reduced-motion check")
-
-        # Natural Shadows
-        shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in shadows:
-            # Check if natural (Y > X) or multiple layers
-            if ',' not in shadow and not re.search(r'\d+px\s+[1-9]\d*px', shadow): # Simple heuristic for Y-offset
-                 self.warnings.append(f"[Visual] {filename}: Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.")
-
-        # --- 3.1 NEOMORPHISM CHECK ---
-        # Check for neomorphism patterns (dual shadows with opposite directions)
-        neo_shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in neo_shadows:
-            # Neomorphism has two shadows: positive offset + negative offset
-            if ',' in shadow and '-' in shadow:
-                # Check for inset pattern (pressed state)
-                if 'inset' in shadow:
-                    self.warnings.append(f"[Visual] {filename}: Neomorphism inset detected. Ensure adequate contrast for accessibility.")
-
-        # --- 3.2 SHADOW HIERARCHY ---
-        # Count shadow levels to check for elevation consistency
-        shadow_count = len(shadows)
-        if shadow_count > 0:
-            # Check for shadow opacity levels (should indicate hierarchy)
-            opacities = re.findall(r'rgba?\([^)]+,\s*([\d.]+)\)', content)
-            shadow_opacities = [float(o) for o in opacities if float(o) < 0.5]
-            if shadow_count >= 3 and len(shadow_opacities) > 0:
-                # Check if there's variety in shadow opacities for different elevations
-                unique_opacities = len(set(shadow_opacities))
-                if unique_opacities < 2:
-                    self.warnings.append(f"[Visual] {filename}: All shadows at same opacity level. Vary shadow intensity for elevation hierarchy.")
-
-        # --- 3.3 GRADIENT CHECKS ---
-        # Check for gradient usage
-        has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient|conic-gradient', content))
-        if has_gradient:
-            # Warn about mesh/aurora gradients (can be overused)
-            gradient_count = len(re.findall(r'gradient', content, re.IGNORECASE))
-            if gradient_count > 5:
-                self.warnings.append(f"[Visual] {filename}: Many gradients detected ({gradient_count}). Ensure this serves purpose, not decoration.")
-        else:
-            # Check if hero section exists without gradient
-            if has_hero and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visual] {filename}: Hero section without visual interest. Consider gradient for depth.")
-
-        # --- 3.4 BORDER EFFECTS ---
-        # Check for gradient borders or animated borders
-        has_border = bool(re.search(r'border:|border-', content))
-        if has_border:
-            # Check for overly complex borders
-            border_count = len(re.findall(r'border:', content))
-            if border_count > 8:
-                self.warnings.append(f"[Visual] {filename}: Many border declarations ({border_count}). Simplify for cleaner look.")
-
-        # --- 3.5 GLOW EFFECTS ---
-        # Check for text-shadow or multiple box-shadow layers (glow effects)
-        text_shadows = re.findall(r'text-shadow:', content)
-        for ts in text_shadows:
-            # Multiple text-shadow layers indicate glow
-            if ',' in ts:
-                self.warnings.append(f"[Visual] {filename}: Text glow effect detected. Ensure readability is maintained.")
-
-        # Check for box-shadow glow (multiple layers with 0 offset)
-        glow_shadows = re.findall(r'box-shadow:\s*[^;]*0\s+0\s+', content)
-        if len(glow_shadows) > 2:
-            self.warnings.append(f"[Visual] {filename}: Multiple glow effects detected. Use sparingly for emphasis only.")
-
-        # --- 3.6 OVERLAY TECHNIQUES ---
-        # Check for image overlays (for readability)
-        has_images = bool(re.search(r'<img|background-image:|bg-\[url', content))
-        if has_images and has_long_text:
-            has_overlay = bool(re.search(r'overlay|rgba\(0|gradient.*transparent|::after|::before', content))
-            if not has_overlay:
-                self.warnings.append(f"[Visual] {filename}: Text over image without overlay. Add gradient overlay for readability.")
-
-        # --- 3.7 PERFORMANCE: will-change ---
-        # Check for will-change usage
-        if re.search(r'will-change:', content):
-            will_change_props = re.findall(r'will-change:\s*([^;]+)', content)
-            for prop in will_change_props:
-                prop = prop.strip().lower()
-                if prop in ['width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding']:
-                    self.issues.append(f"[Performance] {filename}: will-change on '{prop}' (layout property). Use only for transform/opacity.")
-
-        # Check for excessive will-change usage
-        will_change_count = len(re.findall(r'will-change:', content))
-        if will_change_count > 3:
-            self.warnings.append(f"[Performance] {filename}: Many will-change declarations ({will_change_count}). Use sparingly, only for heavy animations.")
-
-        # --- 3.8 EFFECT SELECTION ---
-        # Check for effect overuse (too many visual effects)
-        effect_count = (
-            (1 if has_gradient else 0) +
-            shadow_count +
-            len(re.findall(r'backdrop-filter|blur\(', content)) +
-            len(re.findall(r'text-shadow:', content))
-        )
-        if effect_count > 10:
-            self.warnings.append(f"[Visual] {filename}: Many visual effects ({effect_count}). Ensure effects serve purpose, not decoration.")
-
-        # Check for static/flat design (no depth)
-        if has_long_text and effect_count == 0:
-            self.warnings.append(f"[Visual] {filename}: Flat design with no depth. Consider shadows or subtle gradients for hierarchy.")
-
-        # --- 4. COLOR SYSTEM (color-system.md) ---
-
-        # 4.1 PURPLE BAN - Critical check from color-system.md
-        purple_hexes = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
-                        '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
-                        '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
-                        'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
-        for purple in purple_hexes:
-            if purple.lower() in content.lower():
-                self.issues.append(f"[Color] {filename}: PURPLE DETECTED ('{purple}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.")
-                break
-
-        # 4.2 60-30-10 Rule check
-        # Count color usage to estimate ratio
-        color_hex_count = len(re.findall(r'#[0-9a-fA-F]{3,6}', content))
-        hsl_count = len(re.findall(r'hsl\(', content))
-        total_colors = color_hex_count + hsl_count
-        if total_colors > 3:
-            # Check for dominant colors (should be ~60%)
-            bg_declarations = re.findall(r'(?:background|bg-|bg\[)([^;}\s]+)', content)
-            text_declarations = re.findall(r'(?:color|text-)([^;}\s]+)', content)
-            if len(bg_declarations) > 0 and len(text_declarations) > 0:
-                # Just warn if too many distinct colors
-                unique_hexes = set(re.findall(r'#[0-9a-fA-F]{6}', content))
-                if len(unique_hexes) > 5:
-                    self.warnings.append(f"[Color] {filename}: {len(unique_hexes)} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%).")
-
-        # 4.3 Color Scheme Pattern Detection
-        # Detect monochromatic (same hue, different lightness)
-        hsl_matches = re.findall(r'hsl\((\d+),\s*\d+%,\s*\d+%\)', content)
-        if len(hsl_matches) >= 3:
-            hues = [int(h) for h in hsl_matches]
-            hue_range = max(hues) - min(hues)
-            if hue_range < 10:
-                self.warnings.append(f"[Color] {filename}: Monochromatic palette detected (hue variance: {hue_range}deg). Ensure adequate contrast.")
-
-        # 4.4 Dark Mode Compliance
-        # Check for pure black (#000000) or pure white (#FFFFFF) text (forbidden)
-        if re.search(r'color:\s*#000000|#000\b', content):
-            self.warnings.append(f"[Color] {filename}: Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode.")
-        if re.search(r'background:\s*#ffffff|#fff\b', content) and re.search(r'dark:\s*|dark:', content):
-            self.warnings.append(f"[Color] {filename}: Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain.")
-
-        # 4.5 WCAG Contrast Pattern Check
-        # Look for potential low-contrast combinations
-        light_bg_light_text = bool(re.search(r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]', content))
-        dark_bg_dark_text = bool(re.search(r'bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]', content))
-        if light_bg_light_text or dark_bg_dark_text:
-            self.warnings.append(f"[Color] {filename}: Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).")
-
-        # 4.6 Color Psychology Context Check
-        # Warn if blue used for food/restaurant context
-        has_blue = bool(re.search(r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}', content))
-        has_food_context = bool(re.search(r'restaurant|food|cooking|recipe|menu|dish|meal', content, re.IGNORECASE))
-        if has_blue and has_food_context:
-            self.warnings.append(f"[Color] {filename}: Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow).")
-
-        # 4.7 HSL-Based Palette Detection
-        # Check if using HSL for palette (recommended in color-system.md)
-        has_color_vars = bool(re.search(r'--color-|color-|primary-|secondary-', content))
-        if has_color_vars and not re.search(r'hsl\(', content):
-            self.warnings.append(f"[Color] {filename}: Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness).")
-
-        # --- 5. ANIMATION GUIDE (animation-guide.md) ---
-
-        # 5.1 Duration Appropriateness
-        # Check for excessively long or short animations
-        durations = re.findall(r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)', content)
-        for duration, unit in durations:
-            duration_ms = float(duration) * (1000 if unit == 's' else 1)
-            if duration_ms < 50:
-                self.warnings.append(f"[Animation] {filename}: Very fast animation ({duration}{unit}). Minimum 50ms for visibility.")
-            elif duration_ms > 1000 and 'transition' in content.lower():
-                self.warnings.append(f"[Animation] {filename}: Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness.")
-
-        # 5.2 Easing Function Correctness
-        # Check for incorrect easing patterns
-        if re.search(r'ease-in\s+.*entry|fade-in.*ease-in', content):
-            self.warnings.append(f"[Animation] {filename}: Entry animation with ease-in. Entry should use ease-out for snappy feel.")
-        if re.search(r'ease-out\s+.*exit|fade-out.*ease-out', content):
-            self.warnings.append(f"[Animation] {filename}: Exit animation with ease-out. Exit should use ease-in for natural feel.")
-
-        # 5.3 Micro-interaction Feedback Patterns
-        # Check for interactive elements without hover/focus states
-        interactive_elements = len(re.findall(r'<button|<a\s+href|onClick|@click', content))
-        has_hover_focus = bool(re.search(r'hover:|focus:|:hover|:focus', content))
-        if interactive_elements > 2 and not has_hover_focus:
-            self.warnings.append(f"[Animation] {filename}: Interactive elements without hover/focus states. Add micro-interactions for feedback.")
-
-        # 5.4 Loading State Indicators
-        # Check for loading patterns
-        has_async = bool(re.search(r'async|await|fetch|axios|loading|isLoading', content))
-        has_loading_indicator = bool(re.search(r'skeleton|spinner|progress|loading|<circle.*animate', content))
-        if has_async and not has_loading_indicator:
-            self.warnings.append(f"[Animation] {filename}: Async operations without loading indicator. Add skeleton or spinner for perceived performance.")
-
-        # 5.5 Page Transition Patterns
-        # Check for page/view transitions
-        has_routing = bool(re.search(r'router|navigate|Link.*to|useHistory', content))
-        has_page_transition = bool(re.search(r'AnimatePresence|motion\.|transition.*page|fade.*route', content))
-        if has_routing and not has_page_transition:
-            self.warnings.append(f"[Animation] {filename}: Routing detected without page transitions. Consider fade/slide for context continuity.")
-
-        # 5.6 Scroll Animation Performance
-        # Check for scroll-driven animations
-        has_scroll_anim = bool(re.search(r'onScroll|scroll.*trigger|IntersectionObserver', content))
-        if has_scroll_anim:
-            # Check if using expensive properties in scroll handlers
-            if re.search(r'onScroll.*[^\w](width|height|top|left)', content):
-                self.issues.append(f"[Animation] {filename}: Scroll handler animating layout properties. Use transform/opacity for 60fps.")
-
-        # --- 6. MOTION GRAPHICS (motion-graphics.md) ---
-
-        # 6.1 Lottie Animation Checks
-        has_lottie = bool(re.search(r'lottie|Lottie|@lottie-react', content))
-        if has_lottie:
-            # Check for reduced motion fallback
-            has_lottie_fallback = bool(re.search(r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop', content))
-            if not has_lottie_fallback:
-                self.warnings.append(f"[Motion] {filename}: Lottie animation without reduced-motion fallback. Add pause/stop for accessibility.")
-
-        # 6.2 GSAP Memory Leak Risks
-        has_gsap = bool(re.search(r'gsap|ScrollTrigger|from\(.*gsap', content))
-        if has_gsap:
-            # Check for cleanup patterns
-            has_gsap_cleanup = bool(re.search(r'kill\(|revert\(|useEffect.*return.*gsap', content))
-            if not has_gsap_cleanup:
-                self.issues.append(f"[Motion] {filename}: GSAP animation without cleanup (kill/revert). Memory leak risk on unmount.")
-
-        # 6.3 SVG Animation Performance
-        svg_animations = re.findall(r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset', content)
-        if len(svg_animations) > 3:
-            self.warnings.append(f"[Motion] {filename}: Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance.")
-
-        # 6.4 3D Transform Performance
-        has_3d_transform = bool(re.search(r'transform3d|perspective\(|rotate3d|translate3d', content))
-        if has_3d_transform:
-            # Check for perspective on parent
-            has_perspective_parent = bool(re.search(r'perspective:\s*\d+px|perspective\s*\(', content))
-            if not has_perspective_parent:
-                self.warnings.append(f"[Motion] {filename}: 3D transform without perspective parent. Add perspective: 1000px for realistic depth.")
-
-            # Warn about mobile performance
-            self.warnings.append(f"[Motion] {filename}: 3D transforms detected. Test on mobile; can impact performance on low-end devices.")
-
-        # 6.5 Particle Effect Warnings
-        # Check for canvas/WebGL particle systems
-        has_particles = bool(re.search(r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js', content))
-        if has_particles:
-            self.warnings.append(f"[Motion] {filename}: Particle effects detected. Ensure fallback or reduced-quality option for mobile devices.")
-
-        # 6.6 Scroll-Driven Animation Performance
-        has_scroll_driven = bool(re.search(r'IntersectionObserver.*animate|scroll.*progress|view-timeline', content))
-        if has_scroll_driven:
-            # Check for throttling/debouncing
-            has_throttle = bool(re.search(r'throttle|debounce|requestAnimationFrame', content))
-            if not has_throttle:
-                self.issues.append(f"[Motion] {filename}: Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps.")
-
-        # 6.7 Motion Decision Tree - Context Check
-        # Check if animation serves purpose (not just decoration)
-        total_animations = (
-            len(re.findall(r'@keyframes|transition:|animate-', content)) +
-            (1 if has_lottie else 0) +
-            (1 if has_gsap else 0)
-        )
-        if total_animations > 5:
-            # Check if animations are functional
-            functional_animations = len(re.findall(r'hover:|focus:|disabled|loading|error|success', content))
-            if functional_animations < total_animations / 2:
-                self.warnings.append(f"[Motion] {filename}: Many animations ({total_animations}). Ensure majority serve functional purpose (feedback, guidance), not decoration.")
-
-        # --- 7. ACCESSIBILITY ---
-        if re.search(r'<img(?![^>]*alt=)[^>]*>', content):
-            self.issues.append(f"[Accessibility] {filename}: Missing img alt text")
+        self.issues.extend(issues)
+        self.warnings.extend(warnings)
+        self.passed_count += passed
+
+    def audit_file(self, filepath: str) -> None:
+        self._add(_audit_path(filepath))
 
     def audit_directory(self, directory: str) -> None:
         extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+        # node_modules, .git, dist, build and .next are pruned by the shared index
+        paths = [str(filepath) for filepath in get_index(directory).files(extensions)]
+        for result in _run_tasks(paths, self.workers):
+            self._add(result)
 
     def get_report(self):
         return {
@@ -693,8 +717,9 @@ def main():
     
     path = sys.argv[1]
     is_json = "--json" in sys.argv
+    workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv[:-1] else None
     
-    auditor = UXAuditor()
+    auditor = UXAuditor(workers)
     if os.path.isfile(path): auditor.audit_file(path)
     else: auditor.audit_directory(path)
     
@@ -21,6 +21,9 @@ import re
 import json
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_index import get_index, read_text
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -80,18 +83,8 @@ def is_page_file(file_path: Path) -> bool:
 
 def find_web_pages(project_path: Path) -> list:
     """Find public-facing web pages only."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+    candidates = get_index(project_path).files(('.html', '.htm', '.jsx', '.tsx'), skip_dirs=SKIP_DIRS)
+    files = [f for f in candidates if is_page_file(f)]
     
     return files[:30]  # Limit to 30 pages
 
@@ -99,7 +92,7 @@ def find_web_pages(project_path: Path) -> list:
 def check_page(file_path: Path) -> dict:
     """Check a single web page for GEO elements."""
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path, errors='ignore')
     except Exception as e:
         return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
     
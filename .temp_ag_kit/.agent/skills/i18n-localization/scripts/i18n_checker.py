@@ -8,6 +8,9 @@ import re
 import json
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_index import get_index, read_text
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -61,11 +64,7 @@ def find_locale_files(project_path: Path) -> list:
         "**/*.po",  # gettext
     ]
     
-    files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
-    
-    return [f for f in files if 'node_modules' not in str(f)]
+    return get_index(project_path).glob(*patterns)
 
 def check_locale_completeness(locale_files: list) -> dict:
     """Check if all locales have the same keys."""
@@ -81,7 +80,7 @@ def check_locale_completeness(locale_files: list) -> dict:
         if f.suffix == '.json':
             try:
                 lang = f.parent.name
-                content = json.loads(f.read_text(encoding='utf-8'))
+                content = json.loads(read_text(f))
                 if lang not in locales:
                     locales[lang] = {}
                 locales[lang][f.stem] = set(flatten_keys(content))
@@ -140,12 +139,9 @@ def check_hardcoded_strings(project_path: Path) -> dict:
         '.py': 'python'
     }
     
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
-    
-    code_files = [f for f in code_files if not any(x in str(f) for x in 
-                  ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
+    # node_modules, .git, dist, build, __pycache__ and venv are pruned by the shared index
+    code_files = get_index(project_path).files(extensions, skip_dirs={'test', 'tests', '__tests__', 'spec'})
+    code_files = [f for f in code_files if 'test' not in f.name and 'spec' not in f.name]
     
     if not code_files:
         return {'passed': ["[!] No code files found"], 'issues': []}
@@ -156,7 +152,7 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     for file_path in code_files[:50]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path, errors='ignore')
             ext = file_path.suffix
             file_type = extensions.get(ext, 'jsx')
             
@@ -25,6 +25,10 @@ try:
 except:
     pass
 
+# Linters run as child processes (npm/npx, ruff, mypy), so check_runner runs this
+# check as a subprocess too: it then gets a timeout, memory limit and cancellation
+RUN_AS_SUBPROCESS = True
+
 
 def detect_project_type(project_path: Path) -> dict:
     """Detect project type and available linters."""
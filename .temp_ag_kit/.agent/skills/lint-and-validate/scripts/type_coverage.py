@@ -8,6 +8,9 @@ import re
 import subprocess
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_index import get_index, read_text
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -21,15 +24,14 @@ def check_typescript_coverage(project_path: Path) -> dict:
     passed = []
     stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
     
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
-    ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
+    ts_files = [f for f in get_index(project_path).files(('.ts', '.tsx')) if not f.name.endswith('.d.ts')]
     
     if not ts_files:
         return {'type': 'typescript', 'files': 0, 'passed': [], 'issues': ["[!] No TypeScript files found"], 'stats': stats}
     
     for file_path in ts_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path, errors='ignore')
             
             # Count 'any' usage
             any_matches = re.findall(r':\s*any\b', content)
@@ -77,15 +79,15 @@ def check_python_coverage(project_path: Path) -> dict:
     passed = []
     stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
     
-    py_files = list(project_path.rglob("*.py"))
-    py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
+    # venv, __pycache__, .git and node_modules are pruned by the shared index
+    py_files = get_index(project_path).files(('.py',))
     
     if not py_files:
         return {'type': 'python', 'files': 0, 'passed': [], 'issues': ["[!] No Python files found"], 'stats': stats}
     
     for file_path in py_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path, errors='ignore')
             
             # Count Any usage
             any_matches = re.findall(r':\s*Any\b', content)
@@ -71,6 +71,9 @@ import re
 import json
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_index import get_index, read_text
+
 class MobileAuditor:
     def __init__(self):
         self.issues = []
@@ -80,8 +83,7 @@ class MobileAuditor:
 
     def audit_file(self, filepath: str) -> None:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            content = read_text(filepath, errors='replace')
         except:
             return
 
@@ -612,11 +614,9 @@ class MobileAuditor:
 
     def audit_directory(self, directory: str) -> None:
         extensions = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', 'build', '.idea'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+        # node_modules, .git, dist, build and .next are pruned by the shared index
+        for filepath in get_index(directory).files(extensions, skip_dirs={'ios', 'android', '.idea'}):
+            self.audit_file(str(filepath))
 
     def get_report(self):
         return {
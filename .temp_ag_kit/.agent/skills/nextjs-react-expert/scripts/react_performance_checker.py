@@ -7,176 +7,210 @@ Based on Vercel Engineering best practices
 
 import os
 import re
+import sys
 import json
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, NamedTuple, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_index import get_index, read_text
+
+SCRIPT_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+TS_EXTENSIONS = ('.ts', '.tsx')
+LARGE_COMPONENT_CHARS = 10000  # components above this should be code-split
+
+# import X from '...', import { A as B } from '...', export * from '...', import '...'
+STATIC_IMPORT = re.compile(
+    r"""^[ \t]*(?:import|export)\s+(?:type\s+)?(?:(?P<names>[\w$*\s{},]+?)\s+from\s*)?['"](?P<spec>[^'"\n]+)['"]""",
+    re.M)
+# import('...') inside dynamic(() => ...), React.lazy(() => ...) etc.
+DYNAMIC_IMPORT = re.compile(r"""\bimport\(\s*['"](?P<spec>[^'"\n]+)['"]\s*\)""")
+IDENTIFIER = re.compile(r'[A-Za-z_$][\w$]*')
+SEQUENTIAL_AWAITS = re.compile(r'await\s+\w+.*?\n\s*await\s+\w+')
+USE_EFFECT_FETCH = re.compile(r'useEffect.*?fetch\(', re.DOTALL)
+COMPONENT_DEF = re.compile(r'(?:export\s+)?(?:const|function)\s+([A-Z]\w+)')
+
+
+class Import(NamedTuple):
+    spec: str                # module specifier as written
+    names: frozenset         # identifiers bound by the import (static imports)
+    dynamic: bool            # loaded with import() for code splitting
+    target: Optional[Path]   # resolved project file, None for packages/unresolved
+
 
 class PerformanceChecker:
     def __init__(self, project_path: str):
-        self.project_path = Path(project_path)
+        self.project_path = Path(project_path).resolve()
+        self.index = get_index(self.project_path)
         self.issues = []
         self.warnings = []
         self.passed = []
+        self.sources = {}    # path -> content, every script file read exactly once
+        self.imports = {}    # path -> [Import]
+        self.importers = {}  # resolved target -> [(importer, Import)]
+
+    # ============ IMPORT GRAPH ============
+    def build_graph(self):
+        """Read every script file once and record who imports what."""
+        for filepath in self.index.files(SCRIPT_EXTENSIONS):
+            try:
+                self.sources[filepath] = read_text(filepath)
+            except Exception:
+                continue
 
+        for filepath, content in self.sources.items():
+            edges = []
+            for m in STATIC_IMPORT.finditer(content):
+                names = frozenset(IDENTIFIER.findall(m.group('names') or '')) - {'as', 'type'}
+                edges.append(Import(m.group('spec'), names, False, self._resolve(filepath, m.group('spec'))))
+            for m in DYNAMIC_IMPORT.finditer(content):
+                edges.append(Import(m.group('spec'), frozenset(), True, self._resolve(filepath, m.group('spec'))))
+            self.imports[filepath] = edges
+            for edge in edges:
+                if edge.target is not None:
+                    self.importers.setdefault(edge.target, []).append((filepath, edge))
+
+    def _resolve(self, importer: Path, spec: str) -> Optional[Path]:
+        """Map a relative or '@/' specifier to an indexed file (extension and index files optional)."""
+        if spec.startswith('.'):
+            bases = [importer.parent / spec]
+        elif spec.startswith('@/'):
+            bases = [self.project_path / spec[2:], self.project_path / 'src' / spec[2:]]
+        else:
+            return None
+        for base in bases:
+            base = os.path.normpath(base)
+            for candidate in [base] + [base + ext for ext in SCRIPT_EXTENSIONS] + \
+                             [os.path.join(base, 'index' + ext) for ext in SCRIPT_EXTENSIONS]:
+                if Path(candidate) in self.sources:
+                    return Path(candidate)
+        return None
+
+    def _files(self, extensions: Tuple[str, ...]) -> List[Path]:
+        return [f for f in self.sources if f.suffix.lower() in extensions]
+
+    def _relative(self, filepath: Path) -> str:
+        return str(filepath.relative_to(self.project_path))
+
+    # ============ CHECKS ============
     def check_waterfalls(self):
         """Check for sequential await patterns (Section 1)"""
         print("\n[*] Checking for waterfalls (sequential awaits)...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: multiple awaits in sequence without Promise.all
-                sequential_awaits = re.findall(r'await\s+\w+.*?\n\s*await\s+\w+', content)
-
-                if sequential_awaits:
-                    self.issues.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'CRITICAL',
-                        'issue': 'Sequential awaits detected (waterfall)',
-                        'fix': 'Use Promise.all() for parallel fetching',
-                        'section': '1-async-eliminating-waterfalls.md'
-                    })
-            except Exception as e:
-                continue
+        for filepath in self._files(SCRIPT_EXTENSIONS):
+            # Pattern: multiple awaits in sequence without Promise.all
+            if SEQUENTIAL_AWAITS.search(self.sources[filepath]):
+                self.issues.append({
+                    'file': self._relative(filepath),
+                    'type': 'CRITICAL',
+                    'issue': 'Sequential awaits detected (waterfall)',
+                    'fix': 'Use Promise.all() for parallel fetching',
+                    'section': '1-async-eliminating-waterfalls.md'
+                })
 
     def check_barrel_imports(self):
         """Check for barrel imports (Section 2)"""
         print("[*] Checking for barrel imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
+        for filepath in self._files(SCRIPT_EXTENSIONS):
+            # Static imports of an index file, by path or through a directory import
+            barrel_imports = [edge for edge in self.imports[filepath] if not edge.dynamic and (
+                edge.spec.endswith('/index') if edge.target is None else edge.target.stem == 'index')]
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: import from index files or barrel exports
-                barrel_imports = re.findall(r"import.*from\s+['\"](@/.*?)/index['\"]", content)
-                barrel_imports += re.findall(r"import.*from\s+['\"]\.\.?/.*?['\"](?!.*?\.tsx?)", content)
-
-                if barrel_imports:
-                    self.warnings.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'CRITICAL',
-                        'issue': 'Potential barrel imports detected',
-                        'fix': 'Import directly from specific files',
-                        'section': '2-bundle-bundle-size-optimization.md'
-                    })
-            except Exception as e:
-                continue
+            if barrel_imports:
+                self.warnings.append({
+                    'file': self._relative(filepath),
+                    'type': 'CRITICAL',
+                    'issue': 'Potential barrel imports detected',
+                    'fix': 'Import directly from specific files',
+                    'section': '2-bundle-bundle-size-optimization.md'
+                })
 
     def check_dynamic_imports(self):
         """Check if large components use dynamic imports (Section 2)"""
         print("[*] Checking for missing dynamic imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check file size - if > 10KB, should probably use dynamic import
-                if len(content) > 10000:
-                    # Check if it's imported statically somewhere
-                    filename = filepath.stem
-
-                    # Search for static imports of this component
-                    for check_file in self.project_path.rglob('*.{ts,tsx}'):
-                        if check_file == filepath or 'node_modules' in str(check_file):
-                            continue
-
-                        check_content = check_file.read_text(encoding='utf-8')
-                        if f"import {filename}" in check_content or f"import {{ {filename}" in check_content:
-                            if 'dynamic(' not in check_content:
-                                self.warnings.append({
-                                    'file': str(check_file.relative_to(self.project_path)),
-                                    'type': 'CRITICAL',
-                                    'issue': f'Large component {filename} imported statically',
-                                    'fix': 'Use dynamic() for code splitting',
-                                    'section': '2-bundle-bundle-size-optimization.md'
-                                })
-                                break
-            except Exception as e:
+        # Unresolved static imports by bound name, for components imported via unknown aliases
+        by_name = {}
+        for filepath in self._files(TS_EXTENSIONS):
+            for edge in self.imports[filepath]:
+                if edge.target is None and not edge.dynamic:
+                    for name in edge.names:
+                        by_name.setdefault(name, []).append((filepath, edge))
+
+        for filepath in self._files(TS_EXTENSIONS):
+            # Check file size - if > 10KB, should probably use dynamic import
+            if len(self.sources[filepath]) <= LARGE_COMPONENT_CHARS:
                 continue
+            filename = filepath.stem
+            importers = [(f, e) for f, e in self.importers.get(filepath, ()) if f.suffix.lower() in TS_EXTENSIONS]
+            importers += by_name.get(filename, [])
+            split = {f for f, e in importers if e.dynamic}
+
+            for importer, edge in importers:
+                if importer == filepath or edge.dynamic or importer in split:
+                    continue
+                self.warnings.append({
+                    'file': self._relative(importer),
+                    'type': 'CRITICAL',
+                    'issue': f'Large component {filename} imported statically',
+                    'fix': 'Use dynamic() for code splitting',
+                    'section': '2-bundle-bundle-size-optimization.md'
+                })
+                break
 
     def check_useEffect_fetching(self):
         """Check for data fetching in useEffect (Section 4)"""
         print("[*] Checking for useEffect data fetching...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
-                continue
+        for filepath in self._files(TS_EXTENSIONS):
+            content = self.sources[filepath]
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: fetch or axios in useEffect
-                if 'useEffect' in content:
-                    if re.search(r'useEffect.*?fetch\(', content, re.DOTALL):
-                        self.warnings.append({
-                            'file': str(filepath.relative_to(self.project_path)),
-                            'type': 'MEDIUM-HIGH',
-                            'issue': 'Data fetching in useEffect',
-                            'fix': 'Consider using SWR or React Query for deduplication',
-                            'section': '4-client-client-side-data-fetching.md'
-                        })
-            except Exception as e:
-                continue
+            # Pattern: fetch or axios in useEffect
+            if 'useEffect' in content and USE_EFFECT_FETCH.search(content):
+                self.warnings.append({
+                    'file': self._relative(filepath),
+                    'type': 'MEDIUM-HIGH',
+                    'issue': 'Data fetching in useEffect',
+                    'fix': 'Consider using SWR or React Query for deduplication',
+                    'section': '4-client-client-side-data-fetching.md'
+                })
 
     def check_missing_memoization(self):
         """Check for missing React.memo, useMemo, useCallback (Section 5)"""
         print("[*] Checking for missing memoization...")
 
-        for filepath in self.project_path.rglob('*.{tsx}'):
-            if 'node_modules' in str(filepath):
-                continue
+        for filepath in self._files(('.tsx',)):
+            content = self.sources[filepath]
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check for component definitions without memo
-                components = re.findall(r'(?:export\s+)?(?:const|function)\s+([A-Z]\w+)', content)
-
-                if components and 'React.memo' not in content and 'memo(' not in content:
-                    # Check if component receives props
-                    if 'props:' in content or 'Props>' in content:
-                        self.warnings.append({
-                            'file': str(filepath.relative_to(self.project_path)),
-                            'type': 'MEDIUM',
-                            'issue': 'Component with props not memoized',
-                            'fix': 'Consider using React.memo if props are stable',
-                            'section': '5-rerender-re-render-optimization.md'
-                        })
-            except Exception as e:
+            # Check for component definitions without memo
+            if 'React.memo' in content or 'memo(' in content or not COMPONENT_DEF.search(content):
                 continue
+            # Check if component receives props
+            if 'props:' in content or 'Props>' in content:
+                self.warnings.append({
+                    'file': self._relative(filepath),
+                    'type': 'MEDIUM',
+                    'issue': 'Component with props not memoized',
+                    'fix': 'Consider using React.memo if props are stable',
+                    'section': '5-rerender-re-render-optimization.md'
+                })
 
     def check_image_optimization(self):
         """Check for unoptimized images (Section 6)"""
         print("[*] Checking for image optimization...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check for <img> tags instead of next/image
-                if '<img' in content and 'next/image' not in content:
-                    self.warnings.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'MEDIUM',
-                        'issue': 'Using <img> instead of next/image',
-                        'fix': 'Use next/image for automatic optimization',
-                        'section': '6-rendering-rendering-performance.md'
-                    })
-            except Exception as e:
-                continue
+        for filepath in self._files(SCRIPT_EXTENSIONS):
+            # Check for <img> tags instead of next/image
+            if '<img' in self.sources[filepath] and \
+                    not any(edge.spec == 'next/image' for edge in self.imports[filepath]):
+                self.warnings.append({
+                    'file': self._relative(filepath),
+                    'type': 'MEDIUM',
+                    'issue': 'Using <img> instead of next/image',
+                    'fix': 'Use next/image for automatic optimization',
+                    'section': '6-rendering-rendering-performance.md'
+                })
 
     def generate_report(self):
         """Generate final report"""
@@ -221,6 +255,9 @@ class PerformanceChecker:
         print("="*60)
         print(f"Scanning: {self.project_path}")
 
+        self.build_graph()
+        print(f"Indexed {len(self.sources)} files, "
+              f"{sum(len(edges) for edges in self.imports.values())} imports")
         self.check_waterfalls()
         self.check_barrel_imports()
         self.check_dynamic_imports()
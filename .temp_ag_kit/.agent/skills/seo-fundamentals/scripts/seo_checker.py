@@ -23,6 +23,9 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from project_index import get_index, read_text
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -77,18 +80,8 @@ def is_page_file(file_path: Path) -> bool:
 
 def find_pages(project_path: Path) -> list:
     """Find page files to check."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+    candidates = get_index(project_path).files(('.html', '.htm', '.jsx', '.tsx'), skip_dirs=SKIP_DIRS)
+    files = [f for f in candidates if is_page_file(f)]
     
     return files[:50]  # Limit to 50 files
 
@@ -98,7 +91,7 @@ def check_page(file_path: Path) -> dict:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path, errors='ignore')
     except Exception as e:
         return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
     
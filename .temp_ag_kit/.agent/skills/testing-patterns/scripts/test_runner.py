@@ -23,6 +23,10 @@ try:
 except:
     pass
 
+# Test suites can run for minutes in their own processes; check_runner runs this
+# check as a subprocess instead of in-process (see its plugin API)
+RUN_AS_SUBPROCESS = True
+
 
 def detect_test_framework(project_path: Path) -> dict:
     """Detect test framework and commands."""
@@ -3,9 +3,14 @@
 Skill: vulnerability-scanner
 Script: security_scan.py
 Purpose: Validate that security principles from SKILL.md are applied correctly
-Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config]
+Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config] [--workers N]
+       python security_scan.py <project_path> --changed-since HEAD    # pre-commit: always rescan changed files
 Output: JSON with validation findings
 
+Findings are cached per file (path + content hash + pattern version) in the
+user cache directory, so repeated scans only run the patterns over files
+whose content changed. --no-cache disables this.
+
 This script verifies:
 1. Dependencies - Supply chain security (OWASP A03)
 2. Secrets - No hardcoded credentials (OWASP A04)
@@ -13,13 +18,16 @@ This script verifies:
 4. Configuration - Security settings validated (OWASP A02)
 """
 import subprocess
+import hashlib
 import json
 import os
 import sys
 import re
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Tuple
 from datetime import datetime
 
 # Fix Windows console encoding for Unicode output
@@ -29,6 +37,9 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
+# npm audit waits on the network; check_runner runs this check as a subprocess
+RUN_AS_SUBPROCESS = True
+
 
 # ============================================================================
 #  CONFIGURATION
@@ -85,9 +96,414 @@ DANGEROUS_PATTERNS = [
     (r'yaml\.load\s*\([^)]*\)(?!\s*,\s*Loader)', "Unsafe YAML load", "high", "Deserialization risk"),
 ]
 
+CONFIG_ISSUES = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+]
+
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
+CONFIG_FILENAMES = {'next.config.js', 'webpack.config.js', '.eslintrc.js'}
+
+# Scanners that read project files; they share one walk and one read per file
+FILE_SCANNERS = ("secrets", "patterns", "config")
+PARALLEL_MIN_FILES = 64  # below this, starting a process pool costs more than it saves
+
+# Findings cache: one JSON file per project under the user cache directory
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "antigravity-kit" / "security_scan"
+CACHE_FORMAT = 1
+# Changes whenever a pattern set changes, invalidating every cached finding
+PATTERN_VERSION = hashlib.sha1(
+    repr((CACHE_FORMAT, SECRET_PATTERNS, DANGEROUS_PATTERNS, CONFIG_ISSUES)).encode("utf-8")
+).hexdigest()[:16]
+
+# Patterns are compiled once at import (and once per worker process)
+_SECRET_REGEXES = [(re.compile(p, re.IGNORECASE), name, sev) for p, name, sev in SECRET_PATTERNS]
+_DANGEROUS_REGEXES = [(re.compile(p, re.IGNORECASE), name, sev, cat) for p, name, sev, cat in DANGEROUS_PATTERNS]
+_CONFIG_REGEXES = [(re.compile(p, re.IGNORECASE), issue, sev) for p, issue, sev in CONFIG_ISSUES]
+
+
+def _line_local(pattern: str) -> str:
+    """
+    Rewrite a pattern so it cannot match across a newline: whitespace and
+    negated character classes no longer include it ("." never did).
+    Assumes \\s is only used outside character classes, as in DANGEROUS_PATTERNS.
+    """
+    return pattern.replace('[^', r'[^\n').replace(r'\s', r'[^\S\n]')
+
+
+def _skip_class(pattern: str, i: int) -> int:
+    """Index just past the character class starting at pattern[i] == '['."""
+    i += 1
+    if pattern.startswith("^", i):
+        i += 1
+    if pattern.startswith("]", i):
+        i += 1
+    while i < len(pattern) and pattern[i] != "]":
+        i += 2 if pattern[i] == "\\" else 1
+    return i + 1
+
+
+def _skip_group(pattern: str, i: int) -> int:
+    """Index just past the group starting at pattern[i] == '('."""
+    depth = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "[":
+            i = _skip_class(pattern, i)
+            continue
+        depth += {"(": 1, ")": -1}.get(c, 0)
+        i += 1
+        if depth == 0:
+            break
+    return i
+
+
+_QUANTIFIER = re.compile(r'(?:[*+?]|\{\d*,?\d*\})[?+]?')
+
+
+def _required_literal(pattern: str):
+    """
+    Longest run of literal characters every match of the pattern contains
+    (lowercased), or None when there is none (e.g. a top-level alternation).
+    Groups, character classes and class escapes break runs; a character made
+    optional by ?, * or {0,...} is dropped from them.
+    """
+    runs, run, i = [], "", 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "|":
+            return None
+        if c == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            item, i = pattern[i + 1], i + 2      # escaped literal: \. \( \{ ...
+        elif c == "\\":
+            item, i = None, i + 2                # class escape: \s \d \w ...
+        elif c == "[":
+            item, i = None, _skip_class(pattern, i)
+        elif c == "(":
+            item, i = None, _skip_group(pattern, i)
+        elif c in ".^$":
+            item, i = None, i + 1
+        else:
+            item, i = c, i + 1
+
+        quantifier = _QUANTIFIER.match(pattern, i)
+        if quantifier:
+            i = quantifier.end()
+        optional = quantifier and quantifier.group().startswith(("?", "*", "{0", "{,"))
+        if item is None or optional:
+            runs.append(run)
+            run = ""
+        elif quantifier:
+            runs.append(run + item)              # repeated: the run cannot continue past it
+            run = ""
+        else:
+            run += item
+    runs.append(run)
+    return max(runs, key=len).lower() or None
+
+
+# Required literal per dangerous pattern: a file (or line) can only match the
+# pattern if it contains the literal, so the literal check is a cheap prefilter
+_DANGEROUS_LITERALS = [_required_literal(p) for p, _, _, _ in DANGEROUS_PATTERNS]
+
+# Characters IGNORECASE matches to an ASCII letter that str.lower() does not fold
+_CASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+# Combined alternation (one named group per pattern) per set of candidate patterns
+_DANGEROUS_COMBINED = {}
+
+
+def _combined_regex(indices: Tuple[int, ...]):
+    """One line-local alternation over the given DANGEROUS_PATTERNS, compiled once per set."""
+    regex = _DANGEROUS_COMBINED.get(indices)
+    if regex is None:
+        regex = re.compile(
+            "|".join(f"(?P<p{i}>{_line_local(DANGEROUS_PATTERNS[i][0])})" for i in indices),
+            re.IGNORECASE
+        )
+        _DANGEROUS_COMBINED[indices] = regex
+    return regex
+
+
+# ============================================================================
+#  FILE SCANNING ENGINE
+# ============================================================================
+
+def _file_scanners(filename: str) -> Tuple[str, ...]:
+    """Which file scanners apply to a file, by extension and name."""
+    ext = Path(filename).suffix.lower()
+    wanted = []
+    if ext in CODE_EXTENSIONS or ext in CONFIG_EXTENSIONS:
+        wanted.append("secrets")
+    if ext in CODE_EXTENSIONS:
+        wanted.append("patterns")
+    if ext in CONFIG_EXTENSIONS or filename in CONFIG_FILENAMES:
+        wanted.append("config")
+    return tuple(wanted)
+
+
+def walk_project(project_path: str, scanners=FILE_SCANNERS) -> Iterator[Tuple[str, str, Tuple[str, ...]]]:
+    """
+    Walk the project once, yielding (path, relative path, scanners) for every
+    file at least one of the requested scanners wants.
+    """
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+
+        for file in files:
+            wanted = tuple(name for name in _file_scanners(file) if name in scanners)
+            if wanted:
+                filepath = Path(root) / file
+                yield str(filepath), str(filepath.relative_to(project_path)), wanted
+
+
+def _match_dangerous(content: str) -> List[tuple]:
+    """
+    Find DANGEROUS_PATTERNS per line with one pass over the whole buffer.
+
+    Patterns whose required literal is absent from the file are ruled out
+    first; the rest run as one combined line-local regex. Its matches never
+    span lines, so every line where any pattern matches gets at least one hit.
+    Hit lines are then checked against each candidate pattern in order (several
+    can match the same line); line numbers are derived from match offsets
+    instead of splitting the file.
+    """
+    folded = content.translate(_CASE_FOLD).lower()
+    indices = tuple(i for i, literal in enumerate(_DANGEROUS_LITERALS) if literal is None or literal in folded)
+    if not indices:
+        return []
+    candidates = [_DANGEROUS_REGEXES[i] for i in indices]
+
+    found = []
+    line_num, counted_to, line_end = 1, 0, -1
+    for match in _combined_regex(indices).finditer(content):
+        pos = match.start()
+        if pos <= line_end:
+            continue  # line already checked
+        line_num += content.count("\n", counted_to, pos)
+        counted_to = pos
+        line_start = content.rfind("\n", 0, pos) + 1
+        line_end = content.find("\n", pos)
+        if line_end < 0:
+            line_end = len(content)
+        line = content[line_start:line_end]
+        for regex, name, severity, category in candidates:
+            if regex.search(line):
+                found.append((line_num, name, severity, category, line.strip()[:80]))
+    return found
+
+
+def _scan_file(task: tuple) -> tuple:
+    """
+    Read one file and run every requested scanner over it (process pool worker).
+
+    task is (path, relative path, scanners, known content hash or None).
+    Returns (relative path, scanners, {scanner: raw findings}, content hash).
+    When the hash equals the known one the patterns are skipped and findings
+    is None (reuse the cached ones); an unreadable file yields no findings
+    and no hash, like the per-scanner walks it replaces.
+    """
+    path, rel_path, scanners, known_hash = task
+    found = {name: [] for name in scanners}
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except Exception:
+        return rel_path, scanners, found, None
+
+    digest = hashlib.sha1(data).hexdigest()
+    if digest == known_hash:
+        return rel_path, scanners, None, digest
+    # Same text as open(..., 'r', encoding='utf-8', errors='ignore').read()
+    content = data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+
+    if "secrets" in scanners:
+        for regex, secret_type, severity in _SECRET_REGEXES:
+            count = len(regex.findall(content))
+            if count:
+                found["secrets"].append((secret_type, severity, count))
+
+    if "patterns" in scanners:
+        found["patterns"] = _match_dangerous(content)
+
+    if "config" in scanners:
+        for regex, issue, severity in _CONFIG_REGEXES:
+            if regex.search(content):
+                found["config"].append((issue, severity))
+
+    return rel_path, scanners, found, digest
+
+
+def _default_workers() -> int:
+    """Every core when run as a script; no pool when imported into a host process with threads of its own."""
+    return (os.cpu_count() or 1) if __name__ == "__main__" else 1
+
+
+def _run_tasks(tasks: list, workers: int) -> list:
+    """_scan_file over tasks, on a process pool when it is worth it."""
+    if workers > 1 and len(tasks) >= PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(_scan_file, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+        except (OSError, NotImplementedError):
+            pass  # no multiprocessing support here (e.g. sandboxed /dev/shm)
+        except BrokenProcessPool as e:
+            print(f"[!] Scan worker pool failed ({e}); scanning serially", file=sys.stderr)
+    return [_scan_file(task) for task in tasks]
+
+
+def scan_files(project_path: str, scanners=FILE_SCANNERS, workers: int = None,
+               cache: "FindingsCache" = None, changed: set = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the file scanners over the project with a single walk and one read per file.
+
+    Files are dispatched to a process pool (workers=None uses every core, or
+    none when this module was imported rather than run; workers=1 scans
+    in-process); results are merged in walk order, so output
+    does not depend on the worker count.
+
+    With a FindingsCache, files whose size and mtime are unchanged reuse their
+    cached findings, and other files are only pattern-scanned when their
+    content hash differs. `changed` (relative paths, see changed_files) can
+    only force rescans: files git does not report (ignored files, checkouts
+    outside the diff range) still go through the stat check.
+    """
+    walked = list(walk_project(project_path, scanners))
+    workers = workers or _default_workers()
+
+    reused, tasks = {}, []
+    for path, rel_path, wanted in walked:
+        entry = cache.lookup(rel_path, wanted) if cache else None
+        forced = changed is not None and rel_path in changed
+        if entry is not None and not forced and cache.stat_matches(entry, path):
+            reused[rel_path] = {name: entry["found"][name] for name in wanted}
+        else:
+            tasks.append((path, rel_path, wanted, entry["hash"] if entry else None))
+
+    rescanned = 0
+    for rel_path, wanted, found, digest in _run_tasks(tasks, workers):
+        if found is None:  # content unchanged since it was cached
+            found = {name: cache.entries[rel_path]["found"][name] for name in wanted}
+        else:
+            rescanned += 1
+        if cache is not None and digest is not None:
+            cache.store(rel_path, os.path.join(project_path, rel_path), digest, found)
+        reused[rel_path] = found
+
+    scanned = [(rel_path, wanted, reused[rel_path]) for _, rel_path, wanted in walked]
+    if cache is not None:
+        cache.stats = {"files": len(walked), "read": len(tasks), "rescanned": rescanned,
+                       "reused": len(walked) - rescanned}
+        cache.save(keep_unvisited=set(scanners) != set(FILE_SCANNERS), visited={rel for _, rel, _ in walked})
+
+    results = {}
+    if "secrets" in scanners:
+        results["secrets"] = _secret_results(scanned)
+    if "patterns" in scanners:
+        results["patterns"] = _pattern_results(scanned)
+    if "config" in scanners:
+        results["config"] = _config_results(project_path, scanned)
+    return results
+
+
+# ============================================================================
+#  INCREMENTAL SCANNING
+# ============================================================================
+
+class FindingsCache:
+    """
+    Per-file raw findings persisted between runs, keyed by relative path and
+    content hash. The whole cache is dropped when PATTERN_VERSION changes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries = {}
+        self.stats = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == PATTERN_VERSION:
+                self.entries = data.get("files", {})
+        except (OSError, ValueError, AttributeError):
+            pass  # missing or corrupt cache: start empty
+
+    @classmethod
+    def for_project(cls, project_path: str) -> "FindingsCache":
+        key = hashlib.sha1(os.path.abspath(project_path).encode("utf-8")).hexdigest()[:16]
+        return cls(CACHE_DIR / f"{key}.json")
+
+    def lookup(self, rel_path: str, scanners: Tuple[str, ...]):
+        """Cached entry for a file if it covers all the requested scanners."""
+        entry = self.entries.get(rel_path)
+        if entry is not None and all(name in entry["found"] for name in scanners):
+            return entry
+        return None
+
+    @staticmethod
+    def _stat(path: str) -> list:
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_size]
+
+    def stat_matches(self, entry: dict, path: str) -> bool:
+        try:
+            return entry.get("stat") == self._stat(path)
+        except OSError:
+            return False
+
+    def store(self, rel_path: str, path: str, digest: str, found: Dict[str, list]):
+        entry = self.entries.get(rel_path)
+        merged = dict(entry["found"]) if entry and entry["hash"] == digest else {}
+        merged.update(found)
+        try:
+            stat = self._stat(path)
+        except OSError:
+            stat = None
+        self.entries[rel_path] = {"hash": digest, "stat": stat, "found": merged}
+
+    def save(self, keep_unvisited: bool, visited: set):
+        """Write the cache atomically; entries of deleted files are dropped on full scans."""
+        if not keep_unvisited:
+            self.entries = {rel: entry for rel, entry in self.entries.items() if rel in visited}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({"version": PATTERN_VERSION, "files": self.entries}, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # caching is best effort; the scan result is still valid
+
+
+def changed_files(project_path: str, ref: str) -> set:
+    """
+    Relative paths (under project_path) changed since a git ref: committed,
+    staged and unstaged changes plus untracked files. Raises RuntimeError when
+    git cannot answer (not a repository, unknown ref).
+    """
+    commands = [
+        ["git", "diff", "--name-only", "-z", "--relative", ref, "--"],
+        ["git", "ls-files", "-z", "--others", "--exclude-standard"],
+    ]
+    changed = set()
+    for cmd in commands:
+        try:
+            result = subprocess.run(cmd, cwd=project_path, capture_output=True, text=True, timeout=60)
+        except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+            raise RuntimeError(f"git unavailable: {e}")
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"{' '.join(cmd)} failed")
+        changed.update(str(Path(name)) for name in result.stdout.split("\0") if name)
+    return changed
 
 
 # ============================================================================
@@ -178,11 +594,7 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
-    """
-    Validate no hardcoded secrets (OWASP A04).
-    Checks: API keys, tokens, passwords, cloud credentials.
-    """
+def _secret_results(scanned: list) -> Dict[str, Any]:
     results = {
         "tool": "secret_scanner",
         "findings": [],
@@ -190,36 +602,20 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
         "scanned_files": 0,
         "by_severity": {"critical": 0, "high": 0, "medium": 0}
     }
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-                            
-            except Exception:
-                pass
-    
+
+    for rel_path, scanners, found in scanned:
+        if "secrets" not in scanners:
+            continue
+        results["scanned_files"] += 1
+        for secret_type, severity, count in found["secrets"]:
+            results["findings"].append({
+                "file": rel_path,
+                "type": secret_type,
+                "severity": severity,
+                "count": count
+            })
+            results["by_severity"][severity] += count
+
     if results["by_severity"]["critical"] > 0:
         results["status"] = "[!!] CRITICAL: Secrets exposed!"
     elif results["by_severity"]["high"] > 0:
@@ -233,11 +629,15 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+def scan_secrets(project_path: str, workers: int = None) -> Dict[str, Any]:
     """
-    Validate dangerous code patterns (OWASP A05).
-    Checks: Injection risks, XSS, unsafe deserialization.
+    Validate no hardcoded secrets (OWASP A04).
+    Checks: API keys, tokens, passwords, cloud credentials.
     """
+    return scan_files(project_path, ("secrets",), workers)["secrets"]
+
+
+def _pattern_results(scanned: list) -> Dict[str, Any]:
     results = {
         "tool": "pattern_scanner",
         "findings": [],
@@ -245,37 +645,21 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
         "scanned_files": 0,
         "by_category": {}
     }
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-                                
-            except Exception:
-                pass
+
+    for rel_path, scanners, found in scanned:
+        if "patterns" not in scanners:
+            continue
+        results["scanned_files"] += 1
+        for line_num, name, severity, category, snippet in found["patterns"]:
+            results["findings"].append({
+                "file": rel_path,
+                "line": line_num,
+                "pattern": name,
+                "severity": severity,
+                "category": category,
+                "snippet": snippet
+            })
+            results["by_category"][category] = results["by_category"].get(category, 0) + 1
     
     critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
     high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
@@ -293,52 +677,31 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+def scan_code_patterns(project_path: str, workers: int = None) -> Dict[str, Any]:
     """
-    Validate security configuration (OWASP A02).
-    Checks: Security headers, CORS, debug modes.
+    Validate dangerous code patterns (OWASP A05).
+    Checks: Injection risks, XSS, unsafe deserialization.
     """
+    return scan_files(project_path, ("patterns",), workers)["patterns"]
+
+
+def _config_results(project_path: str, scanned: list) -> Dict[str, Any]:
     results = {
         "tool": "config_scanner",
         "findings": [],
         "status": "[OK] Configuration secure",
         "checks": {}
     }
-    
-    # Check common config files for issues
-    config_issues = [
-        (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-        (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-        (r'NODE_ENV.*development', "Development mode in config", "medium"),
-        (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-        (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-        (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
-    ]
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-                
-            filepath = Path(root) / file
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
-            except Exception:
-                pass
+
+    for rel_path, scanners, found in scanned:
+        if "config" not in scanners:
+            continue
+        for issue, severity in found["config"]:
+            results["findings"].append({
+                "file": rel_path,
+                "issue": issue,
+                "severity": severity
+            })
     
     # Check for security header configurations
     header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
@@ -365,12 +728,27 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
     return results
 
 
+def scan_configuration(project_path: str, workers: int = None) -> Dict[str, Any]:
+    """
+    Validate security configuration (OWASP A02).
+    Checks: Security headers, CORS, debug modes.
+    """
+    return scan_files(project_path, ("config",), workers)["config"]
+
+
 # ============================================================================
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
-    """Execute security validation scans."""
+def run_full_scan(project_path: str, scan_type: str = "all", workers: int = None,
+                  use_cache: bool = True, changed_since: str = None) -> Dict[str, Any]:
+    """
+    Execute security validation scans (file scanners share one parallel pass).
+
+    use_cache reuses per-file findings from earlier runs; changed_since (a git
+    ref) always rescans files git reports as changed and stat-checks the rest
+    against the cache, so files git ignores are never skipped.
+    """
     
     report = {
         "project": project_path,
@@ -386,26 +764,40 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     }
     
     scanners = {
-        "deps": ("dependencies", scan_dependencies),
-        "secrets": ("secrets", scan_secrets),
-        "patterns": ("code_patterns", scan_code_patterns),
-        "config": ("configuration", scan_configuration),
+        "deps": "dependencies",
+        "secrets": "secrets",
+        "patterns": "code_patterns",
+        "config": "configuration",
     }
-    
-    for key, (name, scanner) in scanners.items():
-        if scan_type == "all" or scan_type == key:
-            result = scanner(project_path)
-            report["scans"][name] = result
-            
-            findings_count = len(result.get("findings", []))
-            report["summary"]["total_findings"] += findings_count
-            
-            for finding in result.get("findings", []):
-                sev = finding.get("severity", "low")
-                if sev == "critical":
-                    report["summary"]["critical"] += 1
-                elif sev == "high":
-                    report["summary"]["high"] += 1
+    selected = [key for key in scanners if scan_type == "all" or scan_type == key]
+    file_scanners = tuple(key for key in selected if key in FILE_SCANNERS)
+    cache = FindingsCache.for_project(project_path) if use_cache or changed_since else None
+    changed = None
+    if changed_since and file_scanners:
+        try:
+            changed = changed_files(project_path, changed_since)
+        except RuntimeError as e:
+            report["incremental"] = {"changed_since": changed_since, "error": str(e)}
+    file_results = scan_files(project_path, file_scanners, workers, cache, changed) if file_scanners else {}
+    if cache is not None and cache.stats:
+        report.setdefault("incremental", {}).update(cache.stats)
+        if changed is not None:
+            report["incremental"].update(changed_since=changed_since, changed=len(changed))
+    
+    for key in selected:
+        name = scanners[key]
+        result = scan_dependencies(project_path) if key == "deps" else file_results[key]
+        report["scans"][name] = result
+        
+        findings_count = len(result.get("findings", []))
+        report["summary"]["total_findings"] += findings_count
+        
+        for finding in result.get("findings", []):
+            sev = finding.get("severity", "low")
+            if sev == "critical":
+                report["summary"]["critical"] += 1
+            elif sev == "high":
+                report["summary"]["high"] += 1
     
     # Determine overall status
     if report["summary"]["critical"] > 0:
@@ -427,14 +819,23 @@ def main():
                         default="all", help="Type of scan to run")
     parser.add_argument("--output", choices=["json", "summary"], default="json",
                         help="Output format")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processes for file scanning (default: all cores, 1 = no pool)")
+    parser.add_argument("--changed-since", metavar="REF", default=None,
+                        help="Always rescan files changed since this git ref; unchanged files are stat-checked")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Scan every file from scratch and leave the findings cache untouched")
     
     args = parser.parse_args()
+    if args.changed_since and args.no_cache:
+        parser.error("--changed-since relies on the findings cache; drop --no-cache")
     
     if not os.path.isdir(args.project_path):
         print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
         sys.exit(1)
     
-    result = run_full_scan(args.project_path, args.scan_type)
+    result = run_full_scan(args.project_path, args.scan_type, args.workers,
+                           use_cache=not args.no_cache, changed_since=args.changed_since)
     
     if args.output == "summary":
         print(f"\n{'='*60}")